@@ -1,25 +1,70 @@
-"""Public package interface for the Sintrix Sourcer toolkit."""
-
-from .estimator import EstimationEngine, MarketNotFoundError
-from .models import (
-    AssignmentStrategy,
-    CompRecord,
-    DealConfig,
-    DealEstimate,
-    NegotiationScript,
-    OfferBand,
-    PipelineRecord,
-    PropertyInsight,
-    RepairLineItem,
-    SubjectProperty,
-)
-from .pipeline import PipelineStore
+"""Public package interface for the Sintrix Sourcer toolkit.
+
+Names are imported from their submodules on first access (PEP 562), so
+``import sintrix_wholesale_estimator`` stays cheap for the CLI entry point.
+"""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .cache import EstimateCache
+    from .estimator import EstimationEngine, MarketNotFoundError
+    from .models import (
+        AssignmentStrategy,
+        CompRecord,
+        DealConfig,
+        DealEstimate,
+        NegotiationScript,
+        OfferBand,
+        PipelineRecord,
+        PropertyInsight,
+        RepairLineItem,
+        SubjectProperty,
+    )
+    from .pipeline import BasePipelineStore, PipelineStore, SqlitePipelineStore
+
+_EXPORTS = {
+    "AssignmentStrategy": ".models",
+    "BasePipelineStore": ".pipeline",
+    "CompRecord": ".models",
+    "DealConfig": ".models",
+    "DealEstimate": ".models",
+    "EstimateCache": ".cache",
+    "EstimationEngine": ".estimator",
+    "MarketNotFoundError": ".estimator",
+    "NegotiationScript": ".models",
+    "OfferBand": ".models",
+    "PipelineRecord": ".models",
+    "PipelineStore": ".pipeline",
+    "PropertyInsight": ".models",
+    "RepairLineItem": ".models",
+    "SqlitePipelineStore": ".pipeline",
+    "SubjectProperty": ".models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "AssignmentStrategy",
+    "BasePipelineStore",
     "CompRecord",
     "DealConfig",
     "DealEstimate",
+    "EstimateCache",
     "EstimationEngine",
     "MarketNotFoundError",
     "NegotiationScript",
@@ -28,5 +73,6 @@ __all__ = [
     "PipelineStore",
     "PropertyInsight",
     "RepairLineItem",
+    "SqlitePipelineStore",
     "SubjectProperty",
 ]
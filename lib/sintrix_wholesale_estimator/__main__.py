@@ -1,6 +1,6 @@
 """Module entry point for `python -m sintrix_wholesale_estimator`."""
-from .cli import run
+from .cli import main
 
 
 if __name__ == "__main__":  # pragma: no cover - module entry point
-    run()
+    main()
@@ -0,0 +1,175 @@
+"""Streaming batch estimation over CSV or JSON-lines lead files."""
+from __future__ import annotations
+
+import csv
+import json
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, fields
+from itertools import islice
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+from .estimator import EstimationEngine
+from .models import DealConfig, SubjectProperty
+
+CHUNK_SIZE = 64
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+_FLOAT_FIELDS = {"square_feet", "beds", "baths", "lot_square_feet"}
+_INT_FIELDS = {"year_built"}
+_STR_FIELDS = {"address", "city", "state", "postal_code", "condition", "property_type", "listing_url"}
+_SUBJECT_FIELDS = {field.name for field in fields(SubjectProperty)}
+
+Row = Tuple[int, Dict[str, Any]]
+
+_worker_engine: Optional[EstimationEngine] = None
+_worker_config: Optional[DealConfig] = None
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    rows: int
+    errors: int
+
+
+def read_rows(path: Path) -> Iterator[Row]:
+    """Yield ``(row_number, fields)`` from a CSV file or, for ``.jsonl``/``.ndjson``, JSON lines.
+
+    Row numbers start at 1 and count data rows, not the CSV header. A JSON
+    line that is not a JSON object is yielded with an ``_error`` field.
+    """
+
+    with Path(path).open(newline="") as handle:
+        if Path(path).suffix in JSONL_SUFFIXES:
+            for number, line in enumerate(filter(str.strip, handle), start=1):
+                try:
+                    row = json.loads(line)
+                except ValueError as exc:
+                    row = {"_error": f"Invalid JSON: {exc}"}
+                if not isinstance(row, dict):
+                    row = {"_error": "Expected a JSON object"}
+                yield number, row
+        else:
+            yield from enumerate(csv.DictReader(handle), start=1)
+
+
+def subject_from_row(row: Dict[str, Any]) -> SubjectProperty:
+    """Build a subject from a lead row; blank cells use the model defaults and extra columns are ignored.
+
+    Values are coerced to the field types, so JSON leads with numeric ZIPs or
+    conditions still work; values that cannot be coerced raise ``ValueError``.
+    """
+
+    values: Dict[str, Any] = {}
+    for key, value in row.items():
+        if key not in _SUBJECT_FIELDS or value is None or value == "":
+            continue
+        if key in _FLOAT_FIELDS:
+            value = float(value)
+        elif key in _INT_FIELDS:
+            value = int(value)
+        elif key in _STR_FIELDS:
+            if isinstance(value, (dict, list)):
+                raise ValueError(f"{key} must be a string, got {type(value).__name__}")
+            value = str(value)
+        values[key] = value
+    return SubjectProperty(**values)
+
+
+def estimate_row(engine: EstimationEngine, config: DealConfig, number: int, row: Dict[str, Any]) -> Tuple[bool, str]:
+    """``(ok, line)`` for a lead row; ``line`` is JSON holding its estimate or the error that stopped it.
+
+    Any exception raised for the row is reported on its line, so one bad
+    lead never stops the batch or the worker pool.
+    """
+
+    try:
+        if "_error" in row:
+            raise ValueError(row["_error"])
+        estimate = engine.estimate(subject_from_row(row), config).estimate
+    except Exception as exc:  # noqa: BLE001 - every failure is reported per row
+        return False, json.dumps({"row": number, "error": str(exc)})
+    return True, json.dumps({"row": number, "estimate": estimate.to_dict()})
+
+
+def _init_worker(snapshot: Optional[Path], config: DealConfig) -> None:
+    global _worker_engine, _worker_config
+    engine = EstimationEngine.from_snapshot(snapshot) if snapshot else EstimationEngine()
+    _worker_engine, _worker_config = engine.warm(), config
+
+
+def _estimate_chunk(chunk: List[Row]) -> List[Tuple[bool, str]]:
+    assert _worker_engine is not None and _worker_config is not None
+    return [estimate_row(_worker_engine, _worker_config, number, row) for number, row in chunk]
+
+
+def _chunks(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _pooled_lines(
+    rows: Iterable[Row],
+    config: DealConfig,
+    snapshot: Optional[Path],
+    workers: int,
+    ordered: bool,
+) -> Iterator[Tuple[bool, str]]:
+    window = workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(snapshot, config)) as executor:
+        if ordered:
+            queue: Deque[Future] = deque()
+            for chunk in _chunks(rows, CHUNK_SIZE):
+                queue.append(executor.submit(_estimate_chunk, chunk))
+                if len(queue) >= window:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+            return
+        pending: Set[Future] = set()
+        for chunk in _chunks(rows, CHUNK_SIZE):
+            pending.add(executor.submit(_estimate_chunk, chunk))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        for future in wait(pending).done:
+            yield from future.result()
+
+
+def run_batch(
+    rows: Iterable[Row],
+    output: TextIO,
+    config: DealConfig,
+    *,
+    engine: Optional[EstimationEngine] = None,
+    snapshot: Optional[Path] = None,
+    workers: int = 1,
+    ordered: bool = True,
+) -> BatchSummary:
+    """Estimate every row and write one JSON line per row to ``output``.
+
+    With ``workers`` above 1, rows are sent in chunks to a process pool whose
+    workers each hold an engine (built from ``snapshot`` when given); at most
+    two chunks per worker are in flight, so memory stays flat however long
+    the input is. ``ordered=False`` writes chunks as they finish.
+    """
+
+    if workers > 1:
+        lines = _pooled_lines(rows, config, snapshot, workers, ordered)
+    else:
+        if engine is None:
+            engine = EstimationEngine.from_snapshot(snapshot) if snapshot else EstimationEngine()
+        lines = (estimate_row(engine, config, number, row) for number, row in rows)
+
+    count = errors = 0
+    for ok, line in lines:
+        output.write(line + "\n")
+        count += 1
+        errors += not ok
+    return BatchSummary(rows=count, errors=errors)
+
+
+__all__ = ["BatchSummary", "estimate_row", "read_rows", "run_batch", "subject_from_row"]
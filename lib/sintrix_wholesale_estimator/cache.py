@@ -0,0 +1,132 @@
+"""Result caching for repeated estimates."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from .models import DealConfig, SubjectProperty
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def estimate_key(
+    subject: SubjectProperty,
+    config: DealConfig,
+    data_version: Hashable,
+    *context: Hashable,
+) -> Tuple:
+    """Flat cache key for one estimate.
+
+    ``context`` carries inputs from outside the subject and config that change
+    the result, such as the as-of date for recency-filtered comps.
+    """
+
+    strategy = config.strategy
+    return (
+        subject.address,
+        subject.city,
+        subject.state,
+        subject.postal_code,
+        subject.square_feet,
+        subject.beds,
+        subject.baths,
+        subject.year_built,
+        subject.lot_square_feet,
+        subject.condition,
+        subject.property_type,
+        subject.listing_url,
+        strategy.factor,
+        strategy.assignment_fee,
+        strategy.fee_floor,
+        strategy.fee_ceiling,
+        config.risk_profile,
+        config.repair_override,
+        config.closing_cost_rate,
+        config.holding_months,
+        config.assignment_fee_override,
+        config.include_pdf,
+        config.comp_limit,
+        config.comp_radius_miles,
+        config.comp_recency_days,
+        config.insight_only,
+        data_version,
+        *context,
+    )
+
+
+class EstimateCache(Generic[V]):
+    """Size-bounded LRU cache with an optional time-to-live.
+
+    Entries older than ``ttl`` seconds are treated as misses. Thread-safe, so
+    one cache can sit in front of an engine shared by several workers.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and self._clock() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+
+__all__ = ["CacheInfo", "EstimateCache", "estimate_key"]
@@ -0,0 +1,234 @@
+"""Command line interface for the Sourcer estimator."""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+from .models import AssignmentStrategy, DealConfig, SubjectProperty
+
+# The estimator, pipeline, and server modules are imported where they are
+# used so that `--help`, `compile-data`, and a plain estimate without
+# --save/--webhook do not pay for I/O machinery they never touch.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .batch import BatchSummary
+    from .estimator import EstimationArtifacts, EstimationEngine
+
+
+def _add_deal_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--factor", type=float, default=0.65, help="MAO factor (clamped to 0.55-0.75)")
+    parser.add_argument("--assignment-fee", type=float, default=10000.0)
+    parser.add_argument("--risk", choices=("aggressive", "balanced", "conservative"), default="balanced")
+    parser.add_argument("--repair-override", type=float)
+    parser.add_argument("--comps", type=int, dest="comp_limit", help="Use only the K most similar comps")
+    parser.add_argument("--comp-radius", type=float, help="Maximum comp distance in miles")
+    parser.add_argument("--comp-recency-days", type=int, help="Only use comps sold within this many days")
+    parser.add_argument(
+        "--insight-only",
+        action="store_true",
+        help="Only compute numbers and offer bands; skip scripts, citations, and collateral",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sintrix",
+        description="Estimate wholesale offers, comps, and repair budgets for a subject property.",
+    )
+    parser.add_argument("address", help="Street address of the subject property")
+    parser.add_argument("city")
+    parser.add_argument("state")
+    parser.add_argument("postal_code")
+    parser.add_argument("square_feet", type=float)
+    parser.add_argument("beds", type=float)
+    parser.add_argument("baths", type=float)
+    parser.add_argument("--year-built", type=int)
+    parser.add_argument("--lot-sqft", type=float)
+    parser.add_argument("--condition", default="light_rehab")
+    parser.add_argument("--property-type", default="single_family")
+    parser.add_argument("--listing-url")
+    _add_deal_options(parser)
+    parser.add_argument("--no-pdf", action="store_true", help="Skip PDF packet generation")
+    parser.add_argument("--as-json", action="store_true", help="Print the estimate as JSON")
+    parser.add_argument("--save", action="store_true", help="Save the deal to the local pipeline")
+    parser.add_argument("--tags", nargs="*", default=())
+    parser.add_argument("--pipeline-path", type=Path, help="Pipeline file; a .db/.sqlite/.sqlite3 path uses SQLite")
+    parser.add_argument("--webhook", help="POST the estimate to a CRM webhook URL")
+    parser.add_argument("--snapshot", type=Path, help="Load reference data from a compile-data snapshot")
+    return parser
+
+
+def _subject_from_args(args: argparse.Namespace) -> SubjectProperty:
+    return SubjectProperty(
+        address=args.address,
+        city=args.city,
+        state=args.state,
+        postal_code=args.postal_code,
+        square_feet=args.square_feet,
+        beds=args.beds,
+        baths=args.baths,
+        year_built=args.year_built,
+        lot_square_feet=args.lot_sqft,
+        condition=args.condition,
+        property_type=args.property_type,
+        listing_url=args.listing_url,
+    )
+
+
+def _config_from_args(args: argparse.Namespace) -> DealConfig:
+    return DealConfig(
+        strategy=AssignmentStrategy(factor=args.factor, assignment_fee=args.assignment_fee),
+        risk_profile=args.risk,
+        repair_override=args.repair_override,
+        comp_limit=args.comp_limit,
+        comp_radius_miles=args.comp_radius,
+        comp_recency_days=args.comp_recency_days,
+        include_pdf=not args.no_pdf,
+        insight_only=args.insight_only,
+    )
+
+
+def build_compile_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sintrix compile-data",
+        description="Compile the bundled reference tables into a memory-mappable binary snapshot.",
+    )
+    parser.add_argument("output", type=Path, help="Destination snapshot file")
+    return parser
+
+
+def run_compile_data(argv: Sequence[str]) -> Path:
+    from .snapshot import compile_snapshot
+
+    args = build_compile_parser().parse_args(argv)
+    destination = compile_snapshot(args.output)
+    print(f"Snapshot written: {destination} ({destination.stat().st_size:,} bytes)")
+    return destination
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sintrix serve",
+        description="Serve estimates as JSON over HTTP from one warm engine (POST /estimate, GET /health).",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", type=Path, help="Listen on a Unix domain socket instead of TCP")
+    parser.add_argument("--snapshot", type=Path, help="Load reference data from a compile-data snapshot")
+    parser.add_argument("--cache-size", type=int, default=1024, help="Estimate result cache entries (0 disables)")
+    return parser
+
+
+def _engine(snapshot: Path | None) -> "EstimationEngine":
+    from .estimator import EstimationEngine
+
+    return EstimationEngine.from_snapshot(snapshot) if snapshot else EstimationEngine()
+
+
+def run_serve(argv: Sequence[str]) -> None:
+    from .cache import EstimateCache
+    from .server import make_server
+
+    args = build_serve_parser().parse_args(argv)
+    engine = _engine(args.snapshot)
+    if args.cache_size > 0:
+        engine.cache = EstimateCache(maxsize=args.cache_size)
+    server = make_server(engine, args.host, args.port, args.unix_socket)
+    print(f"Serving estimates on {args.unix_socket or f'http://{args.host}:{server.server_address[1]}'}", flush=True)
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def build_batch_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sintrix batch",
+        description="Estimate every lead in a CSV or JSON-lines file and stream one JSON result per line.",
+    )
+    parser.add_argument("--input", type=Path, required=True, help="Leads file (.csv, or .jsonl/.ndjson)")
+    parser.add_argument("--output", default="-", help="Results file (JSON lines); '-' writes to stdout")
+    parser.add_argument("--workers", type=int, default=1, help="Estimate in N worker processes")
+    parser.add_argument("--unordered", action="store_true", help="Write results as they finish, not in input order")
+    parser.add_argument("--snapshot", type=Path, help="Load reference data from a compile-data snapshot")
+    _add_deal_options(parser)
+    parser.set_defaults(no_pdf=True)
+    return parser
+
+
+def run_batch(argv: Sequence[str]) -> "BatchSummary":
+    from .batch import read_rows, run_batch as estimate_rows
+
+    parser = build_batch_parser()
+    args = parser.parse_args(argv)
+    if not args.input.exists():
+        parser.error(f"Input file not found: {args.input}")
+    options = dict(snapshot=args.snapshot, workers=args.workers, ordered=not args.unordered)
+    if args.output == "-":
+        summary = estimate_rows(read_rows(args.input), sys.stdout, _config_from_args(args), **options)
+        destination = "stdout"
+    else:
+        with open(args.output, "w") as handle:
+            summary = estimate_rows(read_rows(args.input), handle, _config_from_args(args), **options)
+        destination = args.output
+    print(f"Estimated {summary.rows} rows ({summary.errors} errors) to {destination}", file=sys.stderr)
+    return summary
+
+
+COMMANDS = {
+    "batch": run_batch,
+    "compile-data": run_compile_data,
+    "serve": run_serve,
+}
+
+
+def main(argv: Sequence[str] | None = None) -> object:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] in COMMANDS:
+        return COMMANDS[argv[0]](argv[1:])
+    return run(argv)
+
+
+def run(argv: Sequence[str] | None = None) -> "EstimationArtifacts":
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    from .estimator import MarketNotFoundError
+
+    engine = _engine(args.snapshot)
+    try:
+        artifacts = engine.estimate(_subject_from_args(args), _config_from_args(args))
+    except MarketNotFoundError as exc:
+        parser.error(str(exc))
+
+    if args.as_json:
+        print(artifacts.estimate.to_json(indent=2))
+    else:
+        print(artifacts.text_summary)
+        if artifacts.pdf_path:
+            print(f"\nPDF packet: {artifacts.pdf_path}")
+
+    if args.save or args.webhook:
+        from .pipeline import open_pipeline
+
+        with open_pipeline(args.pipeline_path) as store:
+            if args.save:
+                store.save(artifacts.estimate, tags=args.tags)
+            if args.webhook:
+                try:
+                    result = store.deliver_webhooks([artifacts.estimate], args.webhook)
+                except ValueError as exc:
+                    parser.error(str(exc))
+                if result.delivered:
+                    print(f"Webhook delivered ({result.statuses[0]})")
+                elif result.dead_lettered:
+                    print(f"Webhook rejected: {result.errors[0]} (saved in {store.dead_letter_path})")
+                else:
+                    print(f"Webhook failed: {result.errors[0]} (queued in {store.outbox_path})")
+
+    return artifacts
+
+
+__all__ = ["COMMANDS", "build_parser", "main", "run"]
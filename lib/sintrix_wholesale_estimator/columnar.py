@@ -0,0 +1,356 @@
+"""Columnar (NumPy) evaluation of the MAO core for large subject batches."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from statistics import mean
+from typing import Iterator, Sequence, Tuple
+
+try:  # pragma: no cover - exercised implicitly when numpy is installed
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .comps import BATHROOM_VALUE, BEDROOM_VALUE, CONDITION_PREMIUMS, SIZE_WEIGHT
+from .data import CompRecordSeed, MarketProfile, ZipCostProfile
+from .models import DealConfig, PropertyInsight, SubjectProperty
+from .repairs import CONDITION_MULTIPLIERS, rate_card
+
+CONDITION_CODES: Tuple[str, ...] = tuple(CONDITION_MULTIPLIERS)
+UNKNOWN_CONDITION = len(CONDITION_CODES)
+
+# Upper bound on rows x comps in one temporary adjustment array (8 MiB of
+# float64); larger market/ZIP groups are evaluated a chunk of rows at a time.
+MAX_BLOCK_CELLS = 1 << 20
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("Columnar estimation requires numpy. Install it with `pip install numpy`.")
+
+
+def condition_code(condition: str) -> int:
+    try:
+        return CONDITION_CODES.index(condition)
+    except ValueError:
+        return UNKNOWN_CONDITION
+
+
+@dataclass(slots=True)
+class SubjectColumns:
+    """Subjects stored as parallel arrays.
+
+    ``market`` and ``postal`` index into ``market_keys`` and ``postal_codes``;
+    ``condition`` holds codes from :data:`CONDITION_CODES` and a missing lot
+    size is ``nan``.
+    """
+
+    square_feet: "np.ndarray"
+    beds: "np.ndarray"
+    baths: "np.ndarray"
+    condition: "np.ndarray"
+    market: "np.ndarray"
+    postal: "np.ndarray"
+    lot_square_feet: "np.ndarray"
+    market_keys: Tuple[str, ...]
+    postal_codes: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.square_feet)
+
+    @classmethod
+    def from_subjects(cls, subjects: Sequence[SubjectProperty]) -> "SubjectColumns":
+        _require_numpy()
+        market_index: dict[str, int] = {}
+        postal_index: dict[str, int] = {}
+        market = [market_index.setdefault(subject.market_key, len(market_index)) for subject in subjects]
+        postal = [postal_index.setdefault(subject.postal_code, len(postal_index)) for subject in subjects]
+        return cls(
+            square_feet=np.array([subject.square_feet for subject in subjects], dtype=float),
+            beds=np.array([subject.beds for subject in subjects], dtype=float),
+            baths=np.array([subject.baths for subject in subjects], dtype=float),
+            condition=np.array([condition_code(subject.condition) for subject in subjects], dtype=np.int8),
+            market=np.array(market, dtype=np.int32),
+            postal=np.array(postal, dtype=np.int32),
+            lot_square_feet=np.array(
+                [subject.lot_square_feet or np.nan for subject in subjects],
+                dtype=float,
+            ),
+            market_keys=tuple(market_index),
+            postal_codes=tuple(postal_index),
+        )
+
+
+@dataclass(slots=True)
+class InsightColumns:
+    """``PropertyInsight`` fields for a batch of subjects, one array per field.
+
+    Rows whose market or ZIP could not be resolved are ``nan`` in every field
+    and ``False`` in ``valid``.
+    """
+
+    arv: "np.ndarray"
+    as_is: "np.ndarray"
+    repair_budget: "np.ndarray"
+    closing_costs: "np.ndarray"
+    holding_costs: "np.ndarray"
+    assignment_fee: "np.ndarray"
+    mao: "np.ndarray"
+    projected_profit: "np.ndarray"
+    demand_score: "np.ndarray"
+    valid: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.arv)
+
+    @classmethod
+    def empty(cls, size: int) -> "InsightColumns":
+        _require_numpy()
+        return cls(*(np.full(size, np.nan) for _ in range(9)), valid=np.zeros(size, dtype=bool))
+
+    def insights(self) -> list[PropertyInsight]:
+        """One ``PropertyInsight`` per row, converting each column once."""
+
+        return [
+            PropertyInsight(*row)
+            for row in zip(
+                self.arv.tolist(),
+                self.as_is.tolist(),
+                self.repair_budget.tolist(),
+                self.closing_costs.tolist(),
+                self.holding_costs.tolist(),
+                self.assignment_fee.tolist(),
+                self.mao.tolist(),
+                self.projected_profit.tolist(),
+                self.demand_score.tolist(),
+            )
+        ]
+
+    def insight(self, index: int) -> PropertyInsight:
+        return PropertyInsight(
+            arv=float(self.arv[index]),
+            as_is=float(self.as_is[index]),
+            repair_budget=float(self.repair_budget[index]),
+            closing_costs=float(self.closing_costs[index]),
+            holding_costs=float(self.holding_costs[index]),
+            assignment_fee=float(self.assignment_fee[index]),
+            mao=float(self.mao[index]),
+            projected_profit=float(self.projected_profit[index]),
+            demand_score=float(self.demand_score[index]),
+        )
+
+
+def _near_half_cent(values: "np.ndarray") -> "np.ndarray":
+    scaled = values * 100.0
+    return np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+
+
+def round_cents(values: "np.ndarray") -> "np.ndarray":
+    """Round to cents exactly like the builtin ``round(value, 2)``.
+
+    ``np.round`` scales by 100 before rounding, which can land on the wrong
+    side of a half cent; the few values that sit on that boundary are
+    re-rounded with the builtin so the scalar and columnar paths agree.
+    """
+
+    values = np.asarray(values, dtype=float)
+    rounded = np.rint(values * 100.0) / 100.0
+    ambiguous = _near_half_cent(values)
+    if ambiguous.any():
+        rounded[ambiguous] = [round(float(value), 2) for value in values[ambiguous]]
+    return rounded
+
+
+def group_rows(columns: SubjectColumns) -> Iterator[Tuple[str, str, "np.ndarray"]]:
+    """Yield ``(market_key, postal_code, rows)`` for each market/ZIP group in ``columns``."""
+
+    postal_count = len(columns.postal_codes)
+    keys = columns.market.astype(np.int64) * postal_count + columns.postal
+    groups, inverse = np.unique(keys, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.searchsorted(inverse[order], np.arange(len(groups) + 1))
+    for position, key in enumerate(groups.tolist()):
+        market, postal = divmod(key, postal_count)
+        yield columns.market_keys[market], columns.postal_codes[postal], order[bounds[position] : bounds[position + 1]]
+
+
+def _condition_table(mapping, default: float) -> "np.ndarray":
+    return np.array([mapping.get(code, default) for code in CONDITION_CODES] + [default])
+
+
+def _seed_columns(seeds: Sequence[CompRecordSeed]) -> Tuple["np.ndarray", ...]:
+    prices = np.array([seed.sold_price for seed in seeds], dtype=float)
+    seed_sqft = np.array([seed.square_feet for seed in seeds], dtype=float)
+    seed_beds = np.array([seed.beds for seed in seeds], dtype=float)
+    seed_baths = np.array([seed.baths for seed in seeds], dtype=float)
+    price_per_sqft = np.divide(prices, seed_sqft, out=np.zeros_like(prices), where=seed_sqft != 0)
+    return prices, seed_sqft, seed_beds, seed_baths, price_per_sqft
+
+
+def _adjusted_prices(
+    square_feet: "np.ndarray",
+    beds: "np.ndarray",
+    baths: "np.ndarray",
+    condition: "np.ndarray",
+    seed_columns: Tuple["np.ndarray", ...],
+) -> "np.ndarray":
+    prices, seed_sqft, seed_beds, seed_baths, price_per_sqft = seed_columns
+
+    size = round_cents((square_feet[:, None] - seed_sqft[None, :]) * price_per_sqft * SIZE_WEIGHT)
+    bedrooms = round_cents((beds[:, None] - seed_beds[None, :]) * BEDROOM_VALUE)
+    bathrooms = round_cents((baths[:, None] - seed_baths[None, :]) * BATHROOM_VALUE)
+    premiums = _condition_table(CONDITION_PREMIUMS, 0.0)[condition]
+    condition_adj = round_cents(prices[None, :] * premiums[:, None])
+
+    return prices[None, :] + (((size + bedrooms) + bathrooms) + condition_adj)
+
+
+def _row_chunks(rows: "np.ndarray", comp_count: int) -> Iterator["np.ndarray"]:
+    step = max(1, MAX_BLOCK_CELLS // max(comp_count, 1))
+    for start in range(0, len(rows), step):
+        yield rows[start : start + step]
+
+
+def _repair_totals(
+    square_feet: "np.ndarray",
+    lot_square_feet: "np.ndarray",
+    condition: "np.ndarray",
+    market: MarketProfile,
+    zip_profile: ZipCostProfile,
+) -> "np.ndarray":
+    multiplier = _condition_table(CONDITION_MULTIPLIERS, 0.85)[condition]
+    lots = np.where(np.isnan(lot_square_feet) | (lot_square_feet == 0), square_feet * 1.2, lot_square_feet)
+    card = rate_card(market, zip_profile)
+    total = np.zeros_like(square_feet)
+    for trade_key, rate, surcharge in zip(card.trades, card.rates, card.surcharges):
+        quantity = lots / 500.0 if trade_key == "landscaping" else square_feet
+        total = total + round_cents((rate * quantity + surcharge) * multiplier)
+    return total
+
+
+def _mao_core(
+    arv_from_market: "np.ndarray",
+    arv_from_comps: "np.ndarray",
+    as_is_factor: "np.ndarray",
+    repair_total: "np.ndarray",
+    config: DealConfig,
+    factor: float,
+    market: MarketProfile,
+) -> Tuple["np.ndarray", ...]:
+    arv = (0.55 * arv_from_market) + (0.45 * arv_from_comps)
+    as_is = arv * as_is_factor
+
+    closing_rate = config.closing_cost_rate or market.closing_cost_rate
+    holding_months = config.holding_months or market.holding_months
+    holding_cost = as_is * market.holding_cost_rate * holding_months
+    closing_cost = arv * closing_rate
+
+    if config.assignment_fee_override:
+        assignment_fee = np.full_like(arv, config.assignment_fee_override)
+    else:
+        assignment_fee = np.maximum(
+            config.strategy.fee_floor,
+            np.minimum(
+                config.strategy.fee_ceiling or float("inf"),
+                np.maximum(config.strategy.assignment_fee, arv * market.wholesale_fee_rate),
+            ),
+        )
+
+    mao = np.maximum(0.0, (arv * factor) - repair_total - assignment_fee - closing_cost - holding_cost)
+    target_offer = round_cents(mao)
+    projected_profit = np.maximum(0.0, arv - (target_offer + repair_total + closing_cost + holding_cost + assignment_fee))
+    return arv, as_is, closing_cost, holding_cost, assignment_fee, mao, projected_profit
+
+
+def _offer_prices(mao: "np.ndarray", as_is: "np.ndarray") -> Tuple["np.ndarray", ...]:
+    buffer = np.maximum(5000.0, mao * 0.05)
+    safe_bump = np.maximum(6500.0, mao * 0.035)
+    aggressive = np.maximum(0.0, mao - buffer)
+    target = np.maximum(0.0, mao)
+    safe = np.minimum(as_is * 0.97, mao + safe_bump)
+    return aggressive, target, safe
+
+
+def offer_prices(mao: "np.ndarray", as_is: "np.ndarray") -> Tuple["np.ndarray", ...]:
+    """Aggressive, target, and safe offer prices in cents, as the engine's offer bands price them.
+
+    ``mao`` and ``as_is`` are the unrounded values returned by :func:`insight_block`.
+    """
+
+    return tuple(round_cents(prices) for prices in _offer_prices(mao, as_is))
+
+
+def insight_block(
+    columns: SubjectColumns,
+    rows: "np.ndarray",
+    config: DealConfig,
+    factor: float,
+    market: MarketProfile,
+    zip_profile: ZipCostProfile,
+    seeds: Sequence[CompRecordSeed],
+    out: InsightColumns,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Evaluate the MAO core for ``rows`` sharing one market/ZIP and write into ``out``.
+
+    Returns the unrounded ``(mao, as_is)`` for ``rows``, for :func:`offer_prices`.
+    """
+
+    square_feet = columns.square_feet[rows]
+    condition = columns.condition[rows]
+
+    beds = columns.beds[rows]
+    baths = columns.baths[rows]
+
+    arv_from_market = square_feet * market.price_per_sqft_turnkey * market.demand_index
+    seed_columns = None
+    if seeds:
+        seed_columns = _seed_columns(seeds)
+        arv_from_comps = np.empty_like(square_feet)
+        for part in _row_chunks(np.arange(len(rows)), len(seeds)):
+            arv_from_comps[part] = _adjusted_prices(
+                square_feet[part], beds[part], baths[part], condition[part], seed_columns
+            ).mean(axis=1)
+    else:
+        arv_from_comps = square_feet * market.price_per_sqft_turnkey
+    as_is_factor = _condition_table(market.condition_adjustment, 0.8)[condition]
+
+    if config.repair_override is not None:
+        repair_total = np.full_like(square_feet, config.repair_override)
+    else:
+        repair_total = _repair_totals(square_feet, columns.lot_square_feet[rows], condition, market, zip_profile)
+
+    values = _mao_core(arv_from_market, arv_from_comps, as_is_factor, repair_total, config, factor, market)
+    if seed_columns is not None:
+        # ``statistics.mean`` is exactly rounded while ``ndarray.mean`` can be an
+        # ulp off; rows that land on a half cent are redone with the scalar mean.
+        near = np.zeros(len(square_feet), dtype=bool)
+        for value in (*values, *_offer_prices(values[5], values[1])):
+            near |= _near_half_cent(value)
+        if near.any():
+            for part in _row_chunks(np.flatnonzero(near), len(seeds)):
+                adjusted = _adjusted_prices(square_feet[part], beds[part], baths[part], condition[part], seed_columns)
+                arv_from_comps[part] = [mean(prices) for prices in adjusted.tolist()]
+            values = _mao_core(arv_from_market, arv_from_comps, as_is_factor, repair_total, config, factor, market)
+    arv, as_is, closing_cost, holding_cost, assignment_fee, mao, projected_profit = values
+
+    out.arv[rows] = round_cents(arv)
+    out.as_is[rows] = round_cents(as_is)
+    out.repair_budget[rows] = round_cents(repair_total)
+    out.closing_costs[rows] = round_cents(closing_cost)
+    out.holding_costs[rows] = round_cents(holding_cost)
+    out.assignment_fee[rows] = round_cents(assignment_fee)
+    out.mao[rows] = round_cents(mao)
+    out.projected_profit[rows] = round_cents(projected_profit)
+    out.demand_score[rows] = round(market.demand_index, 2)
+    out.valid[rows] = True
+    return mao, as_is
+
+
+__all__ = [
+    "CONDITION_CODES",
+    "InsightColumns",
+    "SubjectColumns",
+    "condition_code",
+    "group_rows",
+    "offer_prices",
+    "round_cents",
+]
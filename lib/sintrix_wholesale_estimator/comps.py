@@ -0,0 +1,208 @@
+"""Comparable sale adjustment helpers."""
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from .data import CompRecordSeed
+from .models import CompAdjustment, CompRecord, SubjectProperty
+
+SIZE_WEIGHT = 0.35
+BEDROOM_VALUE = 7500.0
+BATHROOM_VALUE = 5000.0
+
+# Similarity scales for comp selection: one "unit" of mismatch each.
+SQFT_SCALE = 250.0
+BEDROOM_SCALE = 1.0
+BATHROOM_SCALE = 1.0
+DISTANCE_SCALE = 1.0
+RECENCY_SCALE = 180.0
+
+CONDITION_PREMIUMS: Dict[str, float] = {
+    "turnkey": 0.02,
+    "rent_ready": 0.01,
+    "light_rehab": 0.0,
+    "heavy_rehab": -0.01,
+    "tear_down": -0.02,
+}
+
+
+def _adjustments(subject: SubjectProperty, seed: CompRecordSeed) -> List[CompAdjustment]:
+    adjustments: List[CompAdjustment] = []
+
+    size_delta = subject.square_feet - seed.square_feet
+    if size_delta:
+        adjustments.append(CompAdjustment(label="Size", amount=round(size_delta * seed.price_per_sqft * SIZE_WEIGHT, 2)))
+
+    bed_delta = subject.beds - seed.beds
+    if bed_delta:
+        adjustments.append(CompAdjustment(label="Bedrooms", amount=round(bed_delta * BEDROOM_VALUE, 2)))
+
+    bath_delta = subject.baths - seed.baths
+    if bath_delta:
+        adjustments.append(CompAdjustment(label="Bathrooms", amount=round(bath_delta * BATHROOM_VALUE, 2)))
+
+    premium = CONDITION_PREMIUMS.get(subject.condition, 0.0)
+    if premium:
+        adjustments.append(CompAdjustment(label="Condition", amount=round(seed.sold_price * premium, 2)))
+
+    return adjustments
+
+
+class CompPool:
+    """Columnar comp pool: adjusted prices for every comp in one pass.
+
+    Produces the same values as summing each record's adjustments, without
+    allocating ``CompRecord`` or ``CompAdjustment`` objects; build records
+    with :func:`build_comps` only for the comps that are rendered.
+    """
+
+    def __init__(self, seeds: Iterable[CompRecordSeed]) -> None:
+        self.seeds: List[CompRecordSeed] = list(seeds)
+        self.sold_price: List[float] = [seed.sold_price for seed in self.seeds]
+        self.square_feet: List[float] = [seed.square_feet for seed in self.seeds]
+        self.beds: List[float] = [seed.beds for seed in self.seeds]
+        self.baths: List[float] = [seed.baths for seed in self.seeds]
+        self.price_per_sqft: List[float] = [seed.price_per_sqft for seed in self.seeds]
+
+    def __len__(self) -> int:
+        return len(self.seeds)
+
+    def adjusted_prices(self, subject: SubjectProperty) -> List[float]:
+        square_feet, beds, baths = subject.square_feet, subject.beds, subject.baths
+        premium = CONDITION_PREMIUMS.get(subject.condition, 0.0)
+        return [
+            price
+            + (
+                round((square_feet - comp_sqft) * price_per_sqft * SIZE_WEIGHT, 2)
+                + round((beds - comp_beds) * BEDROOM_VALUE, 2)
+                + round((baths - comp_baths) * BATHROOM_VALUE, 2)
+                + round(price * premium, 2)
+            )
+            for price, comp_sqft, price_per_sqft, comp_beds, comp_baths in zip(
+                self.sold_price, self.square_feet, self.price_per_sqft, self.beds, self.baths
+            )
+        ]
+
+
+class CompIndex:
+    """Per-market comp pool sorted by square footage for top-k selection.
+
+    Candidates are visited outward from the subject's size and scored by
+    size, bed/bath, distance, and sale-age similarity. Because the size term
+    alone is a lower bound on the score, the walk stops as soon as it cannot
+    beat the current k-th best comp, so most of a large pool is never read.
+    """
+
+    def __init__(self, seeds: Iterable[CompRecordSeed]) -> None:
+        self.seeds: List[CompRecordSeed] = sorted(seeds, key=lambda seed: seed.square_feet)
+        self.square_feet: List[float] = [seed.square_feet for seed in self.seeds]
+        self.newest = max((seed.sold_ordinal for seed in self.seeds), default=0)
+
+    def __len__(self) -> int:
+        return len(self.seeds)
+
+    def _score(self, subject: SubjectProperty, index: int) -> float:
+        seed = self.seeds[index]
+        return (
+            abs(subject.square_feet - seed.square_feet) / SQFT_SCALE
+            + abs(subject.beds - seed.beds) / BEDROOM_SCALE
+            + abs(subject.baths - seed.baths) / BATHROOM_SCALE
+            + seed.distance_miles / DISTANCE_SCALE
+            + (self.newest - seed.sold_ordinal) / RECENCY_SCALE
+        )
+
+    def _eligible(self, index: int, radius_miles: float | None, sold_after: date | None) -> bool:
+        if radius_miles is not None and self.seeds[index].distance_miles > radius_miles:
+            return False
+        if sold_after is not None and self.seeds[index].sold_on < sold_after:
+            return False
+        return True
+
+    def select(
+        self,
+        subject: SubjectProperty,
+        k: int | None = None,
+        radius_miles: float | None = None,
+        recency_days: int | None = None,
+        as_of: date | None = None,
+    ) -> List[CompRecordSeed]:
+        """Return the ``k`` best eligible comps, best first (all eligible comps when ``k`` is None)."""
+
+        sold_after = None
+        if recency_days is not None:
+            sold_after = date.fromordinal((as_of or date.today()).toordinal() - recency_days)
+
+        if k is None:
+            eligible = [index for index in range(len(self.seeds)) if self._eligible(index, radius_miles, sold_after)]
+            eligible.sort(key=lambda index: self._score(subject, index))
+            return [self.seeds[index] for index in eligible]
+        if k <= 0:
+            return []
+
+        best: List[Tuple[float, int]] = []  # max-heap of (-score, -index)
+        right = bisect_left(self.square_feet, subject.square_feet)
+        left = right - 1
+        while left >= 0 or right < len(self.seeds):
+            if right >= len(self.seeds) or (
+                left >= 0 and subject.square_feet - self.square_feet[left] <= self.square_feet[right] - subject.square_feet
+            ):
+                index, left = left, left - 1
+            else:
+                index, right = right, right + 1
+            bound = abs(subject.square_feet - self.square_feet[index]) / SQFT_SCALE
+            if len(best) == k and bound > -best[0][0]:
+                break
+            if not self._eligible(index, radius_miles, sold_after):
+                continue
+            entry = (-self._score(subject, index), -index)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+        return [self.seeds[-index] for _, index in sorted(best, reverse=True)]
+
+
+def _build_record(subject: SubjectProperty, seed: CompRecordSeed) -> CompRecord:
+    return CompRecord(
+        address=seed.address,
+        postal_code=seed.postal_code,
+        sold_price=seed.sold_price,
+        sold_date=seed.sold_on,
+        square_feet=seed.square_feet,
+        beds=seed.beds,
+        baths=seed.baths,
+        distance_miles=seed.distance_miles,
+        dom=seed.dom,
+        adjustments=_adjustments(subject, seed),
+    )
+
+
+def build_comps(
+    subject: SubjectProperty,
+    seeds: Iterable[CompRecordSeed] | CompIndex,
+    k: int | None = None,
+    radius_miles: float | None = None,
+    recency_days: int | None = None,
+    as_of: date | None = None,
+) -> List[CompRecord]:
+    """Adjust comps for ``subject``.
+
+    Without selection criteria every seed is used in pool order. With ``k``,
+    ``radius_miles`` (maximum distance) or ``recency_days`` (sold within that
+    many days of ``as_of``, default today), comps are picked through a
+    :class:`CompIndex` and returned best match first; pass a prebuilt index to
+    avoid re-sorting the pool on every call.
+    """
+
+    if k is None and radius_miles is None and recency_days is None:
+        pool = seeds.seeds if isinstance(seeds, CompIndex) else seeds
+        return [_build_record(subject, seed) for seed in pool]
+    index = seeds if isinstance(seeds, CompIndex) else CompIndex(seeds)
+    selected = index.select(subject, k=k, radius_miles=radius_miles, recency_days=recency_days, as_of=as_of)
+    return [_build_record(subject, seed) for seed in selected]
+
+
+__all__ = ["CompIndex", "CompPool", "build_comps"]
@@ -1,176 +1,312 @@
-diff --git a/sintrix_wholesale_estimator/data.py b/sintrix_wholesale_estimator/data.py
-index 61dd928cf150801f7b95ecbc62888a713475219d..4eca209537a633f0cce8fe8145fcf377f4cb0bf1 100644
---- a/sintrix_wholesale_estimator/data.py
-+++ b/sintrix_wholesale_estimator/data.py
-@@ -1,57 +1,113 @@
-- (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
--diff --git a/sintrix_wholesale_estimator/data.py b/sintrix_wholesale_estimator/data.py
--new file mode 100644
--index 0000000000000000000000000000000000000000..4582d03f3a6467348ae119acfcae4c5d546e1312
----- /dev/null
--+++ b/sintrix_wholesale_estimator/data.py
--@@ -0,0 +1,47 @@
--+"""Utilities for loading market data used by the estimator."""
--+from __future__ import annotations
--+
--+import json
--+from dataclasses import dataclass
--+from importlib import resources
--+from typing import Dict, Mapping
--+
--+
--+@dataclass(frozen=True)
--+class MarketProfile:
--+    """Data model representing localized assumptions for an area."""
--+
--+    name: str
--+    price_per_sqft_turnkey: float
--+    condition_adjustment: Mapping[str, float]
--+    property_type_adjustment: Mapping[str, float]
--+    renovation_cost_per_sqft: Mapping[str, float]
--+    closing_cost_rate: float
--+    holding_cost_rate: float
--+    wholesale_fee_rate: float
--+    holding_months: float
--+    demand_index: float
--+
--+
--+def load_market_profiles() -> Dict[str, MarketProfile]:
--+    """Load market profile data bundled with the package."""
--+
--+    path = resources.files(__package__) / "data" / "market_data.json"
--+    raw = json.loads(path.read_text())
--+
--+    profiles: Dict[str, MarketProfile] = {}
--+    for name, payload in raw.items():
--+        profiles[name] = MarketProfile(
--+            name=name,
--+            price_per_sqft_turnkey=payload["price_per_sqft_turnkey"],
--+            condition_adjustment=payload["condition_adjustment"],
--+            property_type_adjustment=payload["property_type_adjustment"],
--+            renovation_cost_per_sqft=payload["renovation_cost_per_sqft"],
--+            closing_cost_rate=payload["closing_cost_rate"],
--+            holding_cost_rate=payload["holding_cost_rate"],
--+            wholesale_fee_rate=payload["wholesale_fee_rate"],
--+            holding_months=payload["holding_months"],
--+            demand_index=payload["demand_index"],
--+        )
--+
--+    return profiles
-- 
--EOF
--)
-\ No newline at end of file
-+"""Static data loading helpers for the estimator."""
-+from __future__ import annotations
-+
-+import json
-+from dataclasses import dataclass
-+from importlib import resources
-+from pathlib import Path
-+from typing import Dict, Iterable, Mapping
-+
-+
-+@dataclass(frozen=True)
-+class MarketProfile:
-+    name: str
-+    price_per_sqft_turnkey: float
-+    condition_adjustment: Mapping[str, float]
-+    property_type_adjustment: Mapping[str, float]
-+    renovation_cost_per_sqft: Mapping[str, float]
-+    closing_cost_rate: float
-+    holding_cost_rate: float
-+    wholesale_fee_rate: float
-+    holding_months: float
-+    demand_index: float
-+
-+
-+@dataclass(frozen=True)
-+class ZipCostProfile:
-+    postal_code: str
-+    labor_rates: Mapping[str, float]
-+    material_rates: Mapping[str, float]
-+    dom_days: float
-+    discount_rate: float
-+    absorption_rate: float
-+    source: str
-+
-+
-+@dataclass(frozen=True)
-+class CompRecordSeed:
-+    address: str
-+    postal_code: str
-+    sold_price: float
-+    sold_date: str
-+    square_feet: float
-+    beds: float
-+    baths: float
-+    distance_miles: float
-+    dom: int
-+
-+
-+def _load_json(package: str, relative: str) -> Mapping[str, object]:
-+    package_root = resources.files(package)
-+    data_path = package_root / relative
-+    if not isinstance(data_path, Path):  # pragma: no cover - importlib nuance
-+        data_path = Path(str(data_path))
-+    return json.loads(data_path.read_text())
-+
-+
-+def load_market_profiles() -> Dict[str, MarketProfile]:
-+    raw = _load_json(__package__, "data/market_data.json")
-+    profiles: Dict[str, MarketProfile] = {}
-+    for name, payload in raw.items():
-+        profiles[name] = MarketProfile(
-+            name=name,
-+            price_per_sqft_turnkey=payload["price_per_sqft_turnkey"],
-+            condition_adjustment=payload["condition_adjustment"],
-+            property_type_adjustment=payload["property_type_adjustment"],
-+            renovation_cost_per_sqft=payload["renovation_cost_per_sqft"],
-+            closing_cost_rate=payload["closing_cost_rate"],
-+            holding_cost_rate=payload["holding_cost_rate"],
-+            wholesale_fee_rate=payload["wholesale_fee_rate"],
-+            holding_months=payload["holding_months"],
-+            demand_index=payload["demand_index"],
-+        )
-+    return profiles
-+
-+
-+def load_zip_cost_profiles() -> Dict[str, ZipCostProfile]:
-+    raw = _load_json(__package__, "data/zip_costs.json")
-+    profiles: Dict[str, ZipCostProfile] = {}
-+    for postal_code, payload in raw.items():
-+        profiles[postal_code] = ZipCostProfile(
-+            postal_code=postal_code,
-+            labor_rates=payload["labor_rates"],
-+            material_rates=payload["material_rates"],
-+            dom_days=payload["dom_days"],
-+            discount_rate=payload["discount_rate"],
-+            absorption_rate=payload["absorption_rate"],
-+            source=payload["source"],
-+        )
-+    return profiles
-+
-+
-+def load_comp_seeds() -> Dict[str, Iterable[CompRecordSeed]]:
-+    raw = _load_json(__package__, "data/comp_pool.json")
-+    pools: Dict[str, Iterable[CompRecordSeed]] = {}
-+    for market, entries in raw.items():
-+        pools[market] = [
-+            CompRecordSeed(
-+                address=item["address"],
-+                postal_code=item["postal_code"],
-+                sold_price=item["sold_price"],
-+                sold_date=item["sold_date"],
-+                square_feet=item["square_feet"],
-+                beds=item["beds"],
-+                baths=item["baths"],
-+                distance_miles=item["distance_miles"],
-+                dom=item["dom"],
-+            )
-+            for item in entries
-+        ]
-+    return pools
-+
-+
-+__all__ = [name for name in globals() if name[0].isupper() or name.startswith("load_")]
+"""Static data loading helpers for the estimator."""
+from __future__ import annotations
+
+import json
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class MarketProfile:
+    name: str
+    price_per_sqft_turnkey: float
+    condition_adjustment: Mapping[str, float]
+    property_type_adjustment: Mapping[str, float]
+    renovation_cost_per_sqft: Mapping[str, float]
+    closing_cost_rate: float
+    holding_cost_rate: float
+    wholesale_fee_rate: float
+    holding_months: float
+    demand_index: float
+
+
+@dataclass(frozen=True)
+class ZipCostProfile:
+    postal_code: str
+    labor_rates: Mapping[str, float]
+    material_rates: Mapping[str, float]
+    dom_days: float
+    discount_rate: float
+    absorption_rate: float
+    source: str
+
+
+@dataclass(frozen=True)
+class CompRecordSeed:
+    address: str
+    postal_code: str
+    sold_price: float
+    sold_date: str
+    square_feet: float
+    beds: float
+    baths: float
+    distance_miles: float
+    dom: int
+    sold_on: date = field(init=False, repr=False, compare=False)
+    sold_ordinal: int = field(init=False, repr=False, compare=False)
+    price_per_sqft: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        year, month, day = (int(part) for part in self.sold_date.split("-"))
+        sold_on = date(year, month, day)
+        object.__setattr__(self, "sold_on", sold_on)
+        object.__setattr__(self, "sold_ordinal", sold_on.toordinal())
+        object.__setattr__(
+            self, "price_per_sqft", self.sold_price / self.square_feet if self.square_feet else 0.0
+        )
+
+
+def _data_path(package: str, relative: str) -> Path:
+    from importlib import resources
+
+    data_path = resources.files(package) / relative
+    if not isinstance(data_path, Path):  # pragma: no cover - importlib nuance
+        data_path = Path(str(data_path))
+    return data_path
+
+
+def _load_json(package: str, relative: str) -> Mapping[str, object]:
+    return json.loads(_data_path(package, relative).read_text())
+
+
+def _build_market_profiles(raw: Mapping[str, object]) -> Dict[str, MarketProfile]:
+    profiles: Dict[str, MarketProfile] = {}
+    for name, payload in raw.items():
+        profiles[name] = MarketProfile(
+            name=name,
+            price_per_sqft_turnkey=payload["price_per_sqft_turnkey"],
+            condition_adjustment=payload["condition_adjustment"],
+            property_type_adjustment=payload["property_type_adjustment"],
+            renovation_cost_per_sqft=payload["renovation_cost_per_sqft"],
+            closing_cost_rate=payload["closing_cost_rate"],
+            holding_cost_rate=payload["holding_cost_rate"],
+            wholesale_fee_rate=payload["wholesale_fee_rate"],
+            holding_months=payload["holding_months"],
+            demand_index=payload["demand_index"],
+        )
+    return profiles
+
+
+def _build_zip_cost_profiles(raw: Mapping[str, object]) -> Dict[str, ZipCostProfile]:
+    profiles: Dict[str, ZipCostProfile] = {}
+    for postal_code, payload in raw.items():
+        profiles[postal_code] = ZipCostProfile(
+            postal_code=postal_code,
+            labor_rates=payload["labor_rates"],
+            material_rates=payload["material_rates"],
+            dom_days=payload["dom_days"],
+            discount_rate=payload["discount_rate"],
+            absorption_rate=payload["absorption_rate"],
+            source=payload["source"],
+        )
+    return profiles
+
+
+def _build_comp_seeds(raw: Mapping[str, object]) -> Dict[str, Iterable[CompRecordSeed]]:
+    pools: Dict[str, Iterable[CompRecordSeed]] = {}
+    for market, entries in raw.items():
+        pools[market] = [
+            CompRecordSeed(
+                address=item["address"],
+                postal_code=item["postal_code"],
+                sold_price=item["sold_price"],
+                sold_date=item["sold_date"],
+                square_feet=item["square_feet"],
+                beds=item["beds"],
+                baths=item["baths"],
+                distance_miles=item["distance_miles"],
+                dom=item["dom"],
+            )
+            for item in entries
+        ]
+    return pools
+
+
+_ZipBuckets = Dict[str, Tuple[List[int], List[str]]]
+
+
+def _zip3_buckets(codes: Iterable[str]) -> _ZipBuckets:
+    entries: Dict[str, List[Tuple[int, str]]] = {}
+    for postal_code in codes:
+        if len(postal_code) >= 3 and postal_code[:5].isdigit():
+            entries.setdefault(postal_code[:3], []).append((int(postal_code[:5]), postal_code))
+    buckets: _ZipBuckets = {}
+    for prefix, bucket in entries.items():
+        bucket.sort()
+        buckets[prefix] = ([number for number, _ in bucket], [code for _, code in bucket])
+    return buckets
+
+
+class ZipFallbackIndex:
+    """Fallbacks for postal codes missing from the ZIP cost table.
+
+    Exact hits are a plain table lookup. The first miss builds two maps from
+    the postal codes and sources alone, so tables that decode profiles on
+    lookup (snapshots) never decode the rest of the table: ZIP3 buckets of
+    sorted codes, and every word-boundary prefix of each source mapped to the
+    codes carrying it. A ZIP belongs to the market whose city its source
+    starts with. A missing code resolves to the numerically nearest code of
+    the same market sharing its first three digits, then to the market
+    default (the market's first profile), and only then to the nearest code
+    from any market.
+
+    ``sources`` yields ``(postal_code, source)`` pairs in table order; by
+    default it is read from the profiles themselves.
+    """
+
+    def __init__(
+        self,
+        profiles: Mapping[str, ZipCostProfile],
+        sources: Callable[[], Iterable[Tuple[str, str]]] | None = None,
+    ) -> None:
+        self.profiles = profiles
+        self._sources = sources or (lambda: ((code, profile.source) for code, profile in profiles.items()))
+        self._zip3: _ZipBuckets | None = None
+        self._source_prefixes: Dict[str, List[str]] | None = None
+        self._market_zip3: Dict[str, _ZipBuckets] = {}
+        self._lock = threading.Lock()
+
+    def _build(self) -> None:
+        codes: List[str] = []
+        codes_by_source: Dict[str, List[str]] = {}
+        for postal_code, source in self._sources():
+            codes.append(postal_code)
+            codes_by_source.setdefault(source, []).append(postal_code)
+        prefixes: Dict[str, List[str]] = {}
+        for source, source_codes in codes_by_source.items():
+            for position, character in enumerate(source):
+                if character.isspace() or character == ",":
+                    prefixes.setdefault(source[:position], []).extend(source_codes)
+            prefixes.setdefault(source, []).extend(source_codes)
+        self._source_prefixes = prefixes
+        self._zip3 = _zip3_buckets(codes)
+
+    def _maps(self) -> Tuple[_ZipBuckets, Dict[str, List[str]]]:
+        if self._zip3 is None:
+            with self._lock:
+                if self._zip3 is None:
+                    self._build()
+        assert self._zip3 is not None and self._source_prefixes is not None
+        return self._zip3, self._source_prefixes
+
+    def _market_codes(self, market: MarketProfile) -> List[str]:
+        return self._maps()[1].get(market.name.split(",")[0], [])
+
+    def nearest(self, postal_code: str, market: MarketProfile | None = None) -> ZipCostProfile | None:
+        """Nearest code sharing ``postal_code``'s ZIP3, limited to ``market``'s codes when one is given."""
+
+        if market is None:
+            buckets = self._maps()[0]
+        else:
+            buckets = self._market_zip3.get(market.name)
+            if buckets is None:
+                buckets = self._market_zip3[market.name] = _zip3_buckets(self._market_codes(market))
+        bucket = buckets.get(postal_code[:3])
+        if bucket is None or not postal_code[:5].isdigit():
+            return None
+        numbers, codes = bucket
+        target = int(postal_code[:5])
+        position = bisect_left(numbers, target)
+        if position == len(numbers):
+            position -= 1
+        elif position and target - numbers[position - 1] <= numbers[position] - target:
+            position -= 1
+        return self.profiles[codes[position]]
+
+    def market_default(self, market: MarketProfile) -> ZipCostProfile | None:
+        codes = self._market_codes(market)
+        return self.profiles[codes[0]] if codes else None
+
+    def resolve(self, postal_code: str, market: MarketProfile) -> ZipCostProfile | None:
+        profile = self.profiles.get(postal_code)
+        if profile is None:
+            profile = self.nearest(postal_code, market) or self.market_default(market) or self.nearest(postal_code)
+        return profile
+
+
+MARKET_DATA = "data/market_data.json"
+ZIP_COST_DATA = "data/zip_costs.json"
+COMP_POOL_DATA = "data/comp_pool.json"
+
+
+def load_market_profiles() -> Dict[str, MarketProfile]:
+    return _build_market_profiles(_load_json(__package__, MARKET_DATA))
+
+
+def load_zip_cost_profiles() -> Dict[str, ZipCostProfile]:
+    return _build_zip_cost_profiles(_load_json(__package__, ZIP_COST_DATA))
+
+
+def load_comp_seeds() -> Dict[str, Iterable[CompRecordSeed]]:
+    return _build_comp_seeds(_load_json(__package__, COMP_POOL_DATA))
+
+
+class ReferenceData:
+    """Process-wide cache of the bundled reference tables.
+
+    Each table is parsed on first use and shared by every caller until the
+    backing file's mtime changes, at which point the next lookup reloads it.
+    """
+
+    def __init__(self, package: str = __package__) -> None:
+        self._package = package
+        self._tables: Dict[str, Tuple[int, object]] = {}
+        self._zip_index: ZipFallbackIndex | None = None
+        self._lock = threading.Lock()
+
+    def _table(self, relative: str, build: Callable[[Mapping[str, object]], T]) -> Tuple[int, T]:
+        path = _data_path(self._package, relative)
+        mtime = path.stat().st_mtime_ns
+        cached = self._tables.get(relative)
+        if cached is not None and cached[0] == mtime:
+            return cached  # type: ignore[return-value]
+        with self._lock:
+            cached = self._tables.get(relative)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, build(json.loads(path.read_text())))
+                self._tables[relative] = cached
+        return cached  # type: ignore[return-value]
+
+    def markets(self) -> Dict[str, MarketProfile]:
+        return self.versioned_markets()[1]
+
+    def zip_costs(self) -> Dict[str, ZipCostProfile]:
+        return self.versioned_zip_costs()[1]
+
+    def comp_pools(self) -> Dict[str, Iterable[CompRecordSeed]]:
+        return self.versioned_comp_pools()[1]
+
+    # ``(mtime, table)`` pairs, read together so a version always describes the table it came with
+
+    def versioned_markets(self) -> Tuple[int, Dict[str, MarketProfile]]:
+        return self._table(MARKET_DATA, _build_market_profiles)
+
+    def versioned_zip_costs(self) -> Tuple[int, Dict[str, ZipCostProfile]]:
+        return self._table(ZIP_COST_DATA, _build_zip_cost_profiles)
+
+    def versioned_comp_pools(self) -> Tuple[int, Dict[str, Iterable[CompRecordSeed]]]:
+        return self._table(COMP_POOL_DATA, _build_comp_seeds)
+
+    def zip_index(self) -> ZipFallbackIndex:
+        profiles = self.zip_costs()
+        index = self._zip_index
+        if index is None or index.profiles is not profiles:
+            index = self._zip_index = ZipFallbackIndex(profiles)
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self._zip_index = None
+
+
+REFERENCE_DATA = ReferenceData()
+
+
+__all__ = [name for name in globals() if name[0].isupper() or name.startswith("load_")]
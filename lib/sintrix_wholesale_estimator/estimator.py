@@ -1,409 +1,680 @@
-diff --git a/sintrix_wholesale_estimator/estimator.py b/sintrix_wholesale_estimator/estimator.py
-index 8f4de5021d98fe05d21c559e7377f37e16c39a7c..5913fa527db8f1091ba10b135cb6af23d72fd905 100644
---- a/sintrix_wholesale_estimator/estimator.py
-+++ b/sintrix_wholesale_estimator/estimator.py
-@@ -1,191 +1,212 @@
-- (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
--diff --git a/sintrix_wholesale_estimator/estimator.py b/sintrix_wholesale_estimator/estimator.py
--new file mode 100644
--index 0000000000000000000000000000000000000000..5584d34e9edd69ce6b199e6cbf6ba35c580d3c5f
----- /dev/null
--+++ b/sintrix_wholesale_estimator/estimator.py
--@@ -0,0 +1,181 @@
--+"""Core wholesale estimation logic."""
--+from __future__ import annotations
--+
--+from dataclasses import dataclass
--+from typing import Dict, Mapping, Tuple
--+
--+from .data import MarketProfile, load_market_profiles
--+
--+CONDITION_LEVELS = ("turnkey", "rent_ready", "light_rehab", "heavy_rehab", "tear_down")
--+PROPERTY_TYPES = ("single_family", "multi_family", "condo", "townhome")
--+
--+
--+class MarketNotFoundError(ValueError):
--+    """Raised when a requested market is not defined."""
--+
--+
--+@dataclass
--+class PropertyRequest:
--+    """Input payload describing the subject property."""
--+
--+    location: str
--+    square_feet: float
--+    beds: float
--+    baths: float
--+    condition: str = "light_rehab"
--+    property_type: str = "single_family"
--+    year_built: int | None = None
--+    lot_square_feet: float | None = None
--+    target_assignment_fee: float | None = None
--+
--+
--+@dataclass
--+class PropertyEstimate:
--+    """Output of the wholesale estimator."""
--+
--+    arv: float
--+    as_is_value: float
--+    repair_cost: float
--+    closing_cost: float
--+    holding_cost: float
--+    assignment_fee: float
--+    maximum_allowable_offer: float
--+    recommended_offer: float
--+    projected_profit: float
--+    comparable_range: Tuple[float, float]
--+    confidence: float
--+
--+
--+class WholesaleEstimator:
--+    """Provides wholesale offer guidance based on localized assumptions."""
--+
--+    def __init__(self, market_profiles: Mapping[str, MarketProfile] | None = None) -> None:
--+        self._market_profiles: Mapping[str, MarketProfile] = (
--+            market_profiles if market_profiles is not None else load_market_profiles()
--+        )
--+
--+    @property
--+    def available_markets(self) -> Tuple[str, ...]:
--+        return tuple(sorted(self._market_profiles.keys()))
--+
--+    def estimate(self, request: PropertyRequest) -> PropertyEstimate:
--+        market = self._resolve_market(request.location)
--+        self._validate_inputs(request)
--+
--+        condition = request.condition
--+        property_type = request.property_type
--+
--+        base_price = (
--+            market.price_per_sqft_turnkey
--+            * market.demand_index
--+            * market.property_type_adjustment.get(property_type, 1.0)
--+        )
--+        arv = base_price * request.square_feet
--+
--+        condition_factor = market.condition_adjustment.get(condition)
--+        if condition_factor is None:
--+            raise ValueError(f"Unsupported condition '{condition}'.")
--+
--+        as_is_value = arv * condition_factor
--+
--+        repair_cost = self._estimate_repair_cost(request, market)
--+        closing_cost = market.closing_cost_rate * arv
--+        holding_cost = market.holding_cost_rate * as_is_value * market.holding_months
--+
--+        assignment_fee = self._assignment_fee(request, market, arv)
--+
--+        allowable_discount = 0.72 if condition in {"light_rehab", "heavy_rehab", "tear_down"} else 0.78
--+        maximum_allowable_offer = max(
--+            0.0,
--+            (arv * allowable_discount)
--+            - repair_cost
--+            - closing_cost
--+            - holding_cost
--+            - assignment_fee,
--+        )
--+
--+        recommended_offer = min(maximum_allowable_offer, as_is_value * 0.98)
--+
--+        total_investment = (
--+            recommended_offer + repair_cost + closing_cost + holding_cost + assignment_fee
--+        )
--+        projected_profit = max(0.0, arv - total_investment)
--+
--+        comp_low = as_is_value * 0.92
--+        comp_high = arv * 1.05
--+        confidence = self._confidence_score(market, request)
--+
--+        return PropertyEstimate(
--+            arv=round(arv, 2),
--+            as_is_value=round(as_is_value, 2),
--+            repair_cost=round(repair_cost, 2),
--+            closing_cost=round(closing_cost, 2),
--+            holding_cost=round(holding_cost, 2),
--+            assignment_fee=round(assignment_fee, 2),
--+            maximum_allowable_offer=round(maximum_allowable_offer, 2),
--+            recommended_offer=round(recommended_offer, 2),
--+            projected_profit=round(projected_profit, 2),
--+            comparable_range=(round(comp_low, 2), round(comp_high, 2)),
--+            confidence=round(confidence, 3),
--+        )
--+
--+    def _resolve_market(self, location: str) -> MarketProfile:
--+        try:
--+            return self._market_profiles[location]
--+        except KeyError as exc:  # pragma: no cover - simple guard
--+            available = ", ".join(self.available_markets)
--+            raise MarketNotFoundError(
--+                f"No market profile for '{location}'. Available markets: {available}"
--+            ) from exc
--+
--+    @staticmethod
--+    def _validate_inputs(request: PropertyRequest) -> None:
--+        if request.square_feet <= 0:
--+            raise ValueError("Square footage must be positive.")
--+        if request.beds <= 0:
--+            raise ValueError("Bedroom count must be positive.")
--+        if request.baths <= 0:
--+            raise ValueError("Bathroom count must be positive.")
--+        if request.condition not in CONDITION_LEVELS:
--+            raise ValueError(f"Condition must be one of: {', '.join(CONDITION_LEVELS)}")
--+        if request.property_type not in PROPERTY_TYPES:
--+            raise ValueError(f"Property type must be one of: {', '.join(PROPERTY_TYPES)}")
--+
--+    @staticmethod
--+    def _estimate_repair_cost(request: PropertyRequest, market: MarketProfile) -> float:
--+        per_sqft = market.renovation_cost_per_sqft.get(request.condition, 0.0)
--+        modifier = 1.0
--+        if request.year_built and request.year_built < 1975:
--+            modifier += 0.08
--+        if request.year_built and request.year_built < 1950:
--+            modifier += 0.05
--+        if request.lot_square_feet and request.lot_square_feet > request.square_feet * 2:
--+            modifier += 0.03
--+        return per_sqft * request.square_feet * modifier
--+
--+    @staticmethod
--+    def _assignment_fee(request: PropertyRequest, market: MarketProfile, arv: float) -> float:
--+        if request.target_assignment_fee is not None:
--+            return request.target_assignment_fee
--+        return max(4500.0, arv * market.wholesale_fee_rate)
--+
--+    @staticmethod
--+    def _confidence_score(market: MarketProfile, request: PropertyRequest) -> float:
--+        score = 0.55
--+        score += min(0.1, (market.demand_index - 0.95))
--+        score += min(0.05, market.wholesale_fee_rate)
--+        if request.square_feet <= 900:
--+            score += 0.02
--+        elif request.square_feet <= 1800:
--+            score += 0.05
--+        else:
--+            score += 0.03
--+        if request.condition in {"turnkey", "rent_ready"}:
--+            score += 0.08
--+        elif request.condition == "light_rehab":
--+            score += 0.05
--+        if request.property_type == "single_family":
--+            score += 0.04
--+        elif request.property_type == "multi_family":
--+            score += 0.02
--+        return max(0.3, min(score, 0.92))
-- 
--EOF
--)
-\ No newline at end of file
-+"""Core orchestration for the Sourcer estimation workflow."""
-+from __future__ import annotations
-+
-+from dataclasses import dataclass
-+from pathlib import Path
-+from statistics import mean
-+from typing import Iterable, Mapping, Sequence
-+
-+from . import comps, repairs
-+from .data import CompRecordSeed, MarketProfile, ZipCostProfile, load_comp_seeds, load_market_profiles, load_zip_cost_profiles
-+from .models import (
-+    DealConfig,
-+    DealEstimate,
-+    MarketTrend,
-+    NegotiationScript,
-+    OfferBand,
-+    PropertyInsight,
-+    SubjectProperty,
-+)
-+from .reporting import generate_pdf, render_text
-+
-+
-+class MarketNotFoundError(ValueError):
-+    """Raised when a property cannot be matched to a market profile."""
-+
-+
-+@dataclass(slots=True)
-+class EstimationArtifacts:
-+    estimate: DealEstimate
-+    pdf_path: str | None
-+    text_summary: str
-+
-+
-+class EstimationEngine:
-+    """Generates offer guidance, comps, and collateral for a subject property."""
-+
-+    def __init__(
-+        self,
-+        markets: Mapping[str, MarketProfile] | None = None,
-+        zip_costs: Mapping[str, ZipCostProfile] | None = None,
-+        comp_pools: Mapping[str, Sequence[CompRecordSeed]] | None = None,
-+    ) -> None:
-+        self._markets = markets or load_market_profiles()
-+        self._zip_costs = zip_costs or load_zip_cost_profiles()
-+        self._comp_pools = comp_pools or load_comp_seeds()
-+
-+    @property
-+    def available_markets(self) -> Sequence[str]:
-+        return tuple(sorted(self._markets))
-+
-+    def _resolve_market(self, subject: SubjectProperty) -> MarketProfile:
-+        market = self._markets.get(subject.market_key)
-+        if market is None:
-+            raise MarketNotFoundError(
-+                f"No market profile for '{subject.market_key}'. Known markets: {', '.join(self.available_markets)}"
-+            )
-+        return market
-+
-+    def _resolve_zip(self, subject: SubjectProperty, market: MarketProfile) -> ZipCostProfile:
-+        profile = self._zip_costs.get(subject.postal_code)
-+        if profile is None:
-+            # fallback: use first profile for market (matching postal prefix)
-+            for candidate in self._zip_costs.values():
-+                if candidate.source.startswith(market.name.split(",")[0]):
-+                    profile = candidate
-+                    break
-+        if profile is None:
-+            raise MarketNotFoundError(
-+                f"No ZIP pricing data for {subject.postal_code}. Provide a supported ZIP or update data tables."
-+            )
-+        return profile
-+
-+    def _factor_for_risk(self, config: DealConfig) -> float:
-+        base = config.strategy.factor
-+        if config.risk_profile == "aggressive":
-+            base -= 0.03
-+        elif config.risk_profile == "conservative":
-+            base += 0.03
-+        return max(0.55, min(base, 0.75))
-+
-+    def _offer_bands(self, mao: float, as_is: float, config: DealConfig) -> list[OfferBand]:
-+        buffer = max(5000.0, mao * 0.05)
-+        safe_bump = max(6500.0, mao * 0.035)
-+        aggressive = max(0.0, mao - buffer)
-+        target = max(0.0, mao)
-+        safe = min(as_is * 0.97, mao + safe_bump)
-+        return [
-+            OfferBand(label="Aggressive", offer_price=round(aggressive, 2), mao=round(mao, 2), rationale="Anchors negotiations low"),
-+            OfferBand(label="Target", offer_price=round(target, 2), mao=round(mao, 2), rationale="Protects assignment spread"),
-+            OfferBand(label="Safe", offer_price=round(safe, 2), mao=round(mao, 2), rationale="Preserves rapport while staying under as-is"),
-+        ]
-+
-+    def _negotiation_scripts(self, subject: SubjectProperty, offers: Iterable[OfferBand], config: DealConfig) -> list[NegotiationScript]:
-+        scripts: list[NegotiationScript] = []
-+        scripts.append(
-+            NegotiationScript(
-+                title="Condition & Carry Costs",
-+                body=(
-+                    f"Given the {subject.condition.replace('_', ' ')} condition we are carrying a repair budget north of $"
-+                    f"{config.strategy.assignment_fee:,.0f}. Our target number keeps us safe on holding costs while guaranteeing closing."
-+                ),
-+            )
-+        )
-+        scripts.append(
-+            NegotiationScript(
-+                title="Speed-to-close",
-+                body=(
-+                    "We can close in 14 days with hard earnest money. If we can land closer to the target band "
-+                    "we'll handle all title and inspection logistics."
-+                ),
-+            )
-+        )
-+        scripts.append(
-+            NegotiationScript(
-+                title="Walk-away framing",
-+                body=(
-+                    "If a higher number is a must, we can explore our safe band but it trims our spread considerably. "
-+                    "We'd need flexibility on access or closing timeline to justify it."
-+                ),
-+            )
-+        )
-+        return scripts
-+
-+    def _disclaimer(self) -> str:
-+        return (
-+            "These values are modeled using public sales records, MLS trend summaries, and internal heuristics. "
-+            "Always validate with licensed professionals before making binding offers."
-+        )
-+
-+    def _citations(self, market: MarketProfile, zip_profile: ZipCostProfile) -> dict[str, str]:
-+        return {
-+            "Market profile": f"Sintrix blended MLS + public record heuristics ({market.name})",
-+            "ZIP cost": zip_profile.source,
-+        }
-+
-+    def estimate(self, subject: SubjectProperty, config: DealConfig | None = None) -> EstimationArtifacts:
-+        config = config or DealConfig()
-+        market = self._resolve_market(subject)
-+        zip_profile = self._resolve_zip(subject, market)
-+
-+        seeds = self._comp_pools.get(subject.market_key, ())
-+        comp_records = comps.build_comps(subject, seeds)
-+        adjusted_prices = [comp.adjusted_price for comp in comp_records] or [subject.square_feet * market.price_per_sqft_turnkey]
-+
-+        arv_from_market = subject.square_feet * market.price_per_sqft_turnkey * market.demand_index
-+        arv_from_comps = mean(adjusted_prices)
-+        arv = (0.55 * arv_from_market) + (0.45 * arv_from_comps)
-+
-+        as_is = arv * market.condition_adjustment.get(subject.condition, 0.8)
-+
-+        repair_items = repairs.build_repair_budget(subject, market, zip_profile)
-+        repair_total = config.repair_override if config.repair_override is not None else repairs.sum_repair_budget(repair_items)
-+
-+        closing_rate = config.closing_cost_rate or market.closing_cost_rate
-+        holding_months = config.holding_months or market.holding_months
-+        holding_cost = as_is * market.holding_cost_rate * holding_months
-+        closing_cost = arv * closing_rate
-+
-+        assignment_fee = config.assignment_fee_override or max(
-+            config.strategy.fee_floor,
-+            min(config.strategy.fee_ceiling or float("inf"), max(config.strategy.assignment_fee, arv * market.wholesale_fee_rate)),
-+        )
-+
-+        factor = self._factor_for_risk(config)
-+        mao = max(0.0, (arv * factor) - repair_total - assignment_fee - closing_cost - holding_cost)
-+        offers = self._offer_bands(mao, as_is, config)
-+
-+        projected_profit = max(0.0, arv - (offers[1].offer_price + repair_total + closing_cost + holding_cost + assignment_fee))
-+
-+        market_trends = [
-+            MarketTrend(
-+                postal_code=subject.postal_code,
-+                median_dom=zip_profile.dom_days,
-+                average_discount=zip_profile.discount_rate,
-+                absorption_rate=zip_profile.absorption_rate,
-+                source=zip_profile.source,
-+            )
-+        ]
-+
-+        insight = PropertyInsight(
-+            arv=round(arv, 2),
-+            as_is=round(as_is, 2),
-+            repair_budget=round(repair_total, 2),
-+            closing_costs=round(closing_cost, 2),
-+            holding_costs=round(holding_cost, 2),
-+            assignment_fee=round(assignment_fee, 2),
-+            mao=round(mao, 2),
-+            projected_profit=round(projected_profit, 2),
-+            demand_score=round(market.demand_index, 2),
-+        )
-+
-+        estimate = DealEstimate(
-+            property=subject,
-+            insight=insight,
-+            offers=offers,
-+            comps=comp_records,
-+            repairs=repair_items,
-+            market_trends=market_trends,
-+            negotiation_scripts=self._negotiation_scripts(subject, offers, config),
-+            disclaimer=self._disclaimer(),
-+            citations=self._citations(market, zip_profile),
-+        )
-+
-+        pdf_path = None
-+        if config.include_pdf:
-+            output = generate_pdf(estimate, Path.cwd() / "sourcer_offer.pdf")
-+            pdf_path = str(output)
-+        text_summary = render_text(estimate)
-+        return EstimationArtifacts(estimate=estimate, pdf_path=pdf_path, text_summary=text_summary)
-+
-+
-+__all__ = ["EstimationEngine", "EstimationArtifacts", "MarketNotFoundError"]
+"""Core orchestration for the Sourcer estimation workflow."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from itertools import count, islice
+from pathlib import Path
+from statistics import mean
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterable, Iterator, Mapping, Sequence, Tuple
+
+from . import comps, repairs
+from .cache import EstimateCache, estimate_key
+from .data import REFERENCE_DATA, CompRecordSeed, MarketProfile, ZipCostProfile, ZipFallbackIndex
+from .models import (
+    CompAdjustment,
+    CompRecord,
+    DealConfig,
+    DealEstimate,
+    MarketTrend,
+    NegotiationScript,
+    OfferBand,
+    PropertyInsight,
+    RepairLineItem,
+    SubjectProperty,
+)
+from .reporting import SummaryValues, render_text
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .columnar import InsightColumns, SubjectColumns
+
+
+_ENGINE_TABLE_IDS = count()
+
+# estimate_many reads subjects this many at a time, and sends market/ZIP groups
+# of at least COLUMNAR_MIN_ROWS of them through the columnar core
+BATCH_CHUNK_ROWS = 1024
+COLUMNAR_MIN_ROWS = 16
+
+
+class MarketNotFoundError(ValueError):
+    """Raised when a property cannot be matched to a market profile."""
+
+
+@dataclass(frozen=True)
+class _CachedEstimate:
+    """A finished estimate kept by the result cache.
+
+    The cache never hands ``estimate`` out: every hit gets its own copy built
+    around the caller's subject. ``collateral`` is still pending for
+    insight-only entries, and ``pdf_path`` is the packet an eager entry wrote.
+    """
+
+    estimate: DealEstimate
+    collateral: Callable[[DealEstimate], None] | None
+    pdf_path: str | None
+
+
+def _copy_estimate(estimate: DealEstimate, subject: SubjectProperty) -> DealEstimate:
+    # plain constructor calls; dataclasses.replace and deepcopy cost several times more
+    insight = estimate.insight
+    return DealEstimate(
+        property=subject,
+        insight=PropertyInsight(
+            insight.arv,
+            insight.as_is,
+            insight.repair_budget,
+            insight.closing_costs,
+            insight.holding_costs,
+            insight.assignment_fee,
+            insight.mao,
+            insight.projected_profit,
+            insight.demand_score,
+        ),
+        offers=[OfferBand(band.label, band.offer_price, band.mao, band.rationale) for band in estimate.offers],
+        comps=[
+            CompRecord(
+                comp.address,
+                comp.postal_code,
+                comp.sold_price,
+                comp.sold_date,
+                comp.square_feet,
+                comp.beds,
+                comp.baths,
+                comp.distance_miles,
+                comp.dom,
+                [CompAdjustment(adjustment.label, adjustment.amount) for adjustment in comp.adjustments],
+            )
+            for comp in estimate.comps
+        ],
+        repairs=[
+            RepairLineItem(
+                item.trade,
+                item.description,
+                item.quantity,
+                item.unit,
+                item.labor_rate,
+                item.material_rate,
+                item.cost,
+            )
+            for item in estimate.repairs
+        ],
+        market_trends=[
+            MarketTrend(
+                trend.postal_code,
+                trend.median_dom,
+                trend.average_discount,
+                trend.absorption_rate,
+                trend.source,
+            )
+            for trend in estimate.market_trends
+        ],
+        negotiation_scripts=[NegotiationScript(script.title, script.body) for script in estimate.negotiation_scripts],
+        disclaimer=estimate.disclaimer,
+        citations=dict(estimate.citations),
+    )
+
+
+class EstimationArtifacts:
+    """Estimate output plus collateral; text and PDF are rendered on first access."""
+
+    __slots__ = ("estimate", "_pdf_path", "_pdf_target", "_text_summary", "_collateral", "_summary_values")
+
+    def __init__(
+        self,
+        estimate: DealEstimate,
+        pdf_path: str | None = None,
+        text_summary: str | None = None,
+        *,
+        pdf_target: Path | None = None,
+        collateral: Callable[[DealEstimate], None] | None = None,
+    ) -> None:
+        self.estimate = estimate
+        self._pdf_path = pdf_path
+        self._pdf_target = pdf_target
+        self._text_summary = text_summary
+        self._collateral = collateral
+        self._summary_values: SummaryValues | None = None
+
+    def _complete(self) -> None:
+        if self._collateral is not None:
+            collateral, self._collateral = self._collateral, None
+            collateral(self.estimate)
+            self._summary_values = None
+
+    def _values(self) -> SummaryValues:
+        # formatted once and shared by the text summary and the PDF
+        self._complete()
+        if self._summary_values is None:
+            self._summary_values = SummaryValues(self.estimate)
+        return self._summary_values
+
+    @property
+    def comps(self) -> list[CompRecord]:
+        self._complete()
+        return self.estimate.comps
+
+    @property
+    def repairs(self) -> list[RepairLineItem]:
+        self._complete()
+        return self.estimate.repairs
+
+    @property
+    def negotiation_scripts(self) -> list[NegotiationScript]:
+        self._complete()
+        return self.estimate.negotiation_scripts
+
+    @property
+    def pdf_path(self) -> str | None:
+        if self._pdf_path is None and self._pdf_target is not None:
+            from .packets import write_packet
+
+            self._pdf_path = str(write_packet(self.estimate, self._pdf_target, values=self._values()))
+            self._pdf_target = None
+        return self._pdf_path
+
+    @property
+    def text_summary(self) -> str:
+        if self._text_summary is None:
+            self._text_summary = render_text(self.estimate, self._values())
+        return self._text_summary
+
+
+class EstimationEngine:
+    """Generates offer guidance, comps, and collateral for a subject property."""
+
+    def __init__(
+        self,
+        markets: Mapping[str, MarketProfile] | None = None,
+        zip_costs: Mapping[str, ZipCostProfile] | None = None,
+        comp_pools: Mapping[str, Sequence[CompRecordSeed]] | None = None,
+        cache: EstimateCache[_CachedEstimate] | None = None,
+        data_version: Hashable | None = None,
+    ) -> None:
+        self.cache = cache
+        if data_version is None and not (markets is None and zip_costs is None and comp_pools is None):
+            # caller-supplied tables carry no version; never share cache entries across engines
+            data_version = ("tables", next(_ENGINE_TABLE_IDS))
+        self._data_version = data_version
+        self._market_table = markets
+        self._zip_table = zip_costs
+        self._comp_table = comp_pools
+        self._table_versions: Dict[str, int] = {}  # mtimes of the bundled tables as this engine loaded them
+        self._zip_fallbacks: ZipFallbackIndex | None = None
+        self._comp_indexes: Dict[str, Tuple[Sequence[CompRecordSeed], comps.CompIndex]] = {}
+        self._comp_pools_by_market: Dict[str, Tuple[Sequence[CompRecordSeed], comps.CompPool]] = {}
+
+    @classmethod
+    def from_snapshot(cls, path: Path) -> "EstimationEngine":
+        """Build an engine backed by a memory-mapped reference-data snapshot."""
+
+        from .snapshot import load_snapshot
+
+        snapshot = load_snapshot(path)
+        engine = cls(
+            markets=snapshot.markets,
+            zip_costs=snapshot.zip_costs,
+            comp_pools=snapshot.comp_pools,
+            data_version=snapshot.version,
+        )
+        engine._zip_fallbacks = ZipFallbackIndex(snapshot.zip_costs, snapshot.zip_sources)
+        return engine
+
+    def warm(self) -> "EstimationEngine":
+        """Load the reference tables and ZIP index now instead of on the first estimate."""
+
+        # each property loads its table on first access
+        self._markets
+        self._zip_index
+        self._comp_pools
+        return self
+
+    @property
+    def _markets(self) -> Mapping[str, MarketProfile]:
+        if self._market_table is None:
+            self._table_versions["markets"], self._market_table = REFERENCE_DATA.versioned_markets()
+        return self._market_table
+
+    @property
+    def _zip_costs(self) -> Mapping[str, ZipCostProfile]:
+        if self._zip_table is None:
+            self._table_versions["zip_costs"], self._zip_table = REFERENCE_DATA.versioned_zip_costs()
+        return self._zip_table
+
+    @property
+    def _zip_index(self) -> ZipFallbackIndex:
+        if self._zip_fallbacks is None:
+            profiles = self._zip_costs
+            shared = REFERENCE_DATA.zip_index() if "zip_costs" in self._table_versions else None
+            if shared is None or shared.profiles is not profiles:
+                # only reuse the process-wide index when it was built over this engine's table
+                shared = ZipFallbackIndex(profiles)
+            self._zip_fallbacks = shared
+        return self._zip_fallbacks
+
+    @property
+    def _comp_pools(self) -> Mapping[str, Sequence[CompRecordSeed]]:
+        if self._comp_table is None:
+            self._table_versions["comp_pools"], self._comp_table = REFERENCE_DATA.versioned_comp_pools()
+        return self._comp_table
+
+    @property
+    def available_markets(self) -> Sequence[str]:
+        return tuple(sorted(self._markets))
+
+    def _resolve_market(self, subject: SubjectProperty) -> MarketProfile:
+        return self._resolve_market_key(subject.market_key)
+
+    def _resolve_market_key(self, market_key: str) -> MarketProfile:
+        market = self._markets.get(market_key)
+        if market is None:
+            raise MarketNotFoundError(
+                f"No market profile for '{market_key}'. Known markets: {', '.join(self.available_markets)}"
+            )
+        return market
+
+    def _resolve_zip(self, subject: SubjectProperty, market: MarketProfile) -> ZipCostProfile:
+        return self._resolve_zip_code(subject.postal_code, market)
+
+    def _resolve_zip_code(self, postal_code: str, market: MarketProfile) -> ZipCostProfile:
+        profile = self._zip_index.resolve(postal_code, market)
+        if profile is None:
+            raise MarketNotFoundError(
+                f"No ZIP pricing data for {postal_code}. Provide a supported ZIP or update data tables."
+            )
+        return profile
+
+    def _comp_pool(self, market_key: str, seeds: Sequence[CompRecordSeed]) -> comps.CompPool:
+        cached = self._comp_pools_by_market.get(market_key)
+        if cached is None or cached[0] is not seeds:
+            cached = (seeds, comps.CompPool(seeds))
+            self._comp_pools_by_market[market_key] = cached
+        return cached[1]
+
+    def _comp_index(self, market_key: str, seeds: Sequence[CompRecordSeed]) -> comps.CompIndex:
+        cached = self._comp_indexes.get(market_key)
+        if cached is None or cached[0] is not seeds:
+            cached = (seeds, comps.CompIndex(seeds))
+            self._comp_indexes[market_key] = cached
+        return cached[1]
+
+    def _factor_for_risk(self, config: DealConfig) -> float:
+        base = config.strategy.factor
+        if config.risk_profile == "aggressive":
+            base -= 0.03
+        elif config.risk_profile == "conservative":
+            base += 0.03
+        return max(0.55, min(base, 0.75))
+
+    def _offer_bands(self, mao: float, as_is: float, config: DealConfig) -> list[OfferBand]:
+        buffer = max(5000.0, mao * 0.05)
+        safe_bump = max(6500.0, mao * 0.035)
+        aggressive = max(0.0, mao - buffer)
+        target = max(0.0, mao)
+        safe = min(as_is * 0.97, mao + safe_bump)
+        return self._priced_bands(round(aggressive, 2), round(target, 2), round(safe, 2), round(mao, 2))
+
+    def _priced_bands(self, aggressive: float, target: float, safe: float, mao: float) -> list[OfferBand]:
+        return [
+            OfferBand(label="Aggressive", offer_price=aggressive, mao=mao, rationale="Anchors negotiations low"),
+            OfferBand(label="Target", offer_price=target, mao=mao, rationale="Protects assignment spread"),
+            OfferBand(label="Safe", offer_price=safe, mao=mao, rationale="Preserves rapport while staying under as-is"),
+        ]
+
+    def _negotiation_scripts(self, subject: SubjectProperty, offers: Iterable[OfferBand], config: DealConfig) -> list[NegotiationScript]:
+        scripts: list[NegotiationScript] = []
+        scripts.append(
+            NegotiationScript(
+                title="Condition & Carry Costs",
+                body=(
+                    f"Given the {subject.condition.replace('_', ' ')} condition we are carrying a repair budget north of $"
+                    f"{config.strategy.assignment_fee:,.0f}. Our target number keeps us safe on holding costs while guaranteeing closing."
+                ),
+            )
+        )
+        scripts.append(
+            NegotiationScript(
+                title="Speed-to-close",
+                body=(
+                    "We can close in 14 days with hard earnest money. If we can land closer to the target band "
+                    "we'll handle all title and inspection logistics."
+                ),
+            )
+        )
+        scripts.append(
+            NegotiationScript(
+                title="Walk-away framing",
+                body=(
+                    "If a higher number is a must, we can explore our safe band but it trims our spread considerably. "
+                    "We'd need flexibility on access or closing timeline to justify it."
+                ),
+            )
+        )
+        return scripts
+
+    def _disclaimer(self) -> str:
+        return (
+            "These values are modeled using public sales records, MLS trend summaries, and internal heuristics. "
+            "Always validate with licensed professionals before making binding offers."
+        )
+
+    def _citations(self, market: MarketProfile, zip_profile: ZipCostProfile) -> dict[str, str]:
+        return {
+            "Market profile": f"Sintrix blended MLS + public record heuristics ({market.name})",
+            "ZIP cost": zip_profile.source,
+        }
+
+    def _attach_collateral(
+        self,
+        estimate: DealEstimate,
+        config: DealConfig,
+        market: MarketProfile,
+        zip_profile: ZipCostProfile,
+        comp_seeds: Sequence[CompRecordSeed],
+    ) -> None:
+        estimate.comps = comps.build_comps(estimate.property, comp_seeds)
+        estimate.repairs = repairs.build_repair_budget(estimate.property, market, zip_profile)
+        estimate.negotiation_scripts = self._negotiation_scripts(estimate.property, estimate.offers, config)
+        estimate.disclaimer = self._disclaimer()
+        estimate.citations = self._citations(market, zip_profile)
+
+    def estimate(self, subject: SubjectProperty, config: DealConfig | None = None) -> EstimationArtifacts:
+        config = config or DealConfig()
+        market = self._resolve_market(subject)
+        zip_profile = self._resolve_zip(subject, market)
+        seeds = self._comp_pools.get(subject.market_key, ())
+        return self._estimate_cached(subject, config, market, zip_profile, seeds)
+
+    def estimate_many(
+        self,
+        subjects: Iterable[SubjectProperty],
+        config: DealConfig | None = None,
+    ) -> Iterator[EstimationArtifacts | MarketNotFoundError]:
+        """Yield an estimate per subject, in input order.
+
+        Subjects are read :data:`BATCH_CHUNK_ROWS` at a time and grouped by
+        ``(market_key, postal_code)``; market, ZIP, and comp pool lookups are
+        resolved once per group. With numpy installed and no comp selection
+        settings, groups of at least :data:`COLUMNAR_MIN_ROWS` subjects get
+        their insights and offer bands from the columnar core in one pass.
+        A subject whose market or ZIP is unknown yields its
+        :class:`MarketNotFoundError` in place of an estimate.
+        """
+
+        config = config or DealConfig()
+        columnar_ok = False
+        if config.comp_limit is None and config.comp_radius_miles is None and config.comp_recency_days is None:
+            from . import columnar
+
+            columnar_ok = columnar.np is not None
+        resolved: Dict[Tuple[str, str], Tuple[MarketProfile, ZipCostProfile, Sequence[CompRecordSeed]] | MarketNotFoundError] = {}
+        iterator = iter(subjects)
+        while chunk := list(islice(iterator, BATCH_CHUNK_ROWS)):
+            groups: Dict[Tuple[str, str], list[int]] = {}
+            for index, subject in enumerate(chunk):
+                groups.setdefault((subject.market_key, subject.postal_code), []).append(index)
+            results: list[EstimationArtifacts | MarketNotFoundError | None] = [None] * len(chunk)
+            for key, indexes in groups.items():
+                group = resolved.get(key)
+                if group is None:
+                    try:
+                        market = self._resolve_market(chunk[indexes[0]])
+                        group = (market, self._resolve_zip(chunk[indexes[0]], market), self._comp_pools.get(key[0], ()))
+                    except MarketNotFoundError as exc:
+                        group = exc
+                    resolved[key] = group
+                if isinstance(group, MarketNotFoundError):
+                    for index in indexes:
+                        results[index] = group
+                elif columnar_ok and len(indexes) >= COLUMNAR_MIN_ROWS:
+                    estimated = self._estimate_group([chunk[index] for index in indexes], config, *group)
+                    for index, artifacts in zip(indexes, estimated):
+                        results[index] = artifacts
+                else:
+                    for index in indexes:
+                        results[index] = self._estimate_cached(chunk[index], config, *group)
+            yield from results  # type: ignore[misc] - every slot is filled above
+
+    def estimate_columns(
+        self,
+        columns: SubjectColumns,
+        config: DealConfig | None = None,
+    ) -> InsightColumns:
+        """Vectorized ``PropertyInsight`` values for a columnar subject batch.
+
+        Matches :meth:`estimate` to the cent; offer bands, comps, and collateral
+        are not produced. Rows with an unknown market or ZIP are left ``nan``
+        and marked invalid in ``InsightColumns.valid``. Requires numpy.
+        """
+
+        from . import columnar
+
+        config = config or DealConfig()
+        if config.comp_limit is not None or config.comp_radius_miles is not None or config.comp_recency_days is not None:
+            raise ValueError("Columnar estimation uses the full comp pool; comp selection settings are not supported.")
+        factor = self._factor_for_risk(config)
+        out = columnar.InsightColumns.empty(len(columns))
+        for market_key, postal_code, rows in columnar.group_rows(columns):
+            market = self._markets.get(market_key)
+            zip_profile = self._zip_index.resolve(postal_code, market) if market is not None else None
+            if zip_profile is None:
+                continue
+            seeds = self._comp_pools.get(market_key, ())
+            columnar.insight_block(columns, rows, config, factor, market, zip_profile, seeds, out)
+        return out
+
+    @property
+    def data_version(self) -> Hashable:
+        """Version of the reference tables this engine estimates against.
+
+        Bundled tables are versioned by their files' mtimes when this engine
+        loaded them, so the version never moves on without the tables, and
+        snapshots by their path, mtime, and size. Engines built on
+        caller-supplied tables get a version unique to the engine unless one
+        is passed to the constructor.
+        """
+
+        if self._data_version is None:
+            self._markets, self._zip_costs, self._comp_pools  # load the tables being versioned
+            versions = self._table_versions
+            self._data_version = ("bundled", versions["markets"], versions["zip_costs"], versions["comp_pools"])
+        return self._data_version
+
+    def _cache_key(self, subject: SubjectProperty, config: DealConfig) -> Tuple:
+        context: Tuple[Hashable, ...] = ()
+        if config.comp_recency_days is not None:
+            context += (date.today(),)  # recency filtering is relative to today
+        if config.include_pdf and not config.insight_only:
+            context += (str(Path.cwd()),)  # eager packets are written to the working directory
+        return estimate_key(subject, config, self.data_version, *context)
+
+    def _remember(self, key: Tuple, subject: SubjectProperty, artifacts: EstimationArtifacts) -> None:
+        assert self.cache is not None
+        self.cache.put(
+            key,
+            _CachedEstimate(_copy_estimate(artifacts.estimate, subject), artifacts._collateral, artifacts._pdf_path),
+        )
+
+    def _from_cache(self, entry: _CachedEstimate, subject: SubjectProperty, config: DealConfig) -> EstimationArtifacts:
+        estimate = _copy_estimate(entry.estimate, subject)
+        if config.insight_only:
+            pdf_target = Path.cwd() if config.include_pdf else None
+            return EstimationArtifacts(estimate=estimate, pdf_target=pdf_target, collateral=entry.collateral)
+        if entry.pdf_path is not None and Path(entry.pdf_path).exists():
+            return EstimationArtifacts(estimate=estimate, pdf_path=entry.pdf_path)
+        # the packet was removed since it was cached; names are content-addressed, so rewrite it
+        artifacts = EstimationArtifacts(estimate=estimate, pdf_target=Path.cwd() if config.include_pdf else None)
+        artifacts.pdf_path
+        return artifacts
+
+    def _estimate_cached(
+        self,
+        subject: SubjectProperty,
+        config: DealConfig,
+        market: MarketProfile,
+        zip_profile: ZipCostProfile,
+        seeds: Sequence[CompRecordSeed],
+    ) -> EstimationArtifacts:
+        if self.cache is None:
+            return self._estimate_resolved(subject, config, market, zip_profile, seeds)
+        key = self._cache_key(subject, config)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return self._from_cache(entry, subject, config)
+        artifacts = self._estimate_resolved(subject, config, market, zip_profile, seeds)
+        self._remember(key, subject, artifacts)
+        return artifacts
+
+    def _estimate_group(
+        self,
+        subjects: Sequence[SubjectProperty],
+        config: DealConfig,
+        market: MarketProfile,
+        zip_profile: ZipCostProfile,
+        seeds: Sequence[CompRecordSeed],
+    ) -> list[EstimationArtifacts]:
+        """Estimates for subjects sharing one market/ZIP, with the numbers computed column-wise.
+
+        Cache hits are served from the cache; only the misses go through the
+        columnar core, and their results are cached as usual.
+        """
+
+        from . import columnar
+
+        results: list[EstimationArtifacts | None] = [None] * len(subjects)
+        keys: list[Tuple | None] = [None] * len(subjects)
+        misses = list(range(len(subjects)))
+        if self.cache is not None:
+            misses = []
+            for index, subject in enumerate(subjects):
+                keys[index] = self._cache_key(subject, config)
+                entry = self.cache.get(keys[index])
+                if entry is None:
+                    misses.append(index)
+                else:
+                    results[index] = self._from_cache(entry, subject, config)
+        if misses:
+            columns = columnar.SubjectColumns.from_subjects([subjects[index] for index in misses])
+            out = columnar.InsightColumns.empty(len(misses))
+            mao, as_is = columnar.insight_block(
+                columns, columnar.np.arange(len(misses)), config, self._factor_for_risk(config), market, zip_profile, seeds, out
+            )
+            aggressive, target, safe = (prices.tolist() for prices in columnar.offer_prices(mao, as_is))
+            for position, (index, insight) in enumerate(zip(misses, out.insights())):
+                subject = subjects[index]
+                offers = self._priced_bands(aggressive[position], target[position], safe[position], insight.mao)
+                artifacts = self._assemble(subject, config, market, zip_profile, seeds, insight, offers)
+                if self.cache is not None:
+                    self._remember(keys[index], subject, artifacts)
+                results[index] = artifacts
+        return results  # type: ignore[return-value] - every slot is filled above
+
+    def _estimate_resolved(
+        self,
+        subject: SubjectProperty,
+        config: DealConfig,
+        market: MarketProfile,
+        zip_profile: ZipCostProfile,
+        seeds: Sequence[CompRecordSeed],
+    ) -> EstimationArtifacts:
+        if config.comp_limit is None and config.comp_radius_miles is None and config.comp_recency_days is None:
+            selected = seeds
+            pool = self._comp_pool(subject.market_key, seeds)
+        else:
+            selected = self._comp_index(subject.market_key, seeds).select(
+                subject,
+                k=config.comp_limit,
+                radius_miles=config.comp_radius_miles,
+                recency_days=config.comp_recency_days,
+            )
+            pool = comps.CompPool(selected)
+        adjusted_prices = pool.adjusted_prices(subject) or [subject.square_feet * market.price_per_sqft_turnkey]
+
+        arv_from_market = subject.square_feet * market.price_per_sqft_turnkey * market.demand_index
+        arv_from_comps = mean(adjusted_prices)
+        arv = (0.55 * arv_from_market) + (0.45 * arv_from_comps)
+
+        as_is = arv * market.condition_adjustment.get(subject.condition, 0.8)
+
+        if config.repair_override is not None:
+            repair_total = config.repair_override
+        else:
+            repair_total = repairs.repair_total(subject, market, zip_profile)
+
+        closing_rate = config.closing_cost_rate or market.closing_cost_rate
+        holding_months = config.holding_months or market.holding_months
+        holding_cost = as_is * market.holding_cost_rate * holding_months
+        closing_cost = arv * closing_rate
+
+        assignment_fee = config.assignment_fee_override or max(
+            config.strategy.fee_floor,
+            min(config.strategy.fee_ceiling or float("inf"), max(config.strategy.assignment_fee, arv * market.wholesale_fee_rate)),
+        )
+
+        factor = self._factor_for_risk(config)
+        mao = max(0.0, (arv * factor) - repair_total - assignment_fee - closing_cost - holding_cost)
+        offers = self._offer_bands(mao, as_is, config)
+
+        projected_profit = max(0.0, arv - (offers[1].offer_price + repair_total + closing_cost + holding_cost + assignment_fee))
+
+        insight = PropertyInsight(
+            arv=round(arv, 2),
+            as_is=round(as_is, 2),
+            repair_budget=round(repair_total, 2),
+            closing_costs=round(closing_cost, 2),
+            holding_costs=round(holding_cost, 2),
+            assignment_fee=round(assignment_fee, 2),
+            mao=round(mao, 2),
+            projected_profit=round(projected_profit, 2),
+            demand_score=round(market.demand_index, 2),
+        )
+        return self._assemble(subject, config, market, zip_profile, selected, insight, offers)
+
+    def _assemble(
+        self,
+        subject: SubjectProperty,
+        config: DealConfig,
+        market: MarketProfile,
+        zip_profile: ZipCostProfile,
+        comp_seeds: Sequence[CompRecordSeed],
+        insight: PropertyInsight,
+        offers: list[OfferBand],
+    ) -> EstimationArtifacts:
+        market_trend = MarketTrend(
+            postal_code=subject.postal_code,
+            median_dom=zip_profile.dom_days,
+            average_discount=zip_profile.discount_rate,
+            absorption_rate=zip_profile.absorption_rate,
+            source=zip_profile.source,
+        )
+        estimate = DealEstimate(
+            property=subject,
+            insight=insight,
+            offers=offers,
+            comps=[],
+            repairs=[],
+            market_trends=[market_trend],
+            negotiation_scripts=[],
+            disclaimer="",
+            citations={},
+        )
+
+        pdf_target = Path.cwd() if config.include_pdf else None
+        collateral = partial(
+            self._attach_collateral,
+            config=config,
+            market=market,
+            zip_profile=zip_profile,
+            comp_seeds=comp_seeds,
+        )
+        if config.insight_only:
+            return EstimationArtifacts(estimate=estimate, pdf_target=pdf_target, collateral=collateral)
+
+        collateral(estimate)
+        artifacts = EstimationArtifacts(estimate=estimate, pdf_target=pdf_target)
+        artifacts.pdf_path  # eager PDFs are written now, not on first access
+        return artifacts
+
+
+__all__ = ["EstimationEngine", "EstimationArtifacts", "MarketNotFoundError"]
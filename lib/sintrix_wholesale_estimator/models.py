@@ -1,178 +1,323 @@
-diff --git a/sintrix_wholesale_estimator/models.py b/sintrix_wholesale_estimator/models.py
-new file mode 100644
-index 0000000000000000000000000000000000000000..69d149132ac07d132a498bf009f8ebb80b988190
---- /dev/null
-+++ b/sintrix_wholesale_estimator/models.py
-@@ -0,0 +1,172 @@
-+"""Dataclasses describing the Sourcer domain model."""
-+from __future__ import annotations
-+
-+from dataclasses import dataclass, field
-+from datetime import date
-+from typing import Dict, Iterable, List, Optional
-+
-+
-+@dataclass(slots=True)
-+class SubjectProperty:
-+    """Normalized representation of the subject property."""
-+
-+    address: str
-+    city: str
-+    state: str
-+    postal_code: str
-+    square_feet: float
-+    beds: float
-+    baths: float
-+    year_built: Optional[int] = None
-+    lot_square_feet: Optional[float] = None
-+    condition: str = "light_rehab"
-+    property_type: str = "single_family"
-+    listing_url: Optional[str] = None
-+
-+    @property
-+    def market_key(self) -> str:
-+        return f"{self.city}, {self.state}".strip().replace("  ", " ")
-+
-+
-+@dataclass(slots=True)
-+class AssignmentStrategy:
-+    """Configuration for assignment fee calculations."""
-+
-+    factor: float = 0.65
-+    assignment_fee: float = 10000.0
-+    fee_floor: float = 4500.0
-+    fee_ceiling: Optional[float] = None
-+
-+    def clamp_factor(self) -> None:
-+        self.factor = max(0.55, min(self.factor, 0.75))
-+
-+
-+@dataclass(slots=True)
-+class DealConfig:
-+    """Configuration values used across the estimation workflow."""
-+
-+    strategy: AssignmentStrategy = field(default_factory=AssignmentStrategy)
-+    risk_profile: str = "balanced"  # aggressive | balanced | conservative
-+    repair_override: Optional[float] = None
-+    closing_cost_rate: Optional[float] = None
-+    holding_months: Optional[float] = None
-+    assignment_fee_override: Optional[float] = None
-+    include_pdf: bool = True
-+
-+    def __post_init__(self) -> None:
-+        self.strategy.clamp_factor()
-+        self.risk_profile = self.risk_profile.lower()
-+
-+
-+@dataclass(slots=True)
-+class CompAdjustment:
-+    """Adjustments applied to a comparable sale."""
-+
-+    label: str
-+    amount: float
-+
-+
-+@dataclass(slots=True)
-+class CompRecord:
-+    """Comparable sale information with adjustments."""
-+
-+    address: str
-+    postal_code: str
-+    sold_price: float
-+    sold_date: date
-+    square_feet: float
-+    beds: float
-+    baths: float
-+    distance_miles: float
-+    dom: int
-+    adjustments: List[CompAdjustment] = field(default_factory=list)
-+
-+    @property
-+    def adjusted_price(self) -> float:
-+        return self.sold_price + sum(adj.amount for adj in self.adjustments)
-+
-+
-+@dataclass(slots=True)
-+class RepairLineItem:
-+    """Line item representing a repair scope."""
-+
-+    trade: str
-+    description: str
-+    quantity: float
-+    unit: str
-+    labor_rate: float
-+    material_rate: float
-+    cost: float
-+
-+
-+@dataclass(slots=True)
-+class OfferBand:
-+    """Offer recommendation bucket."""
-+
-+    label: str
-+    offer_price: float
-+    mao: float
-+    rationale: str
-+
-+
-+@dataclass(slots=True)
-+class MarketTrend:
-+    """Market-level stats for DOM and discounting."""
-+
-+    postal_code: str
-+    median_dom: float
-+    average_discount: float
-+    absorption_rate: float
-+    source: str
-+
-+
-+@dataclass(slots=True)
-+class NegotiationScript:
-+    """Negotiation talking points tailored to the scenario."""
-+
-+    title: str
-+    body: str
-+
-+
-+@dataclass(slots=True)
-+class PropertyInsight:
-+    """High level summary of the subject property and market."""
-+
-+    arv: float
-+    as_is: float
-+    repair_budget: float
-+    closing_costs: float
-+    holding_costs: float
-+    assignment_fee: float
-+    mao: float
-+    projected_profit: float
-+    demand_score: float
-+
-+
-+@dataclass(slots=True)
-+class DealEstimate:
-+    """Complete estimation output."""
-+
-+    property: SubjectProperty
-+    insight: PropertyInsight
-+    offers: List[OfferBand]
-+    comps: List[CompRecord]
-+    repairs: List[RepairLineItem]
-+    market_trends: List[MarketTrend]
-+    negotiation_scripts: List[NegotiationScript]
-+    disclaimer: str
-+    citations: Dict[str, str]
-+
-+
-+@dataclass(slots=True)
-+class PipelineRecord:
-+    """Saved deal state for CRM/pipeline sync."""
-+
-+    property: SubjectProperty
-+    insight: PropertyInsight
-+    created_at: date
-+    tags: Iterable[str] = field(default_factory=list)
-+    crm_url: Optional[str] = None
-+
-+
-+__all__ = [name for name in globals() if not name.startswith("_")]
+"""Dataclasses describing the Sourcer domain model."""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Protocol
+
+
+class SupportsToDict(Protocol):
+    """A model with a hand-written ``to_dict``.
+
+    ``to_dict`` returns JSON-ready values (dates as ISO strings) with the same
+    keys and order as ``dataclasses.asdict``, without the recursive deep copy.
+    """
+
+    def to_dict(self) -> Dict[str, Any]: ...
+
+
+class _Serializable:
+    """Adds ``to_json`` to models that define ``to_dict`` (see :class:`SupportsToDict`)."""
+
+    __slots__ = ()
+
+    def to_json(self: SupportsToDict, **kwargs: Any) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+@dataclass(slots=True)
+class SubjectProperty(_Serializable):
+    """Normalized representation of the subject property."""
+
+    address: str
+    city: str
+    state: str
+    postal_code: str
+    square_feet: float
+    beds: float
+    baths: float
+    year_built: Optional[int] = None
+    lot_square_feet: Optional[float] = None
+    condition: str = "light_rehab"
+    property_type: str = "single_family"
+    listing_url: Optional[str] = None
+
+    @property
+    def market_key(self) -> str:
+        return f"{self.city}, {self.state}".strip().replace("  ", " ")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "city": self.city,
+            "state": self.state,
+            "postal_code": self.postal_code,
+            "square_feet": self.square_feet,
+            "beds": self.beds,
+            "baths": self.baths,
+            "year_built": self.year_built,
+            "lot_square_feet": self.lot_square_feet,
+            "condition": self.condition,
+            "property_type": self.property_type,
+            "listing_url": self.listing_url,
+        }
+
+
+@dataclass(slots=True)
+class AssignmentStrategy(_Serializable):
+    """Configuration for assignment fee calculations."""
+
+    factor: float = 0.65
+    assignment_fee: float = 10000.0
+    fee_floor: float = 4500.0
+    fee_ceiling: Optional[float] = None
+
+    def clamp_factor(self) -> None:
+        self.factor = max(0.55, min(self.factor, 0.75))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "factor": self.factor,
+            "assignment_fee": self.assignment_fee,
+            "fee_floor": self.fee_floor,
+            "fee_ceiling": self.fee_ceiling,
+        }
+
+
+@dataclass(slots=True)
+class DealConfig(_Serializable):
+    """Configuration values used across the estimation workflow."""
+
+    strategy: AssignmentStrategy = field(default_factory=AssignmentStrategy)
+    risk_profile: str = "balanced"  # aggressive | balanced | conservative
+    repair_override: Optional[float] = None
+    closing_cost_rate: Optional[float] = None
+    holding_months: Optional[float] = None
+    assignment_fee_override: Optional[float] = None
+    include_pdf: bool = True
+    comp_limit: Optional[int] = None  # keep only the k most similar comps
+    comp_radius_miles: Optional[float] = None
+    comp_recency_days: Optional[int] = None
+    insight_only: bool = False  # defer comp records, scripts, citations, text and PDF until first access
+
+    def __post_init__(self) -> None:
+        self.strategy.clamp_factor()
+        self.risk_profile = self.risk_profile.lower()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DealConfig":
+        """Inverse of :meth:`to_dict`; ``strategy`` may be omitted or partial."""
+
+        values = dict(data)
+        values["strategy"] = AssignmentStrategy(**values.get("strategy", {}))
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy.to_dict(),
+            "risk_profile": self.risk_profile,
+            "repair_override": self.repair_override,
+            "closing_cost_rate": self.closing_cost_rate,
+            "holding_months": self.holding_months,
+            "assignment_fee_override": self.assignment_fee_override,
+            "include_pdf": self.include_pdf,
+            "comp_limit": self.comp_limit,
+            "comp_radius_miles": self.comp_radius_miles,
+            "comp_recency_days": self.comp_recency_days,
+            "insight_only": self.insight_only,
+        }
+
+
+@dataclass(slots=True)
+class CompAdjustment(_Serializable):
+    """Adjustments applied to a comparable sale."""
+
+    label: str
+    amount: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"label": self.label, "amount": self.amount}
+
+
+@dataclass(slots=True)
+class CompRecord(_Serializable):
+    """Comparable sale information with adjustments."""
+
+    address: str
+    postal_code: str
+    sold_price: float
+    sold_date: date
+    square_feet: float
+    beds: float
+    baths: float
+    distance_miles: float
+    dom: int
+    adjustments: List[CompAdjustment] = field(default_factory=list)
+    adjusted_price: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        # computed once; rebuild the record rather than editing adjustments in place
+        self.adjusted_price = self.sold_price + sum(adj.amount for adj in self.adjustments)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "postal_code": self.postal_code,
+            "sold_price": self.sold_price,
+            "sold_date": self.sold_date.isoformat(),
+            "square_feet": self.square_feet,
+            "beds": self.beds,
+            "baths": self.baths,
+            "distance_miles": self.distance_miles,
+            "dom": self.dom,
+            "adjustments": [{"label": adj.label, "amount": adj.amount} for adj in self.adjustments],
+            "adjusted_price": self.adjusted_price,
+        }
+
+
+@dataclass(slots=True)
+class RepairLineItem(_Serializable):
+    """Line item representing a repair scope."""
+
+    trade: str
+    description: str
+    quantity: float
+    unit: str
+    labor_rate: float
+    material_rate: float
+    cost: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trade": self.trade,
+            "description": self.description,
+            "quantity": self.quantity,
+            "unit": self.unit,
+            "labor_rate": self.labor_rate,
+            "material_rate": self.material_rate,
+            "cost": self.cost,
+        }
+
+
+@dataclass(slots=True)
+class OfferBand(_Serializable):
+    """Offer recommendation bucket."""
+
+    label: str
+    offer_price: float
+    mao: float
+    rationale: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"label": self.label, "offer_price": self.offer_price, "mao": self.mao, "rationale": self.rationale}
+
+
+@dataclass(slots=True)
+class MarketTrend(_Serializable):
+    """Market-level stats for DOM and discounting."""
+
+    postal_code: str
+    median_dom: float
+    average_discount: float
+    absorption_rate: float
+    source: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "postal_code": self.postal_code,
+            "median_dom": self.median_dom,
+            "average_discount": self.average_discount,
+            "absorption_rate": self.absorption_rate,
+            "source": self.source,
+        }
+
+
+@dataclass(slots=True)
+class NegotiationScript(_Serializable):
+    """Negotiation talking points tailored to the scenario."""
+
+    title: str
+    body: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"title": self.title, "body": self.body}
+
+
+@dataclass(slots=True)
+class PropertyInsight(_Serializable):
+    """High level summary of the subject property and market."""
+
+    arv: float
+    as_is: float
+    repair_budget: float
+    closing_costs: float
+    holding_costs: float
+    assignment_fee: float
+    mao: float
+    projected_profit: float
+    demand_score: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "arv": self.arv,
+            "as_is": self.as_is,
+            "repair_budget": self.repair_budget,
+            "closing_costs": self.closing_costs,
+            "holding_costs": self.holding_costs,
+            "assignment_fee": self.assignment_fee,
+            "mao": self.mao,
+            "projected_profit": self.projected_profit,
+            "demand_score": self.demand_score,
+        }
+
+
+@dataclass(slots=True)
+class DealEstimate(_Serializable):
+    """Complete estimation output."""
+
+    property: SubjectProperty
+    insight: PropertyInsight
+    offers: List[OfferBand]
+    comps: List[CompRecord]
+    repairs: List[RepairLineItem]
+    market_trends: List[MarketTrend]
+    negotiation_scripts: List[NegotiationScript]
+    disclaimer: str
+    citations: Dict[str, str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "property": self.property.to_dict(),
+            "insight": self.insight.to_dict(),
+            "offers": [offer.to_dict() for offer in self.offers],
+            "comps": [comp.to_dict() for comp in self.comps],
+            "repairs": [item.to_dict() for item in self.repairs],
+            "market_trends": [trend.to_dict() for trend in self.market_trends],
+            "negotiation_scripts": [script.to_dict() for script in self.negotiation_scripts],
+            "disclaimer": self.disclaimer,
+            "citations": dict(self.citations),
+        }
+
+
+@dataclass(slots=True)
+class PipelineRecord(_Serializable):
+    """Saved deal state for CRM/pipeline sync."""
+
+    property: SubjectProperty
+    insight: PropertyInsight
+    created_at: date
+    tags: Iterable[str] = field(default_factory=list)
+    crm_url: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "property": self.property.to_dict(),
+            "insight": self.insight.to_dict(),
+            "created_at": self.created_at.isoformat(),
+            "tags": list(self.tags),
+            "crm_url": self.crm_url,
+        }
+
+
+__all__ = [name for name in globals() if not name.startswith("_")]
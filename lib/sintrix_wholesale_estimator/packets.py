@@ -0,0 +1,179 @@
+"""Offer packet files: unique naming and bulk rendering across processes."""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Deque, Iterable, Iterator, Tuple, TypeVar
+
+from .models import DealEstimate
+from .reporting import SummaryValues, generate_pdf
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from concurrent.futures import Future
+
+DEFAULT_TEMPLATE = "sourcer_offer_{digest}.pdf"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.casefold()).strip("-") or "property"
+
+
+def render_packet(estimate: DealEstimate, compress: bool = False, values: SummaryValues | None = None) -> bytes:
+    buffer = io.BytesIO()
+    generate_pdf(estimate, buffer, compress=compress, values=values)
+    return buffer.getvalue()
+
+
+def packet_name(estimate: DealEstimate, content: bytes, index: int = 0, template: str = DEFAULT_TEMPLATE) -> str:
+    """File name for a rendered packet.
+
+    ``template`` may use ``{digest}`` (hash of the PDF bytes), ``{index}``
+    (position in the batch), ``{postal_code}``, and ``{slug}`` (the address
+    lower-cased with runs of other characters collapsed to ``-``).
+    """
+
+    name = template.format(
+        digest=hashlib.sha256(content).hexdigest()[:16],
+        index=index,
+        postal_code=estimate.property.postal_code,
+        slug=_slug(estimate.property.address),
+    )
+    if not name or Path(name).name != name:
+        raise ValueError(f"Packet template must produce a bare file name, got {name!r}")
+    return name
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    staging = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    staging.write_bytes(content)
+    os.replace(staging, path)
+
+
+def write_packet(
+    estimate: DealEstimate,
+    directory: Path,
+    index: int = 0,
+    template: str = DEFAULT_TEMPLATE,
+    compress: bool = False,
+    values: SummaryValues | None = None,
+) -> Path:
+    """Render ``estimate`` into ``directory`` and return the packet path.
+
+    The file is written under a temporary name and renamed into place, so
+    concurrent writers never leave a partially written packet behind.
+    """
+
+    content = render_packet(estimate, compress, values)
+    path = Path(directory) / packet_name(estimate, content, index, template)
+    _write_atomic(path, content)
+    return path
+
+
+def _render_named(task: Tuple[int, DealEstimate, str, bool]) -> Tuple[str, bytes]:
+    index, estimate, template, compress = task
+    content = render_packet(estimate, compress)
+    return packet_name(estimate, content, index, template), content
+
+
+def _write_task(task: Tuple[int, DealEstimate, str, Path, bool]) -> Path:
+    index, estimate, template, directory, compress = task
+    return write_packet(estimate, directory, index, template, compress)
+
+
+def _bounded_map(
+    function: Callable[[T], R],
+    tasks: Iterable[T],
+    workers: int | None,
+    window: int | None,
+) -> Iterator[R]:
+    """Ordered ``map`` over a process pool with at most ``window`` tasks in flight.
+
+    Unlike ``Executor.map``, the task iterable is consumed lazily, so neither
+    the inputs nor the results of a large batch are held in memory at once.
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        yield from map(function, tasks)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    window = window or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = deque()
+        for task in tasks:
+            pending.append(executor.submit(function, task))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def generate_packets(
+    estimates: Iterable[DealEstimate],
+    directory: Path,
+    *,
+    template: str = DEFAULT_TEMPLATE,
+    compress: bool = False,
+    workers: int | None = None,
+    window: int | None = None,
+) -> Iterator[Path]:
+    """Render one PDF per estimate into ``directory``, yielding paths in input order.
+
+    Rendering fans out over ``workers`` processes (all cores by default; 0 or
+    1 renders in this process). Workers write their own files, so only paths
+    travel back to the caller. ``compress`` Flate-compresses page content.
+    """
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    tasks = ((index, estimate, template, directory, compress) for index, estimate in enumerate(estimates))
+    yield from _bounded_map(_write_task, tasks, workers, window)
+
+
+def generate_packet_archive(
+    estimates: Iterable[DealEstimate],
+    archive: Path,
+    *,
+    template: str = DEFAULT_TEMPLATE,
+    compress: bool = False,
+    workers: int | None = None,
+    window: int | None = None,
+) -> Path:
+    """Render one PDF per estimate into a single zip archive and return its path.
+
+    Packets that render to an identical name (for example the same content
+    under the default template) are stored once.
+    """
+
+    import zipfile
+
+    archive = Path(archive)
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    tasks = ((index, estimate, template, compress) for index, estimate in enumerate(estimates))
+    seen: set[str] = set()
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for name, content in _bounded_map(_render_named, tasks, workers, window):
+            if name not in seen:
+                seen.add(name)
+                bundle.writestr(name, content)
+    return archive
+
+
+__all__ = [
+    "DEFAULT_TEMPLATE",
+    "generate_packet_archive",
+    "generate_packets",
+    "packet_name",
+    "render_packet",
+    "write_packet",
+]
@@ -1,97 +1,441 @@
-diff --git a/sintrix_wholesale_estimator/pipeline.py b/sintrix_wholesale_estimator/pipeline.py
-new file mode 100644
-index 0000000000000000000000000000000000000000..20b69034721b36433fe277d57475faf3931a907c
---- /dev/null
-+++ b/sintrix_wholesale_estimator/pipeline.py
-@@ -0,0 +1,91 @@
-+"""Pipeline persistence helpers."""
-+from __future__ import annotations
-+
-+import csv
-+import json
-+from dataclasses import asdict
-+from datetime import UTC, date, datetime
-+from pathlib import Path
-+from typing import Iterable, List, Optional
-+from urllib import request
-+
-+from .models import DealEstimate, PipelineRecord, SubjectProperty
-+
-+DEFAULT_PIPELINE_DIR = Path.home() / ".sintrix"
-+DEFAULT_PIPELINE_PATH = DEFAULT_PIPELINE_DIR / "pipeline.json"
-+DEFAULT_EXPORT_PATH = DEFAULT_PIPELINE_DIR / "pipeline.csv"
-+
-+
-+def _ensure_directory(path: Path) -> None:
-+    path.mkdir(parents=True, exist_ok=True)
-+
-+
-+class PipelineStore:
-+    """Lightweight persistence for saved deals."""
-+
-+    def __init__(self, path: Path | None = None) -> None:
-+        self.path = path or DEFAULT_PIPELINE_PATH
-+        _ensure_directory(self.path.parent)
-+
-+    def _load(self) -> List[dict]:
-+        if not self.path.exists():
-+            return []
-+        return json.loads(self.path.read_text())
-+
-+    def _dump(self, payload: List[dict]) -> None:
-+        self.path.write_text(json.dumps(payload, indent=2, default=str))
-+
-+    def save(self, estimate: DealEstimate, tags: Optional[Iterable[str]] = None) -> PipelineRecord:
-+        record = PipelineRecord(
-+            property=estimate.property,
-+            insight=estimate.insight,
-+            created_at=date.today(),
-+            tags=tuple(tags or ()),
-+        )
-+        payload = self._load()
-+        payload.append(asdict(record))
-+        self._dump(payload)
-+        return record
-+
-+    def export_csv(self, destination: Path | None = None) -> Path:
-+        destination = destination or DEFAULT_EXPORT_PATH
-+        _ensure_directory(destination.parent)
-+        rows = self._load()
-+        if not rows:
-+            destination.write_text("property_address,city,state,postal_code,mao,arv,created_at\n")
-+            return destination
-+
-+        with destination.open("w", newline="") as handle:
-+            writer = csv.writer(handle)
-+            writer.writerow(["property_address", "city", "state", "postal_code", "mao", "arv", "created_at"])
-+            for row in rows:
-+                prop = row["property"]
-+                insight = row["insight"]
-+                writer.writerow(
-+                    [
-+                        prop["address"],
-+                        prop["city"],
-+                        prop["state"],
-+                        prop["postal_code"],
-+                        insight["mao"],
-+                        insight["arv"],
-+                        row["created_at"],
-+                    ]
-+                )
-+        return destination
-+
-+    def send_webhook(self, estimate: DealEstimate, url: str, timeout: float = 5.0) -> int:
-+        body = json.dumps(
-+            {
-+                "property": asdict(estimate.property),
-+                "insight": asdict(estimate.insight),
-+                "offers": [asdict(offer) for offer in estimate.offers],
-+                "timestamp": datetime.now(UTC).isoformat(),
-+            }
-+        ).encode()
-+        req = request.Request(url, data=body, headers={"Content-Type": "application/json"})
-+        with request.urlopen(req, timeout=timeout) as response:  # pragma: no cover - network
-+            return response.getcode()
-+
-+
-+__all__ = ["PipelineStore"]
+"""Pipeline persistence helpers."""
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+import os
+import re
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib import request
+
+from .models import DealEstimate, PipelineRecord, SubjectProperty
+from .webhooks import DeliveryResult, WebhookSender, webhook_payload
+
+DEFAULT_PIPELINE_DIR = Path.home() / ".sintrix"
+DEFAULT_PIPELINE_PATH = DEFAULT_PIPELINE_DIR / "pipeline.json"
+DEFAULT_EXPORT_PATH = DEFAULT_PIPELINE_DIR / "pipeline.csv"
+DEFAULT_SQLITE_PATH = DEFAULT_PIPELINE_DIR / "pipeline.sqlite3"
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+JOURNAL_SUFFIX = ".journal"
+COMPACT_EVERY = 1000
+FETCH_SIZE = 500
+
+EXPORT_COLUMNS: Dict[str, Callable[[dict], object]] = {
+    "property_address": lambda row: row["property"]["address"],
+    "city": lambda row: row["property"]["city"],
+    "state": lambda row: row["property"]["state"],
+    "postal_code": lambda row: row["property"]["postal_code"],
+    "square_feet": lambda row: row["property"]["square_feet"],
+    "beds": lambda row: row["property"]["beds"],
+    "baths": lambda row: row["property"]["baths"],
+    "condition": lambda row: row["property"]["condition"],
+    "property_type": lambda row: row["property"]["property_type"],
+    "arv": lambda row: row["insight"]["arv"],
+    "as_is": lambda row: row["insight"]["as_is"],
+    "repair_budget": lambda row: row["insight"]["repair_budget"],
+    "mao": lambda row: row["insight"]["mao"],
+    "projected_profit": lambda row: row["insight"]["projected_profit"],
+    "assignment_fee": lambda row: row["insight"]["assignment_fee"],
+    "created_at": lambda row: row["created_at"],
+    "tags": lambda row: ";".join(row["tags"]),
+    "crm_url": lambda row: row["crm_url"] or "",
+}
+DEFAULT_EXPORT_COLUMNS = ("property_address", "city", "state", "postal_code", "mao", "arv", "created_at")
+
+_SNAPSHOT_SEQ = re.compile(rb'^\{\s*"seq":\s*(\d+)')
+
+
+def _ensure_directory(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def _new_record(estimate: DealEstimate, tags: Optional[Iterable[str]]) -> PipelineRecord:
+    return PipelineRecord(
+        property=estimate.property,
+        insight=estimate.insight,
+        created_at=date.today(),
+        tags=tuple(tags or ()),
+    )
+
+
+class BasePipelineStore(ABC):
+    """Behaviour shared by every pipeline backend: CSV export and webhook delivery.
+
+    Backends store deals under :attr:`path` and provide :meth:`save`,
+    :meth:`compact`, and a streaming :meth:`_iter_records`.
+    """
+
+    path: Path
+
+    @abstractmethod
+    def save(self, estimate: DealEstimate, tags: Optional[Iterable[str]] = None) -> PipelineRecord:
+        """Persist ``estimate`` as a new pipeline record."""
+
+    @abstractmethod
+    def compact(self) -> None:
+        """Reclaim space left by earlier writes."""
+
+    @abstractmethod
+    def _iter_records(self) -> Iterator[dict]:
+        """Stream saved records, oldest first."""
+
+    def _load(self) -> List[dict]:
+        return list(self._iter_records())
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "BasePipelineStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def export_csv(
+        self,
+        destination: Path | None = None,
+        columns: Sequence[str] = DEFAULT_EXPORT_COLUMNS,
+        where: Callable[[dict], bool] | None = None,
+        compress: bool | None = None,
+    ) -> Path:
+        """Stream saved deals to a CSV file without loading the whole pipeline.
+
+        ``columns`` picks from :data:`EXPORT_COLUMNS`, ``where`` keeps only the
+        records it returns true for, and ``compress`` gzips the output (the
+        default is to gzip when ``destination`` ends in ``.gz``).
+        """
+
+        destination = destination or DEFAULT_EXPORT_PATH
+        unknown = [column for column in columns if column not in EXPORT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+        getters = [EXPORT_COLUMNS[column] for column in columns]
+        if compress is None:
+            compress = destination.suffix == ".gz"
+        _ensure_directory(destination.parent)
+
+        handle: IO[str]
+        if compress:
+            handle = gzip.open(destination, "wt", newline="")
+        else:
+            handle = destination.open("w", newline="")
+        with handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            records = self._iter_records()
+            if where is not None:
+                records = filter(where, records)
+            writer.writerows([getter(row) for getter in getters] for row in records)
+        return destination
+
+    @property
+    def outbox_path(self) -> Path:
+        return self.path.with_name("webhook_outbox.jsonl")
+
+    @property
+    def dead_letter_path(self) -> Path:
+        return self.path.with_name("webhook_dead_letter.jsonl")
+
+    def send_webhook(self, estimate: DealEstimate, url: str, timeout: float = 5.0) -> int:
+        body = json.dumps(webhook_payload(estimate)).encode()
+        req = request.Request(url, data=body, headers={"Content-Type": "application/json"})
+        with request.urlopen(req, timeout=timeout) as response:  # pragma: no cover - network
+            return response.getcode()
+
+    def deliver_webhooks(self, estimates: Iterable[DealEstimate], url: str, **options: object) -> DeliveryResult:
+        """Deliver ``estimates`` with a :class:`WebhookSender`, queueing failures in :attr:`outbox_path`.
+
+        Deals the endpoint rejects outright go to :attr:`dead_letter_path`.
+        Deals left in the outbox by earlier runs are retried afterwards.
+        ``options`` are passed to the sender (``workers``, ``batch_size``,
+        ``retries``, ...).
+        """
+
+        with WebhookSender(
+            url, outbox=self.outbox_path, dead_letter=self.dead_letter_path, **options  # type: ignore[arg-type]
+        ) as sender:
+            result = sender.send(webhook_payload(estimate) for estimate in estimates)
+            if result.delivered:
+                sender.redeliver()
+        return result
+
+
+class PipelineStore(BasePipelineStore):
+    """Lightweight persistence for saved deals.
+
+    ``save`` appends one JSON line to a journal beside ``path``, so its cost
+    does not grow with the pipeline and a torn write can only lose the record
+    being written. Every ``compact_every`` saves the journal is folded into
+    ``path``. Journal entries carry a sequence number and the compacted file
+    records the last one it holds, so a crash mid-compaction never duplicates
+    records. Assumes a single writer process.
+    """
+
+    def __init__(self, path: Path | None = None, compact_every: int = COMPACT_EVERY) -> None:
+        self.path = path or DEFAULT_PIPELINE_PATH
+        self.journal_path = self.path.with_name(self.path.name + JOURNAL_SUFFIX)
+        self.compact_every = compact_every
+        self._journal_state: Optional[Tuple[int, int]] = None  # (entries, last seq)
+        self._lock = threading.Lock()
+        _ensure_directory(self.path.parent)
+
+    def _snapshot_seq(self) -> int:
+        if not self.path.exists():
+            return 0
+        with self.path.open("rb") as handle:
+            match = _SNAPSHOT_SEQ.match(handle.read(64))
+        return int(match.group(1)) if match else 0
+
+    def _snapshot_records(self) -> Iterator[dict]:
+        """Stream records from the compacted file, one line at a time."""
+
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as handle:
+            first = handle.readline()
+            if not _SNAPSHOT_SEQ.match(first):  # written before the journal existed
+                handle.seek(0)
+                yield from json.load(handle)
+                return
+            if first.rstrip().endswith(b"}"):  # whole snapshot on one line
+                yield from json.loads(first)["records"]
+                return
+            for line in handle:
+                line = line.rstrip().rstrip(b",")
+                if line and line != b"]}":
+                    yield json.loads(line)
+
+    def _read_journal(self) -> Iterator[Tuple[int, dict]]:
+        if not self.journal_path.exists():
+            return
+        with self.journal_path.open("rb") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except ValueError:  # torn write from an interrupted save
+                    continue
+                yield entry["seq"], entry["record"]
+
+    def _journal_position(self) -> Tuple[int, int]:
+        if self._journal_state is None:
+            entries, last = 0, self._snapshot_seq()
+            for seq, _ in self._read_journal():
+                entries, last = entries + 1, max(last, seq)
+            self._journal_state = (entries, last)
+        return self._journal_state
+
+    def _iter_records(self) -> Iterator[dict]:
+        seq = self._snapshot_seq()
+        yield from self._snapshot_records()
+        for entry_seq, record in self._read_journal():
+            if entry_seq > seq:
+                yield record
+
+    def _append(self, line: bytes) -> None:
+        with self.journal_path.open("a+b") as handle:
+            if handle.tell():
+                handle.seek(-1, os.SEEK_END)
+                if handle.read(1) != b"\n":
+                    line = b"\n" + line  # isolate a torn line left by a crash
+            handle.write(line)
+
+    def save(self, estimate: DealEstimate, tags: Optional[Iterable[str]] = None) -> PipelineRecord:
+        record = _new_record(estimate, tags)
+        with self._lock:
+            if not self.path.exists():
+                self._write_snapshot(0, [])
+            entries, last = self._journal_position()
+            entry = {"seq": last + 1, "record": record.to_dict()}
+            self._append(json.dumps(entry).encode() + b"\n")
+            self._journal_state = (entries + 1, last + 1)
+            if entries + 1 >= self.compact_every:
+                self._compact()
+        return record
+
+    def compact(self) -> None:
+        """Fold the journal into the pipeline file and start a fresh journal."""
+
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        _, last = self._journal_position()
+        self._write_snapshot(last, self._iter_records())
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_state = (0, last)
+
+    def _write_snapshot(self, seq: int, records: Iterable[dict]) -> None:
+        # One record per line inside the JSON array, so readers can stream it.
+        staging = self.path.with_name(f".{self.path.name}.tmp")
+        with staging.open("w") as handle:
+            handle.write(f'{{"seq": {seq}, "records": [\n')
+            separator = ""
+            for record in records:
+                handle.write(separator + json.dumps(record, default=str))
+                separator = ",\n"
+            handle.write("\n]}\n")
+        os.replace(staging, self.path)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deals (
+    id INTEGER PRIMARY KEY,
+    postal_code TEXT NOT NULL,
+    city TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    mao REAL NOT NULL,
+    arv REAL NOT NULL,
+    spread REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deals_postal_code ON deals (postal_code);
+CREATE INDEX IF NOT EXISTS deals_market ON deals (city, state);
+CREATE INDEX IF NOT EXISTS deals_created_at ON deals (created_at);
+CREATE INDEX IF NOT EXISTS deals_mao ON deals (mao);
+CREATE INDEX IF NOT EXISTS deals_arv ON deals (arv);
+CREATE INDEX IF NOT EXISTS deals_spread ON deals (spread);
+CREATE TABLE IF NOT EXISTS deal_tags (
+    tag TEXT NOT NULL,
+    deal_id INTEGER NOT NULL REFERENCES deals (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, deal_id)
+) WITHOUT ROWID;
+"""
+
+
+class SqlitePipelineStore(BasePipelineStore):
+    """Pipeline persistence in a SQLite database.
+
+    Each deal is one row holding the full record as JSON plus indexed columns
+    for ZIP, market, date, MAO, ARV, and spread (the assignment fee); tags live in
+    a join table. :meth:`find` answers from those indexes without reading the
+    rest of the pipeline.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or DEFAULT_SQLITE_PATH
+        _ensure_directory(self.path.parent)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] < 1:
+                # spread was once stored as ARV minus MAO
+                self._connection.execute("UPDATE deals SET spread = json_extract(payload, '$.insight.assignment_fee')")
+                self._connection.execute("PRAGMA user_version = 1")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def save(self, estimate: DealEstimate, tags: Optional[Iterable[str]] = None) -> PipelineRecord:
+        record = _new_record(estimate, tags)
+        prop, insight = record.property, record.insight
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO deals (postal_code, city, state, created_at, mao, arv, spread, payload)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    prop.postal_code,
+                    prop.city,
+                    prop.state,
+                    record.created_at.isoformat(),
+                    insight.mao,
+                    insight.arv,
+                    insight.assignment_fee,
+                    record.to_json(),
+                ),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO deal_tags (tag, deal_id) VALUES (?, ?)",
+                [(tag, cursor.lastrowid) for tag in record.tags],
+            )
+        return record
+
+    def compact(self) -> None:
+        with self._lock:
+            self._connection.execute("VACUUM")
+
+    def find(
+        self,
+        postal_code: str | None = None,
+        city: str | None = None,
+        state: str | None = None,
+        tag: str | None = None,
+        min_spread: float | None = None,
+        since: date | None = None,
+        limit: int | None = None,
+        min_mao: float | None = None,
+        max_mao: float | None = None,
+        min_arv: float | None = None,
+        max_arv: float | None = None,
+    ) -> List[dict]:
+        """Saved records matching every given filter, oldest first; ``min_``/``max_`` bounds are inclusive."""
+
+        clauses: List[str] = []
+        params: List[object] = []
+        for column, value in (("postal_code", postal_code), ("city", city), ("state", state)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if tag is not None:
+            clauses.append("id IN (SELECT deal_id FROM deal_tags WHERE tag = ?)")
+            params.append(tag)
+        for clause, value in (
+            ("spread >= ?", min_spread),
+            ("mao >= ?", min_mao),
+            ("mao <= ?", max_mao),
+            ("arv >= ?", min_arv),
+            ("arv <= ?", max_arv),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since.isoformat())
+        query = "SELECT payload FROM deals"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def _iter_records(self) -> Iterator[dict]:
+        cursor = self._connection.cursor()
+        with self._lock:
+            cursor.execute("SELECT payload FROM deals ORDER BY id")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            for (payload,) in rows:
+                yield json.loads(payload)
+
+
+def open_pipeline(path: Path | None = None) -> BasePipelineStore:
+    """Open the pipeline at ``path``: SQLite for ``.db``/``.sqlite``/``.sqlite3`` files, JSON otherwise."""
+
+    if path is not None and path.suffix in SQLITE_SUFFIXES:
+        return SqlitePipelineStore(path)
+    return PipelineStore(path)
+
+
+__all__ = [
+    "DEFAULT_EXPORT_COLUMNS",
+    "EXPORT_COLUMNS",
+    "BasePipelineStore",
+    "PipelineStore",
+    "SqlitePipelineStore",
+    "open_pipeline",
+]
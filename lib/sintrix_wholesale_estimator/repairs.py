@@ -1,79 +1,143 @@
-diff --git a/sintrix_wholesale_estimator/repairs.py b/sintrix_wholesale_estimator/repairs.py
-new file mode 100644
-index 0000000000000000000000000000000000000000..79f39847d5b024a0667361d0eb25049a871defc7
---- /dev/null
-+++ b/sintrix_wholesale_estimator/repairs.py
-@@ -0,0 +1,73 @@
-+"""Repair budget modeling."""
-+from __future__ import annotations
-+
-+from typing import Dict, Iterable, List, Tuple
-+
-+from .data import MarketProfile, ZipCostProfile
-+from .models import RepairLineItem, SubjectProperty
-+
-+TRADE_DISPLAY = {
-+    "roofing": "Roofing & Structure",
-+    "hvac": "HVAC",
-+    "plumbing": "Plumbing",
-+    "electrical": "Electrical",
-+    "interior": "Interior Finish",
-+    "exterior": "Exterior & Windows",
-+    "landscaping": "Landscaping",
-+    "contingency": "Contingency",
-+}
-+
-+CONDITION_MULTIPLIERS: Dict[str, float] = {
-+    "turnkey": 0.25,
-+    "rent_ready": 0.45,
-+    "light_rehab": 0.85,
-+    "heavy_rehab": 1.25,
-+    "tear_down": 1.75,
-+}
-+
-+
-+def _quantity(subject: SubjectProperty, trade: str) -> Tuple[float, str]:
-+    if trade == "landscaping":
-+        lot = subject.lot_square_feet or subject.square_feet * 1.2
-+        return lot / 500.0, "500 sq ft lots"
-+    return subject.square_feet, "sq ft"
-+
-+
-+def build_repair_budget(
-+    subject: SubjectProperty,
-+    market: MarketProfile,
-+    zip_profile: ZipCostProfile,
-+) -> List[RepairLineItem]:
-+    multiplier = CONDITION_MULTIPLIERS.get(subject.condition, 0.85)
-+    repairs: List[RepairLineItem] = []
-+
-+    for trade_key, label in TRADE_DISPLAY.items():
-+        quantity, unit = _quantity(subject, trade_key)
-+        labor = zip_profile.labor_rates.get(trade_key, 0.0)
-+        material = zip_profile.material_rates.get(trade_key, 0.0)
-+        base_cost = (labor + material) * quantity
-+
-+        if trade_key == "contingency":
-+            base_cost += market.renovation_cost_per_sqft.get("light_rehab", 18.0) * 0.1
-+
-+        total = base_cost * multiplier
-+        repairs.append(
-+            RepairLineItem(
-+                trade=label,
-+                description=f"{label} scope tuned for {subject.condition.replace('_', ' ')}",
-+                quantity=round(quantity, 2),
-+                unit=unit,
-+                labor_rate=round(labor, 2),
-+                material_rate=round(material, 2),
-+                cost=round(total, 2),
-+            )
-+        )
-+
-+    return repairs
-+
-+
-+def sum_repair_budget(items: Iterable[RepairLineItem]) -> float:
-+    return sum(item.cost for item in items)
-+
-+
-+__all__ = ["build_repair_budget", "sum_repair_budget"]
+"""Repair budget modeling."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+from .data import MarketProfile, ZipCostProfile
+from .models import RepairLineItem, SubjectProperty
+
+TRADE_DISPLAY = {
+    "roofing": "Roofing & Structure",
+    "hvac": "HVAC",
+    "plumbing": "Plumbing",
+    "electrical": "Electrical",
+    "interior": "Interior Finish",
+    "exterior": "Exterior & Windows",
+    "landscaping": "Landscaping",
+    "contingency": "Contingency",
+}
+
+CONDITION_MULTIPLIERS: Dict[str, float] = {
+    "turnkey": 0.25,
+    "rent_ready": 0.45,
+    "light_rehab": 0.85,
+    "heavy_rehab": 1.25,
+    "tear_down": 1.75,
+}
+
+
+def _quantity(subject: SubjectProperty, trade: str) -> Tuple[float, str]:
+    if trade == "landscaping":
+        lot = subject.lot_square_feet or subject.square_feet * 1.2
+        return lot / 500.0, "500 sq ft lots"
+    return subject.square_feet, "sq ft"
+
+
+@dataclass(frozen=True)
+class RepairRateCard:
+    """Per-trade repair rates for one ZIP profile in one market, compiled once.
+
+    ``rates`` is the combined labor + material cost per unit for each trade in
+    ``TRADE_DISPLAY`` order and ``surcharges`` the flat per-trade add-on (the
+    market's contingency term), so a budget is one pass over the subject's
+    quantity vector.
+    """
+
+    trades: Tuple[str, ...]
+    labor: Tuple[float, ...]
+    material: Tuple[float, ...]
+    rates: Tuple[float, ...]
+    surcharges: Tuple[float, ...]
+
+    @classmethod
+    def compile(cls, market: MarketProfile, zip_profile: ZipCostProfile) -> "RepairRateCard":
+        trades = tuple(TRADE_DISPLAY)
+        labor = tuple(zip_profile.labor_rates.get(trade, 0.0) for trade in trades)
+        material = tuple(zip_profile.material_rates.get(trade, 0.0) for trade in trades)
+        contingency = market.renovation_cost_per_sqft.get("light_rehab", 18.0) * 0.1
+        return cls(
+            trades=trades,
+            labor=labor,
+            material=material,
+            rates=tuple(labor_rate + material_rate for labor_rate, material_rate in zip(labor, material)),
+            surcharges=tuple(contingency if trade == "contingency" else 0.0 for trade in trades),
+        )
+
+    def costs(self, subject: SubjectProperty) -> List[float]:
+        multiplier = CONDITION_MULTIPLIERS.get(subject.condition, 0.85)
+        quantities = _quantities(subject)
+        return [
+            round((rate * quantity + surcharge) * multiplier, 2)
+            for rate, quantity, surcharge in zip(self.rates, quantities, self.surcharges)
+        ]
+
+    def total(self, subject: SubjectProperty) -> float:
+        multiplier = CONDITION_MULTIPLIERS.get(subject.condition, 0.85)
+        square_feet = subject.square_feet
+        lot_units = (subject.lot_square_feet or square_feet * 1.2) / 500.0
+        total = 0
+        for trade, rate, surcharge in zip(self.trades, self.rates, self.surcharges):
+            quantity = lot_units if trade == "landscaping" else square_feet
+            total += round((rate * quantity + surcharge) * multiplier, 2)
+        return total
+
+
+_RATE_CARDS: Dict[Tuple[str, str], Tuple[MarketProfile, ZipCostProfile, RepairRateCard]] = {}
+
+
+def rate_card(market: MarketProfile, zip_profile: ZipCostProfile) -> RepairRateCard:
+    """Return the compiled rate card for ``zip_profile`` in ``market``, building it on first use."""
+
+    key = (market.name, zip_profile.postal_code)
+    cached = _RATE_CARDS.get(key)
+    if cached is None or cached[0] is not market or cached[1] is not zip_profile:
+        cached = (market, zip_profile, RepairRateCard.compile(market, zip_profile))
+        _RATE_CARDS[key] = cached
+    return cached[2]
+
+
+def repair_total(subject: SubjectProperty, market: MarketProfile, zip_profile: ZipCostProfile) -> float:
+    """Repair budget total without materializing line items.
+
+    Equal to ``sum_repair_budget(build_repair_budget(...))``; build the line
+    items only when a breakdown is actually displayed.
+    """
+
+    return rate_card(market, zip_profile).total(subject)
+
+
+def _quantities(subject: SubjectProperty) -> List[float]:
+    return [_quantity(subject, trade)[0] for trade in TRADE_DISPLAY]
+
+
+def build_repair_budget(
+    subject: SubjectProperty,
+    market: MarketProfile,
+    zip_profile: ZipCostProfile,
+) -> List[RepairLineItem]:
+    card = rate_card(market, zip_profile)
+    condition = subject.condition.replace("_", " ")
+    repairs: List[RepairLineItem] = []
+    for trade_key, labor, material, cost in zip(card.trades, card.labor, card.material, card.costs(subject)):
+        quantity, unit = _quantity(subject, trade_key)
+        label = TRADE_DISPLAY[trade_key]
+        repairs.append(
+            RepairLineItem(
+                trade=label,
+                description=f"{label} scope tuned for {condition}",
+                quantity=round(quantity, 2),
+                unit=unit,
+                labor_rate=round(labor, 2),
+                material_rate=round(material, 2),
+                cost=cost,
+            )
+        )
+    return repairs
+
+
+def sum_repair_budget(items: Iterable[RepairLineItem]) -> float:
+    return sum(item.cost for item in items)
+
+
+__all__ = ["RepairRateCard", "build_repair_budget", "rate_card", "repair_total", "sum_repair_budget"]
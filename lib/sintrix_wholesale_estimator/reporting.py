@@ -1,167 +1,240 @@
-diff --git a/sintrix_wholesale_estimator/reporting.py b/sintrix_wholesale_estimator/reporting.py
-new file mode 100644
-index 0000000000000000000000000000000000000000..3461bb6c8afc885cd83ff2d9a49b0a0158449ba9
---- /dev/null
-+++ b/sintrix_wholesale_estimator/reporting.py
-@@ -0,0 +1,161 @@
-+"""Reporting utilities for generating shareable offer packets."""
-+from __future__ import annotations
-+
-+from pathlib import Path
-+from textwrap import wrap
-+
-+from .models import DealEstimate
-+
-+PAGE_WIDTH = 612  # 8.5 * 72
-+PAGE_HEIGHT = 792  # 11 * 72
-+LEFT_MARGIN = 60
-+TOP_MARGIN = 720
-+LINE_HEIGHT = 14
-+
-+
-+def _pdf_objects(lines: list[str]) -> tuple[list[str], list[int]]:
-+    objects: list[str] = []
-+    offsets: list[int] = [0]
-+
-+    header = "%PDF-1.4\n"
-+    objects.append(header)
-+    offsets.append(len("".join(objects)))
-+
-+    catalog = "1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
-+    objects.append(catalog)
-+    offsets.append(len("".join(objects)))
-+
-+    pages = "2 0 obj << /Type /Pages /Kids [3 0 R] /Count 1 >> endobj\n"
-+    objects.append(pages)
-+    offsets.append(len("".join(objects)))
-+
-+    page = (
-+        "3 0 obj << /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
-+        "/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >> endobj\n"
-+    )
-+    objects.append(page)
-+    offsets.append(len("".join(objects)))
-+
-+    text_stream = ["BT /F1 11 Tf"]
-+    y = TOP_MARGIN
-+    for line in lines:
-+        safe = line.replace("(", "[").replace(")", "]")
-+        text_stream.append(f"1 0 0 1 {LEFT_MARGIN} {y} Tm ({safe}) Tj")
-+        y -= LINE_HEIGHT
-+        if y < 72:
-+            break
-+    text_stream.append("ET")
-+    stream_body = "\n".join(text_stream)
-+    stream = f"4 0 obj << /Length {len(stream_body)} >> stream\n{stream_body}\nendstream endobj\n"
-+    objects.append(stream)
-+    offsets.append(len("".join(objects)))
-+
-+    font = "5 0 obj << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> endobj\n"
-+    objects.append(font)
-+    offsets.append(len("".join(objects)))
-+
-+    xref_start = len("".join(objects))
-+    xref_lines = ["xref", "0 6", "0000000000 65535 f "]
-+    cursor = 0
-+    for obj in objects[1:]:
-+        xref_lines.append(f"{cursor:010} 00000 n ")
-+        cursor += len(obj)
-+    xref_lines.append("trailer << /Size 6 /Root 1 0 R >>")
-+    xref_lines.append(f"startxref\n{xref_start}\n%%EOF")
-+    objects.append("\n".join(xref_lines))
-+    return objects, offsets
-+
-+
-+def generate_pdf(estimate: DealEstimate, path: Path) -> Path:
-+    """Create a minimalist PDF summary for the estimate."""
-+
-+    lines: list[str] = [
-+        "SOURCER DEAL SNAPSHOT",
-+        "",
-+        f"Address: {estimate.property.address}, {estimate.property.city} {estimate.property.postal_code}",
-+        f"Condition: {estimate.property.condition.replace('_', ' ').title()}",
-+        "",
-+        f"ARV: ${estimate.insight.arv:,.0f}",
-+        f"MAO: ${estimate.insight.mao:,.0f}",
-+        f"Recommended Offer: ${estimate.offers[1].offer_price:,.0f}",
-+        f"Projected Profit: ${estimate.insight.projected_profit:,.0f}",
-+        "",
-+        "Repair Budget",
-+    ]
-+    for item in estimate.repairs:
-+        lines.append(
-+            f"- {item.trade}: ${item.cost:,.0f} ({item.quantity} {item.unit} @ L{item.labor_rate}/M{item.material_rate})"
-+        )
-+    lines.append("")
-+    lines.append("Offer Bands")
-+    for offer in estimate.offers:
-+        lines.append(f"- {offer.label}: ${offer.offer_price:,.0f} | {offer.rationale}")
-+    lines.append("")
-+    lines.append("Comps")
-+    for comp in estimate.comps:
-+        adj = comp.adjusted_price
-+        lines.append(
-+            f"- {comp.address} ({comp.square_feet:.0f} sf) sold {comp.sold_date:%b %Y} for ${comp.sold_price:,.0f} | adj ${adj:,.0f}"
-+        )
-+    lines.append("")
-+    lines.append("Negotiation Notes")
-+    for script in estimate.negotiation_scripts:
-+        lines.extend([f"* {script.title}", *wrap(script.body, 90), ""])  # type: ignore[arg-type]
-+    lines.append("Disclaimers")
-+    lines.extend(wrap(estimate.disclaimer, 90))
-+    lines.append("")
-+    lines.append("Citations")
-+    for key, value in estimate.citations.items():
-+        lines.append(f"- {key}: {value}")
-+
-+    objects, _ = _pdf_objects(lines)
-+    content = "".join(objects)
-+    path.write_text(content)
-+    return path
-+
-+
-+def render_text(estimate: DealEstimate) -> str:
-+    sections = [
-+        "=== SOURCER OFFER SUMMARY ===",
-+        f"Property: {estimate.property.address}, {estimate.property.city}, {estimate.property.state} {estimate.property.postal_code}",
-+        f"Condition: {estimate.property.condition}",
-+        f"ARV ${estimate.insight.arv:,.0f} | As-Is ${estimate.insight.as_is:,.0f} | MAO ${estimate.insight.mao:,.0f}",
-+        f"Projected Profit: ${estimate.insight.projected_profit:,.0f}",
-+        "",
-+        "Repair Budget:",
-+    ]
-+    for item in estimate.repairs:
-+        sections.append(
-+            f"  - {item.trade}: ${item.cost:,.0f} ({item.quantity} {item.unit}, labor {item.labor_rate}/material {item.material_rate})"
-+        )
-+    sections.append("")
-+    sections.append("Offer Bands:")
-+    for offer in estimate.offers:
-+        sections.append(f"  - {offer.label}: ${offer.offer_price:,.0f} | {offer.rationale}")
-+    sections.append("")
-+    sections.append("Comps:")
-+    for comp in estimate.comps:
-+        sections.append(
-+            f"  - {comp.address} ({comp.square_feet:.0f} sf) sold {comp.sold_date:%Y-%m-%d} for ${comp.sold_price:,.0f}, adj ${comp.adjusted_price:,.0f}"
-+        )
-+    sections.append("")
-+    sections.append("Market Trends:")
-+    for trend in estimate.market_trends:
-+        sections.append(
-+            f"  - ZIP {trend.postal_code}: {trend.median_dom} DOM, avg discount {trend.average_discount:.1%}, absorption {trend.absorption_rate:.2f} (source: {trend.source})"
-+        )
-+    sections.append("")
-+    sections.append("Negotiation Scripts:")
-+    for script in estimate.negotiation_scripts:
-+        sections.append(f"  * {script.title}: {script.body}")
-+    sections.append("")
-+    sections.append("Disclaimer:")
-+    sections.append(f"  {estimate.disclaimer}")
-+    sections.append("")
-+    sections.append("Citations:")
-+    for key, value in estimate.citations.items():
-+        sections.append(f"  - {key}: {value}")
-+    return "\n".join(sections)
-+
-+
-+__all__ = ["generate_pdf", "render_text"]
+"""Reporting utilities for generating shareable offer packets."""
+from __future__ import annotations
+
+import zlib
+from pathlib import Path
+from textwrap import wrap
+from typing import BinaryIO
+
+from .models import DealEstimate
+
+PAGE_WIDTH = 612  # 8.5 * 72
+PAGE_HEIGHT = 792  # 11 * 72
+LEFT_MARGIN = 60
+TOP_MARGIN = 720
+BOTTOM_MARGIN = 72
+LINE_HEIGHT = 14
+LINES_PER_PAGE = (TOP_MARGIN - BOTTOM_MARGIN) // LINE_HEIGHT + 1
+
+# Objects that are identical in every packet, serialized once at import.
+_PDF_HEADER = b"%PDF-1.4\n"
+_CATALOG_OBJECT = b"1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+_FONT_OBJECT = b"3 0 obj << /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >> endobj\n"
+_PAGE_BODY = (
+    b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] " % (PAGE_WIDTH, PAGE_HEIGHT)
+    + b"/Contents %d 0 R /Resources << /Font << /F1 3 0 R >> >> >>"
+)
+
+
+def _pdf_string(text: str) -> bytes:
+    encoded = text.encode("cp1252", errors="replace")
+    return b"(" + encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+class _PdfWriter:
+    """Streams PDF objects to a binary handle, tracking byte offsets as it goes."""
+
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+        self._position = 0
+        self._offsets: list[int] = []
+        self._write(_PDF_HEADER)
+
+    def _write(self, data: bytes) -> None:
+        self._handle.write(data)
+        self._position += len(data)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def add_object(self, body: bytes) -> int:
+        """Write ``body`` as the next indirect object and return its number."""
+
+        number = len(self._offsets) + 1
+        self._offsets.append(self._position)
+        self._write(b"%d 0 obj " % number + body + b" endobj\n")
+        return number
+
+    def add_serialized(self, data: bytes) -> None:
+        """Write a complete object serialized ahead of time; it must carry the next object number."""
+
+        self._offsets.append(self._position)
+        self._write(data)
+
+    def add_stream(self, content: bytes, compress: bool = False) -> int:
+        entries = b""
+        if compress:
+            content = zlib.compress(content)
+            entries = b" /Filter /FlateDecode"
+        return self.add_object(b"<< /Length %d%s >> stream\n" % (len(content), entries) + content + b"\nendstream")
+
+    def finish(self, root: int) -> None:
+        xref_start = self._position
+        size = len(self._offsets) + 1
+        lines = [b"xref", b"0 %d" % size, b"0000000000 65535 f "]
+        lines.extend(b"%010d 00000 n " % offset for offset in self._offsets)
+        lines.append(b"trailer << /Size %d /Root %d 0 R >>" % (size, root))
+        lines.append(b"startxref\n%d\n%%%%EOF\n" % xref_start)
+        self._write(b"\n".join(lines))
+
+
+def _text_stream(lines: list[str]) -> bytes:
+    commands = [b"BT /F1 11 Tf"]
+    for row, line in enumerate(lines):
+        commands.append(b"1 0 0 1 %d %d Tm %s Tj" % (LEFT_MARGIN, TOP_MARGIN - row * LINE_HEIGHT, _pdf_string(line)))
+    commands.append(b"ET")
+    return b"\n".join(commands)
+
+
+def _write_pdf(lines: list[str], handle: BinaryIO, compress: bool = False) -> None:
+    """Write ``lines`` as a PDF, starting a new page every ``LINES_PER_PAGE`` lines.
+
+    Objects 1-3 are the catalog, page tree, and shared font; each page then
+    contributes a page object followed by its content stream, Flate-compressed
+    when ``compress`` is set.
+    """
+
+    pages = [lines[start : start + LINES_PER_PAGE] for start in range(0, len(lines) or 1, LINES_PER_PAGE)]
+    kids = b" ".join(b"%d 0 R" % (4 + 2 * index) for index in range(len(pages)))
+
+    writer = _PdfWriter(handle)
+    writer.add_serialized(_CATALOG_OBJECT)
+    writer.add_object(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(pages)))
+    writer.add_serialized(_FONT_OBJECT)
+    for page_lines in pages:
+        writer.add_object(_PAGE_BODY % (len(writer) + 2))
+        writer.add_stream(_text_stream(page_lines), compress)
+    writer.finish(root=1)
+
+
+def money(value: float) -> str:
+    return f"${value:,.0f}"
+
+
+def percent(value: float) -> str:
+    return f"{value:.1%}"
+
+
+class SummaryValues:
+    """Display values shared by every summary format, formatted once per estimate.
+
+    Text, PDF, and any other renderer read currency and percentage strings
+    from here instead of re-formatting the same numbers. Callers that render
+    several formats of one estimate build this once and pass it to each; it
+    is a snapshot, so build a new one after changing the estimate.
+    """
+
+    __slots__ = ("arv", "as_is", "mao", "projected_profit", "offers", "repairs", "comps", "trends")
+
+    def __init__(self, estimate: DealEstimate) -> None:
+        insight = estimate.insight
+        self.arv = money(insight.arv)
+        self.as_is = money(insight.as_is)
+        self.mao = money(insight.mao)
+        self.projected_profit = money(insight.projected_profit)
+        self.offers = [(offer, money(offer.offer_price)) for offer in estimate.offers]
+        self.repairs = [(item, money(item.cost)) for item in estimate.repairs]
+        self.comps = [(comp, money(comp.sold_price), money(comp.adjusted_price)) for comp in estimate.comps]
+        self.trends = [(trend, percent(trend.average_discount)) for trend in estimate.market_trends]
+
+
+# Compiled line templates: positional ``{0}`` is the model object, the rest
+# are preformatted values from ``SummaryValues``.
+_PDF_HEADER_LINES = (
+    "SOURCER DEAL SNAPSHOT\n"
+    "\n"
+    "Address: {0.address}, {0.city} {0.postal_code}\n"
+    "Condition: {1}\n"
+    "\n"
+    "ARV: {2.arv}\n"
+    "MAO: {2.mao}\n"
+    "Recommended Offer: {3}\n"
+    "Projected Profit: {2.projected_profit}\n"
+    "\n"
+    "Repair Budget"
+).format
+_PDF_REPAIR = "- {0.trade}: {1} ({0.quantity} {0.unit} @ L{0.labor_rate}/M{0.material_rate})".format
+_PDF_OFFER = "- {0.label}: {1} | {0.rationale}".format
+_PDF_COMP = "- {0.address} ({0.square_feet:.0f} sf) sold {0.sold_date:%b %Y} for {1} | adj {2}".format
+
+_TEXT_HEADER = (
+    "=== SOURCER OFFER SUMMARY ===\n"
+    "Property: {0.address}, {0.city}, {0.state} {0.postal_code}\n"
+    "Condition: {0.condition}\n"
+    "ARV {1.arv} | As-Is {1.as_is} | MAO {1.mao}\n"
+    "Projected Profit: {1.projected_profit}\n"
+    "\n"
+    "Repair Budget:"
+).format
+_TEXT_REPAIR = "  - {0.trade}: {1} ({0.quantity} {0.unit}, labor {0.labor_rate}/material {0.material_rate})".format
+_TEXT_OFFER = "  - {0.label}: {1} | {0.rationale}".format
+_TEXT_COMP = "  - {0.address} ({0.square_feet:.0f} sf) sold {0.sold_date:%Y-%m-%d} for {1}, adj {2}".format
+_TEXT_TREND = (
+    "  - ZIP {0.postal_code}: {0.median_dom} DOM, avg discount {1}, "
+    "absorption {0.absorption_rate:.2f} (source: {0.source})"
+).format
+_TEXT_SCRIPT = "  * {0.title}: {0.body}".format
+_CITATION = "- {0}: {1}".format
+
+
+def _pdf_lines(estimate: DealEstimate, values: SummaryValues) -> list[str]:
+    subject = estimate.property
+    condition = subject.condition.replace("_", " ").title()
+    lines = _PDF_HEADER_LINES(subject, condition, values, values.offers[1][1]).split("\n")
+    lines.extend(_PDF_REPAIR(*entry) for entry in values.repairs)
+    lines += ["", "Offer Bands"]
+    lines.extend(_PDF_OFFER(*entry) for entry in values.offers)
+    lines += ["", "Comps"]
+    lines.extend(_PDF_COMP(*entry) for entry in values.comps)
+    lines += ["", "Negotiation Notes"]
+    for script in estimate.negotiation_scripts:
+        lines.extend([f"* {script.title}", *wrap(script.body, 90), ""])
+    lines.append("Disclaimers")
+    lines.extend(wrap(estimate.disclaimer, 90))
+    lines += ["", "Citations"]
+    lines.extend(_CITATION(key, value) for key, value in estimate.citations.items())
+    return lines
+
+
+def generate_pdf(
+    estimate: DealEstimate,
+    destination: Path | BinaryIO,
+    *,
+    compress: bool = False,
+    values: SummaryValues | None = None,
+) -> Path | BinaryIO:
+    """Create a minimalist PDF summary for the estimate.
+
+    ``destination`` is a file path or any writable binary buffer. With
+    ``compress`` the page content streams are Flate-compressed. ``values``
+    reuses display values already formatted for this estimate.
+    """
+
+    lines = _pdf_lines(estimate, values or SummaryValues(estimate))
+    if isinstance(destination, (str, Path)):
+        destination = Path(destination)
+        with destination.open("wb") as handle:
+            _write_pdf(lines, handle, compress)
+    else:
+        _write_pdf(lines, destination, compress)
+    return destination
+
+
+def render_text(estimate: DealEstimate, values: SummaryValues | None = None) -> str:
+    values = values or SummaryValues(estimate)
+    sections = [_TEXT_HEADER(estimate.property, values)]
+    sections.extend(_TEXT_REPAIR(*entry) for entry in values.repairs)
+    sections += ["", "Offer Bands:"]
+    sections.extend(_TEXT_OFFER(*entry) for entry in values.offers)
+    sections += ["", "Comps:"]
+    sections.extend(_TEXT_COMP(*entry) for entry in values.comps)
+    sections += ["", "Market Trends:"]
+    sections.extend(_TEXT_TREND(*entry) for entry in values.trends)
+    sections += ["", "Negotiation Scripts:"]
+    sections.extend(_TEXT_SCRIPT(script) for script in estimate.negotiation_scripts)
+    sections += ["", "Disclaimer:", f"  {estimate.disclaimer}", "", "Citations:"]
+    sections.extend("  " + _CITATION(key, value) for key, value in estimate.citations.items())
+    return "\n".join(sections)
+
+
+__all__ = ["SummaryValues", "generate_pdf", "money", "percent", "render_text"]
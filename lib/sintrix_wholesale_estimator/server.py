@@ -0,0 +1,203 @@
+"""Long-running JSON estimation server backed by one warm engine."""
+from __future__ import annotations
+
+import json
+import os
+import socketserver
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from .estimator import EstimationEngine, MarketNotFoundError
+from .models import DealConfig, SubjectProperty
+
+MAX_BODY_BYTES = 1 << 20
+
+_SUBJECT_TYPES: Dict[str, Tuple[type, ...]] = {
+    "address": (str,),
+    "city": (str,),
+    "state": (str,),
+    "postal_code": (str,),
+    "square_feet": (int, float),
+    "beds": (int, float),
+    "baths": (int, float),
+    "year_built": (int, type(None)),
+    "lot_square_feet": (int, float, type(None)),
+    "condition": (str,),
+    "property_type": (str,),
+    "listing_url": (str, type(None)),
+}
+_STRATEGY_TYPES: Dict[str, Tuple[type, ...]] = {
+    "factor": (int, float),
+    "assignment_fee": (int, float),
+    "fee_floor": (int, float),
+    "fee_ceiling": (int, float, type(None)),
+}
+_CONFIG_TYPES: Dict[str, Tuple[type, ...]] = {
+    "strategy": (dict,),
+    "risk_profile": (str,),
+    "repair_override": (int, float, type(None)),
+    "closing_cost_rate": (int, float, type(None)),
+    "holding_months": (int, float, type(None)),
+    "assignment_fee_override": (int, float, type(None)),
+    "include_pdf": (bool,),
+    "comp_limit": (int, type(None)),
+    "comp_radius_miles": (int, float, type(None)),
+    "comp_recency_days": (int, type(None)),
+    "insight_only": (bool,),
+}
+
+
+class RequestError(ValueError):
+    """A request the server rejects with an HTTP error status."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class EstimateHandler(BaseHTTPRequestHandler):
+    """``POST /estimate`` and ``GET /health`` over HTTP/1.1 keep-alive.
+
+    The request body is ``{"subject": {...}, "config": {...}}`` using the
+    field names of :class:`SubjectProperty` and :class:`DealConfig`
+    (``config`` is optional and PDFs are off unless ``include_pdf`` is set).
+    The response is ``{"estimate": {...}, "pdf_path": ...}``.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: "_EstimationMixin"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _reply(self, status: HTTPStatus, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._reply(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._reply(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        try:
+            if self.path != "/estimate":
+                raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown path {self.path}")
+            self._reply(HTTPStatus.OK, self.server.estimate(self._read_json()))
+        except RequestError as exc:
+            self._reply(exc.status, {"error": str(exc)})
+        except Exception as exc:  # noqa: BLE001 - keep-alive clients always get an answer
+            self.close_connection = True
+            self._reply(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Internal error: {type(exc).__name__}"})
+
+    def _read_json(self) -> Dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from None
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError as exc:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+        return payload
+
+
+def _check_types(name: str, data: Any, types: Dict[str, Tuple[type, ...]]) -> None:
+    if not isinstance(data, dict):
+        raise TypeError(f"{name} must be a JSON object")
+    for key, value in data.items():
+        expected = types.get(key)
+        if expected is None:
+            continue  # the dataclass reports unknown fields itself
+        if not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected):
+            names = " or ".join("null" if kind is type(None) else kind.__name__ for kind in expected)
+            raise TypeError(f"{name}.{key} must be {names}, got {type(value).__name__}")
+
+
+def subject_from_payload(data: Any) -> SubjectProperty:
+    """Build a :class:`SubjectProperty` from request JSON, rejecting wrongly typed fields with ``TypeError``."""
+
+    _check_types("subject", data, _SUBJECT_TYPES)
+    return SubjectProperty(**data)
+
+
+def config_from_payload(data: Any) -> DealConfig:
+    """Build a :class:`DealConfig` from request JSON; PDFs stay off unless ``include_pdf`` is set."""
+
+    _check_types("config", data, _CONFIG_TYPES)
+    _check_types("config.strategy", data.get("strategy", {}), _STRATEGY_TYPES)
+    return DealConfig.from_dict({"include_pdf": False, **data})
+
+
+class _EstimationMixin:
+    engine: EstimationEngine
+
+    def estimate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            subject = subject_from_payload(payload["subject"])
+            config = config_from_payload(payload.get("config", {}))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid estimate request: {exc}") from exc
+        try:
+            artifacts = self.engine.estimate(subject, config)
+        except MarketNotFoundError as exc:
+            raise RequestError(HTTPStatus.UNPROCESSABLE_ENTITY, str(exc)) from exc
+        return {"estimate": artifacts.estimate.to_dict(), "pdf_path": artifacts.pdf_path}
+
+
+class EstimationServer(_EstimationMixin, ThreadingHTTPServer):
+    """Threaded HTTP server on a TCP port."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], engine: EstimationEngine) -> None:
+        self.engine = engine
+        super().__init__(address, EstimateHandler)
+
+
+class UnixEstimationServer(_EstimationMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server on a Unix domain socket."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, engine: EstimationEngine) -> None:
+        self.engine = engine
+        Path(path).unlink(missing_ok=True)
+        super().__init__(os.fspath(path), _UnixEstimateHandler)
+
+
+class _UnixEstimateHandler(EstimateHandler):
+    def address_string(self) -> str:
+        return "unix"
+
+
+def make_server(
+    engine: EstimationEngine,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Path | None = None,
+) -> socketserver.BaseServer:
+    """Warm ``engine`` and bind a server to ``unix_socket`` or ``host``:``port``."""
+
+    engine.warm()
+    if unix_socket is not None:
+        return UnixEstimationServer(unix_socket, engine)
+    return EstimationServer((host, port), engine)
+
+
+__all__ = ["EstimateHandler", "EstimationServer", "UnixEstimationServer", "config_from_payload", "make_server", "subject_from_payload"]
@@ -0,0 +1,407 @@
+"""Precompiled binary snapshots of the reference tables.
+
+A snapshot stores the market, ZIP cost, and comp tables as fixed-width
+little-endian record arrays that point into a shared UTF-8 string table.
+Loading one only memory-maps the file and reads the header; records are
+decoded on lookup, so cold start does not grow with table size and forked
+workers share the mapped pages.
+
+Layout::
+
+    header   magic, version, then (offset, count) for each section
+    strings  UTF-8 bytes referenced as (offset, length)
+    pairs    (key, value) entries backing the nested rate mappings
+    markets  MarketProfile records sorted by name
+    zips     ZipCostProfile records sorted by postal code
+    pools    (market, first comp, comp count) sorted by market
+    comps    CompRecordSeed records grouped by pool
+    order    record index of each market, ZIP, and pool in source order
+
+Numbers are stored as doubles; each record carries a bit mask of the ones
+that were ints in the source tables, so they decode as ints again.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Callable, Dict, Generic, Iterator, List, Mapping, Sequence, Tuple, TypeVar
+
+from .data import (
+    CompRecordSeed,
+    MarketProfile,
+    ZipCostProfile,
+    load_comp_seeds,
+    load_market_profiles,
+    load_zip_cost_profiles,
+)
+
+MAGIC = b"SXRDSNAP"
+VERSION = 2
+SECTIONS = ("strings", "pairs", "markets", "zips", "pools", "comps", "order")
+
+_HEADER = struct.Struct("<8sI" + "QQ" * len(SECTIONS))
+_PAIR = struct.Struct("<IIdB")
+_MARKET = struct.Struct("<IId" + "II" * 3 + "5dB")
+_ZIP = struct.Struct("<II" + "II" * 2 + "3dIIB")
+_POOL = struct.Struct("<IIII")
+_COMP = struct.Struct("<IIdIIIIdddddB")
+_ORDER = struct.Struct("<I")
+
+V = TypeVar("V")
+
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a readable reference-data snapshot."""
+
+
+def _int_mask(*values: float) -> int:
+    mask = 0
+    for bit, value in enumerate(values):
+        if isinstance(value, int) and not isinstance(value, bool):
+            mask |= 1 << bit
+    return mask
+
+
+def _restore_ints(mask: int, *values: float) -> Tuple[float, ...]:
+    return tuple(int(value) if mask >> bit & 1 else value for bit, value in enumerate(values))
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.strings = bytearray()
+        self.string_refs: Dict[str, Tuple[int, int]] = {}
+        self.pairs = bytearray()
+        self.pair_count = 0
+
+    def string(self, value: str) -> Tuple[int, int]:
+        ref = self.string_refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(self.strings), len(encoded))
+            self.strings += encoded
+            self.string_refs[value] = ref
+        return ref
+
+    def mapping(self, values: Mapping[str, float]) -> Tuple[int, int]:
+        first = self.pair_count
+        for key, value in values.items():
+            self.pairs += _PAIR.pack(*self.string(key), float(value), _int_mask(value))
+            self.pair_count += 1
+        return first, len(values)
+
+
+def _sorted_by_key(items: Mapping[str, V], order: List[int]) -> List[Tuple[str, V]]:
+    """Items sorted by key bytes; appends each item's sorted index to ``order`` in source order."""
+
+    keys = list(items)
+    ranked = sorted(range(len(keys)), key=lambda position: keys[position].encode("utf-8"))
+    slots = [0] * len(keys)
+    for index, position in enumerate(ranked):
+        slots[position] = index
+    order.extend(slots)
+    return [(keys[position], items[keys[position]]) for position in ranked]
+
+
+def compile_snapshot(
+    destination: Path,
+    markets: Mapping[str, MarketProfile] | None = None,
+    zip_costs: Mapping[str, ZipCostProfile] | None = None,
+    comp_pools: Mapping[str, Sequence[CompRecordSeed]] | None = None,
+) -> Path:
+    """Write the reference tables (bundled JSON by default) to ``destination``."""
+
+    markets = load_market_profiles() if markets is None else markets
+    zip_costs = load_zip_cost_profiles() if zip_costs is None else zip_costs
+    comp_pools = load_comp_seeds() if comp_pools is None else comp_pools
+
+    writer = _Writer()
+    order: List[int] = []
+    market_records = bytearray()
+    for name, market in _sorted_by_key(markets, order):
+        market_records += _MARKET.pack(
+            *writer.string(name),
+            float(market.price_per_sqft_turnkey),
+            *writer.mapping(market.condition_adjustment),
+            *writer.mapping(market.property_type_adjustment),
+            *writer.mapping(market.renovation_cost_per_sqft),
+            float(market.closing_cost_rate),
+            float(market.holding_cost_rate),
+            float(market.wholesale_fee_rate),
+            float(market.holding_months),
+            float(market.demand_index),
+            _int_mask(
+                market.price_per_sqft_turnkey,
+                market.closing_cost_rate,
+                market.holding_cost_rate,
+                market.wholesale_fee_rate,
+                market.holding_months,
+                market.demand_index,
+            ),
+        )
+
+    zip_records = bytearray()
+    for postal_code, profile in _sorted_by_key(zip_costs, order):
+        zip_records += _ZIP.pack(
+            *writer.string(postal_code),
+            *writer.mapping(profile.labor_rates),
+            *writer.mapping(profile.material_rates),
+            float(profile.dom_days),
+            float(profile.discount_rate),
+            float(profile.absorption_rate),
+            *writer.string(profile.source),
+            _int_mask(profile.dom_days, profile.discount_rate, profile.absorption_rate),
+        )
+
+    pool_records = bytearray()
+    comp_records = bytearray()
+    comp_count = 0
+    for market_name, seeds in _sorted_by_key(comp_pools, order):
+        seeds = list(seeds)
+        pool_records += _POOL.pack(*writer.string(market_name), comp_count, len(seeds))
+        for seed in seeds:
+            comp_records += _COMP.pack(
+                *writer.string(seed.address),
+                float(seed.sold_price),
+                *writer.string(seed.postal_code),
+                *writer.string(seed.sold_date),
+                float(seed.square_feet),
+                float(seed.beds),
+                float(seed.baths),
+                float(seed.distance_miles),
+                float(seed.dom),
+                _int_mask(seed.sold_price, seed.square_feet, seed.beds, seed.baths, seed.distance_miles, seed.dom),
+            )
+        comp_count += len(seeds)
+
+    sections = [
+        (writer.strings, len(writer.strings)),
+        (writer.pairs, writer.pair_count),
+        (market_records, len(markets)),
+        (zip_records, len(zip_costs)),
+        (pool_records, len(comp_pools)),
+        (comp_records, comp_count),
+        (b"".join(_ORDER.pack(index) for index in order), len(order)),
+    ]
+    offset = _HEADER.size
+    descriptors: List[int] = []
+    for payload, count in sections:
+        descriptors.extend((offset, count))
+        offset += len(payload)
+
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with destination.open("wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, VERSION, *descriptors))
+        for payload, _ in sections:
+            handle.write(payload)
+    return destination
+
+
+class _Table(Mapping[str, V], Generic[V]):
+    """Read-only mapping over a sorted record section, decoded on lookup.
+
+    Iteration follows the source table's order; ``order_base`` is where this
+    table's entries start in the ``order`` section.
+    """
+
+    def __init__(
+        self,
+        snapshot: "Snapshot",
+        section: str,
+        record: struct.Struct,
+        decode: Callable[[tuple], V],
+        order_base: int,
+    ) -> None:
+        self._snapshot = snapshot
+        self._offset, self._count = snapshot._sections[section]
+        self._order_base = order_base
+        self._record = record
+        self._decode = decode
+        self._decoded: Dict[str, V] = {}
+
+    def _fields(self, index: int) -> tuple:
+        return self._record.unpack_from(self._snapshot._buffer, self._offset + index * self._record.size)
+
+    def _key_bytes(self, index: int) -> bytes:
+        offset, length = self._fields(index)[:2]
+        return self._snapshot._string_bytes(offset, length)
+
+    def __getitem__(self, key: str) -> V:
+        cached = self._decoded.get(key)
+        if cached is not None:
+            return cached
+        target = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_bytes(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._count or self._key_bytes(low) != target:
+            raise KeyError(key)
+        value = self._decode(self._fields(low))
+        self._decoded[key] = value
+        return value
+
+    def _source_order(self) -> Iterator[int]:
+        base = self._snapshot._sections["order"][0] + self._order_base * _ORDER.size
+        for position in range(self._count):
+            yield _ORDER.unpack_from(self._snapshot._buffer, base + position * _ORDER.size)[0]
+
+    def __iter__(self) -> Iterator[str]:
+        for index in self._source_order():
+            yield self._key_bytes(index).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class Snapshot:
+    """Memory-mapped view of a compiled reference-data snapshot."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            try:
+                self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise SnapshotError(f"{self.path} is not a reference-data snapshot") from exc
+        if len(self._buffer) < _HEADER.size:
+            raise SnapshotError(f"{self.path} is not a reference-data snapshot")
+        magic, version, *descriptors = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise SnapshotError(f"{self.path} is not a reference-data snapshot")
+        if version != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version} in {self.path}; expected {VERSION}")
+        stat = self.path.stat()
+        self.version = (str(self.path.resolve()), stat.st_mtime_ns, stat.st_size)
+        self._sections = {
+            name: (descriptors[2 * index], descriptors[2 * index + 1]) for index, name in enumerate(SECTIONS)
+        }
+        market_count, zip_count = self._sections["markets"][1], self._sections["zips"][1]
+        self.markets: Mapping[str, MarketProfile] = _Table(self, "markets", _MARKET, self._market, 0)
+        self._zips = _Table(self, "zips", _ZIP, self._zip, market_count)
+        self.zip_costs: Mapping[str, ZipCostProfile] = self._zips
+        self.comp_pools: Mapping[str, Sequence[CompRecordSeed]] = _Table(
+            self, "pools", _POOL, self._pool, market_count + zip_count
+        )
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def zip_sources(self) -> Iterator[Tuple[str, str]]:
+        """``(postal_code, source)`` for every ZIP record in source order, without decoding the rate mappings."""
+
+        for index in self._zips._source_order():
+            fields = self._zips._fields(index)
+            yield self._string(*fields[:2]), self._string(*fields[-3:-1])
+
+    def _string_bytes(self, offset: int, length: int) -> bytes:
+        start = self._sections["strings"][0] + offset
+        return self._buffer[start : start + length]
+
+    def _string(self, offset: int, length: int) -> str:
+        return self._string_bytes(offset, length).decode("utf-8")
+
+    def _mapping(self, first: int, count: int) -> Dict[str, float]:
+        base = self._sections["pairs"][0]
+        values: Dict[str, float] = {}
+        for index in range(first, first + count):
+            key_offset, key_length, value, mask = _PAIR.unpack_from(self._buffer, base + index * _PAIR.size)
+            values[self._string(key_offset, key_length)] = _restore_ints(mask, value)[0]
+        return values
+
+    def _market(self, fields: tuple) -> MarketProfile:
+        (name_offset, name_length, price, ca_first, ca_count, pt_first, pt_count, rc_first, rc_count, *rates, mask) = fields
+        price, closing, holding, wholesale, months, demand = _restore_ints(mask, price, *rates)
+        return MarketProfile(
+            name=self._string(name_offset, name_length),
+            price_per_sqft_turnkey=price,
+            condition_adjustment=self._mapping(ca_first, ca_count),
+            property_type_adjustment=self._mapping(pt_first, pt_count),
+            renovation_cost_per_sqft=self._mapping(rc_first, rc_count),
+            closing_cost_rate=closing,
+            holding_cost_rate=holding,
+            wholesale_fee_rate=wholesale,
+            holding_months=months,
+            demand_index=demand,
+        )
+
+    def _zip(self, fields: tuple) -> ZipCostProfile:
+        (
+            code_offset,
+            code_length,
+            labor_first,
+            labor_count,
+            material_first,
+            material_count,
+            dom,
+            discount,
+            absorption,
+            source_offset,
+            source_length,
+            mask,
+        ) = fields
+        dom, discount, absorption = _restore_ints(mask, dom, discount, absorption)
+        return ZipCostProfile(
+            postal_code=self._string(code_offset, code_length),
+            labor_rates=self._mapping(labor_first, labor_count),
+            material_rates=self._mapping(material_first, material_count),
+            dom_days=dom,
+            discount_rate=discount,
+            absorption_rate=absorption,
+            source=self._string(source_offset, source_length),
+        )
+
+    def _pool(self, fields: tuple) -> List[CompRecordSeed]:
+        _, _, first, count = fields
+        base = self._sections["comps"][0]
+        seeds: List[CompRecordSeed] = []
+        for index in range(first, first + count):
+            (
+                address_offset,
+                address_length,
+                sold_price,
+                postal_offset,
+                postal_length,
+                date_offset,
+                date_length,
+                square_feet,
+                beds,
+                baths,
+                distance,
+                dom,
+                mask,
+            ) = _COMP.unpack_from(self._buffer, base + index * _COMP.size)
+            sold_price, square_feet, beds, baths, distance, dom = _restore_ints(
+                mask, sold_price, square_feet, beds, baths, distance, dom
+            )
+            seeds.append(
+                CompRecordSeed(
+                    address=self._string(address_offset, address_length),
+                    postal_code=self._string(postal_offset, postal_length),
+                    sold_price=sold_price,
+                    sold_date=self._string(date_offset, date_length),
+                    square_feet=square_feet,
+                    beds=beds,
+                    baths=baths,
+                    distance_miles=distance,
+                    dom=dom,
+                )
+            )
+        return seeds
+
+
+def load_snapshot(path: Path) -> Snapshot:
+    return Snapshot(path)
+
+
+__all__ = ["Snapshot", "SnapshotError", "compile_snapshot", "load_snapshot"]
@@ -0,0 +1,277 @@
+"""CRM webhook delivery with pooled connections, retries, a durable outbox, and a dead-letter file."""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from pathlib import Path
+from typing import Callable, Deque, Iterable, Iterator, List, Tuple
+from urllib.parse import urlsplit
+
+from .models import DealEstimate
+
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class WebhookError(OSError):
+    """Raised when a webhook endpoint answers with a non-2xx status."""
+
+    def __init__(self, status: int, url: str) -> None:
+        super().__init__(f"{url} answered HTTP {status}")
+        self.status = status
+
+
+@dataclass(frozen=True)
+class DeliveryResult:
+    delivered: int
+    failed: int
+    statuses: Tuple[int, ...] = ()
+    errors: Tuple[str, ...] = ()
+    dead_lettered: int = 0
+
+
+def webhook_payload(estimate: DealEstimate) -> dict:
+    return {
+        "property": estimate.property.to_dict(),
+        "insight": estimate.insight.to_dict(),
+        "offers": [offer.to_dict() for offer in estimate.offers],
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
+def _is_permanent(error: Exception) -> bool:
+    return isinstance(error, WebhookError) and error.status not in RETRY_STATUSES
+
+
+def _claimed_by_live_process(claim: Path) -> bool:
+    """Whether ``.{outbox}.{pid}.{stamp}.sending`` belongs to a process that is still running."""
+
+    try:
+        pid = int(claim.name.rsplit(".", 3)[1])
+    except (IndexError, ValueError):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # exists but belongs to another user
+        return True
+    return True
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP(S) connections to one endpoint, reused across posts."""
+
+    def __init__(self, url: str, size: int, timeout: float) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Webhook URL must be http(s): {url!r}")
+        self._connection_class = HTTPSConnection if parts.scheme == "https" else HTTPConnection
+        self._host, self._port, self._timeout = parts.hostname, parts.port, timeout
+        self.target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._idle: "queue.LifoQueue[HTTPConnection]" = queue.LifoQueue(maxsize=size)
+
+    def post(self, body: bytes) -> int:
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._connection_class(self._host, self._port, timeout=self._timeout)
+        try:
+            connection.request("POST", self.target, body=body, headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+        except (OSError, HTTPException):
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            try:
+                self._idle.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+        return response.status
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _batches(payloads: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    batch: List[dict] = []
+    for payload in payloads:
+        batch.append(payload)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class WebhookSender:
+    """Deliver payloads to one webhook URL from a small worker pool.
+
+    Payloads are grouped ``batch_size`` per POST (a single payload is sent as
+    an object, a batch as a JSON array). Connection errors and retryable
+    statuses are retried ``retries`` times with exponential backoff starting
+    at ``backoff`` seconds. Batches that still fail are appended to
+    ``outbox`` as JSON lines and can be sent again with :meth:`redeliver`.
+    Batches rejected with a non-retryable status (most 4xx) would fail the
+    same way again, so they go to ``dead_letter`` instead (by default
+    ``<outbox stem>.dead<suffix>`` next to the outbox).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        outbox: Path | None = None,
+        dead_letter: Path | None = None,
+        workers: int = 4,
+        batch_size: int = 1,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 5.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.url = url
+        self.outbox = outbox
+        if dead_letter is None and outbox is not None:
+            dead_letter = outbox.with_name(f"{outbox.stem}.dead{outbox.suffix}")
+        self.dead_letter = dead_letter
+        self.workers = workers
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self._sleep = sleep
+        self._pool = _ConnectionPool(url, workers, timeout)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sintrix-webhook")
+        self._outbox_lock = threading.Lock()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._pool.close()
+
+    def __enter__(self) -> "WebhookSender":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _post(self, batch: List[dict]) -> int:
+        body = json.dumps(batch if self.batch_size > 1 else batch[0], default=str).encode()
+        attempt = 0
+        while True:
+            try:
+                status = self._pool.post(body)
+            except (OSError, HTTPException) as exc:
+                error: Exception = exc
+            else:
+                if 200 <= status < 300:
+                    return status
+                error = WebhookError(status, self.url)
+                if status not in RETRY_STATUSES:
+                    raise error
+            if attempt >= self.retries:
+                raise error
+            self._sleep(self.backoff * 2**attempt)
+            attempt += 1
+
+    def _store(self, batch: List[dict], path: Path | None) -> None:
+        if path is None:
+            return
+        lines = "".join(json.dumps({"url": self.url, "payload": payload}, default=str) + "\n" for payload in batch)
+        with self._outbox_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a") as handle:
+                handle.write(lines)
+
+    def send(self, payloads: Iterable[dict]) -> DeliveryResult:
+        """POST ``payloads`` concurrently and wait until each is delivered or stored in the outbox or dead letter."""
+
+        delivered = failed = dead_lettered = 0
+        statuses: List[int] = []
+        errors: List[str] = []
+        pending: Deque[Tuple[List[dict], Future]] = deque()
+
+        def settle() -> None:
+            nonlocal delivered, failed, dead_lettered
+            batch, future = pending.popleft()
+            try:
+                statuses.append(future.result())
+            except (OSError, HTTPException) as exc:
+                failed += len(batch)
+                errors.append(str(exc))
+                if _is_permanent(exc):
+                    dead_lettered += len(batch)
+                    self._store(batch, self.dead_letter)
+                else:
+                    self._store(batch, self.outbox)
+            else:
+                delivered += len(batch)
+
+        for batch in _batches(payloads, self.batch_size):
+            pending.append((batch, self._executor.submit(self._post, batch)))
+            if len(pending) >= self.workers * 2:
+                settle()
+        while pending:
+            settle()
+        return DeliveryResult(delivered, failed, tuple(statuses), tuple(errors), dead_lettered)
+
+    def redeliver(self) -> DeliveryResult:
+        """Send everything in the outbox for this URL; failures go back into the outbox.
+
+        The outbox is renamed to a ``.sending`` claim before sending. Claims
+        left behind by a process that died mid-send are picked up too, so
+        no payload is lost to a crash.
+        """
+
+        if self.outbox is None:
+            return DeliveryResult(0, 0)
+        with self._outbox_lock:
+            claims = [
+                claim
+                for claim in self.outbox.parent.glob(f".{self.outbox.name}.*.sending")
+                if not _claimed_by_live_process(claim)
+            ]
+            if self.outbox.exists():
+                claim = self.outbox.with_name(f".{self.outbox.name}.{os.getpid()}.{time.time_ns()}.sending")
+                os.replace(self.outbox, claim)
+                claims.append(claim)
+        if not claims:
+            return DeliveryResult(0, 0)
+        mine: List[dict] = []
+        others: List[str] = []
+        for claim in claims:
+            with claim.open() as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:  # torn write from an interrupted run
+                        continue
+                    if entry["url"] == self.url:
+                        mine.append(entry["payload"])
+                    else:
+                        others.append(line if line.endswith("\n") else line + "\n")
+        if others:
+            with self._outbox_lock, self.outbox.open("a") as handle:
+                handle.writelines(others)
+        result = self.send(mine)
+        for claim in claims:
+            claim.unlink(missing_ok=True)
+        return result
+
+
+__all__ = ["DeliveryResult", "WebhookError", "WebhookSender", "webhook_payload"]
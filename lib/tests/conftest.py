@@ -1,28 +1,51 @@
-diff --git a/tests/conftest.py b/tests/conftest.py
-index f0f84089cf7d09d69f0c66e17ec022060ea42089..2a855d9fdb8debae0b082088580a4c41e499e33c 100644
---- a/tests/conftest.py
-+++ b/tests/conftest.py
-@@ -1,16 +1,6 @@
-- (cd "$(git rev-parse --show-toplevel)" && git apply --3way <<'EOF' 
--diff --git a/tests/conftest.py b/tests/conftest.py
--new file mode 100644
--index 0000000000000000000000000000000000000000..2a855d9fdb8debae0b082088580a4c41e499e33c
----- /dev/null
--+++ b/tests/conftest.py
--@@ -0,0 +1,6 @@
--+import sys
--+from pathlib import Path
--+
--+ROOT = Path(__file__).resolve().parents[1]
--+if str(ROOT) not in sys.path:
--+    sys.path.insert(0, str(ROOT))
-- 
--EOF
--)
-\ No newline at end of file
-+import sys
-+from pathlib import Path
-+
-+ROOT = Path(__file__).resolve().parents[1]
-+if str(ROOT) not in sys.path:
-+    sys.path.insert(0, str(ROOT))
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from sintrix_wholesale_estimator.estimator import EstimationArtifacts, EstimationEngine
+from sintrix_wholesale_estimator.models import DealConfig, DealEstimate, SubjectProperty
+
+DEMO_SUBJECT = dict(
+    address="123 Demo St",
+    city="Austin",
+    state="TX",
+    postal_code="78704",
+    square_feet=1850,
+    beds=3,
+    baths=2,
+)
+
+
+@pytest.fixture
+def make_subject():
+    """Build the Austin 78704 demo subject; keyword arguments override its fields."""
+
+    def make(**overrides) -> SubjectProperty:
+        return SubjectProperty(**{**DEMO_SUBJECT, **overrides})
+
+    return make
+
+
+@pytest.fixture
+def subject(make_subject) -> SubjectProperty:
+    return make_subject()
+
+
+@pytest.fixture
+def make_estimate(make_subject):
+    """Estimate the demo subject with a fresh engine; PDFs are off unless ``config`` turns them on."""
+
+    def make(config: DealConfig | None = None, **overrides) -> EstimationArtifacts:
+        return EstimationEngine().estimate(make_subject(**overrides), config or DealConfig(include_pdf=False))
+
+    return make
+
+
+@pytest.fixture
+def estimate(make_estimate) -> DealEstimate:
+    return make_estimate().estimate
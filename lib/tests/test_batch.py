@@ -0,0 +1,90 @@
+import io
+import json
+
+from sintrix_wholesale_estimator.batch import read_rows, run_batch
+from sintrix_wholesale_estimator.cli import main
+from sintrix_wholesale_estimator.models import DealConfig
+
+HEADER = "address,city,state,postal_code,square_feet,beds,baths,year_built,lead_source\n"
+
+
+def write_leads(path, count):
+    rows = [f"{100 + index} Demo St,Austin,TX,78704,{1500 + index * 10},3,2,,mailer\n" for index in range(count)]
+    rows.insert(2, "9 Nowhere Rd,Nowhere,ZZ,00000,1200,2,1,,mailer\n")
+    rows.insert(4, "10 Bad Size St,Austin,TX,78704,huge,3,2,1990,mailer\n")
+    path.write_text(HEADER + "".join(rows))
+    return path
+
+
+def test_rows_stream_with_per_row_errors(tmp_path):
+    leads = write_leads(tmp_path / "leads.csv", 5)
+    output = io.StringIO()
+
+    summary = run_batch(read_rows(leads), output, DealConfig(include_pdf=False))
+
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert (summary.rows, summary.errors) == (7, 2)
+    assert [result["row"] for result in results] == list(range(1, 8))
+    assert "Nowhere" in results[2]["error"]
+    assert "huge" in results[4]["error"]
+    assert results[0]["estimate"]["property"]["square_feet"] == 1500.0
+
+
+def test_worker_pool_matches_serial_output(tmp_path):
+    leads = write_leads(tmp_path / "leads.csv", 150)
+    serial, pooled, unordered = io.StringIO(), io.StringIO(), io.StringIO()
+    config = DealConfig(include_pdf=False, insight_only=True)
+
+    run_batch(read_rows(leads), serial, config)
+    run_batch(read_rows(leads), pooled, config, workers=2)
+    run_batch(read_rows(leads), unordered, config, workers=2, ordered=False)
+
+    assert pooled.getvalue() == serial.getvalue()
+    assert sorted(unordered.getvalue().splitlines()) == sorted(serial.getvalue().splitlines())
+
+
+def test_batch_command_reads_jsonl(tmp_path, capsys):
+    lead = {
+        "address": "1 Demo St",
+        "city": "Austin",
+        "state": "TX",
+        "postal_code": "78704",
+        "square_feet": 1850,
+        "beds": 3,
+        "baths": 2,
+    }
+    leads = tmp_path / "leads.jsonl"
+    leads.write_text(json.dumps(lead) + "\n[1, 2]\n{not json\n")
+    output = tmp_path / "results.jsonl"
+
+    summary = main(["batch", "--input", str(leads), "--output", str(output), "--factor", "0.6"])
+
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert (summary.rows, summary.errors) == (3, 2)
+    assert results[0]["estimate"]["insight"]["mao"] > 0
+    assert results[1]["error"] == "Expected a JSON object"
+    assert results[2]["error"].startswith("Invalid JSON")
+    assert "3 rows (2 errors)" in capsys.readouterr().err
+
+
+def test_wrongly_typed_fields_do_not_stop_the_batch(tmp_path):
+    lead = {"address": "1 A", "city": "Austin", "state": "TX", "square_feet": 1500, "beds": 3, "baths": 2}
+    leads = tmp_path / "leads.jsonl"
+    leads.write_text(
+        json.dumps({**lead, "postal_code": 78704, "condition": 3})
+        + "\n"
+        + json.dumps({**lead, "postal_code": "78704", "city": {"name": "Austin"}})
+        + "\n"
+        + json.dumps({**lead, "postal_code": "78704"})
+        + "\n"
+    )
+
+    for workers in (1, 2):
+        output = io.StringIO()
+        summary = run_batch(read_rows(leads), output, DealConfig(include_pdf=False), workers=workers)
+
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert summary.rows == 3
+        assert results[0]["estimate"]["property"]["postal_code"] == "78704"
+        assert "city must be a string" in results[1]["error"]
+        assert results[2]["estimate"]["insight"]["mao"] > 0
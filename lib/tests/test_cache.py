@@ -0,0 +1,115 @@
+from pathlib import Path
+
+from sintrix_wholesale_estimator.cache import EstimateCache
+from sintrix_wholesale_estimator.estimator import EstimationEngine
+from sintrix_wholesale_estimator.models import DealConfig
+
+
+def test_engine_cache_hits_on_repeated_subject(make_subject):
+    cache = EstimateCache(maxsize=8)
+    engine = EstimationEngine(cache=cache)
+    config = DealConfig(include_pdf=False)
+
+    first = engine.estimate(make_subject(), config)
+    repeat = make_subject()
+    second = engine.estimate(repeat, DealConfig(include_pdf=False))
+    third = engine.estimate(make_subject(), DealConfig(include_pdf=False, repair_override=15000.0))
+
+    assert second.estimate == first.estimate
+    assert second.estimate.property is repeat
+    assert third.estimate.insight != first.estimate.insight
+    info = cache.info()
+    assert (info.hits, info.misses, info.size) == (1, 2, 2)
+
+
+def test_cache_hits_do_not_share_mutable_results(make_subject):
+    engine = EstimationEngine(cache=EstimateCache(maxsize=8))
+    config = DealConfig(include_pdf=False)
+
+    first = engine.estimate(make_subject(), config)
+    expected_mao = first.estimate.insight.mao
+    first.estimate.insight.mao = 0
+    first.estimate.offers[0].offer_price = 0
+    second = engine.estimate(make_subject(), config)
+
+    assert second.estimate is not first.estimate
+    assert second.estimate.insight.mao == expected_mao
+    assert second.estimate.offers[0].offer_price > 0
+    assert second.estimate.comps and second.estimate.comps is not first.estimate.comps
+
+
+def test_recency_filtered_estimates_are_keyed_by_date(monkeypatch, make_subject):
+    import datetime
+
+    from sintrix_wholesale_estimator import estimator
+
+    class FrozenDate(datetime.date):
+        current = datetime.date(2024, 6, 1)
+
+        @classmethod
+        def today(cls):
+            return cls.current
+
+    monkeypatch.setattr(estimator, "date", FrozenDate)
+    cache = EstimateCache(maxsize=8)
+    engine = EstimationEngine(cache=cache)
+    config = DealConfig(include_pdf=False, comp_recency_days=365)
+
+    engine.estimate(make_subject(), config)
+    engine.estimate(make_subject(), config)
+    FrozenDate.current = datetime.date(2024, 6, 2)
+    engine.estimate(make_subject(), config)
+
+    assert (cache.info().hits, len(cache)) == (1, 2)
+
+
+def test_data_version_tracks_tables_not_object_identity(tmp_path):
+    from sintrix_wholesale_estimator.snapshot import compile_snapshot
+
+    path = compile_snapshot(tmp_path / "reference.snap")
+
+    assert EstimationEngine().data_version == EstimationEngine().data_version
+    assert EstimationEngine.from_snapshot(path).data_version == EstimationEngine.from_snapshot(path).data_version
+    assert EstimationEngine(markets={}).data_version != EstimationEngine(markets={}).data_version
+    assert EstimationEngine(markets={}, data_version="v2").data_version == "v2"
+
+
+def test_cache_evicts_least_recently_used():
+    cache = EstimateCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.info().evictions == 1
+
+
+def test_cache_expires_entries_after_ttl():
+    now = [100.0]
+    cache = EstimateCache(maxsize=4, ttl=30.0, clock=lambda: now[0])
+    cache.put("lead", "estimate")
+
+    now[0] += 29.0
+    assert cache.get("lead") == "estimate"
+    now[0] += 2.0
+    assert cache.get("lead") is None
+    assert len(cache) == 0
+
+
+def test_eager_pdf_estimates_use_cache_and_still_write_packets(tmp_path, monkeypatch, make_subject):
+    monkeypatch.chdir(tmp_path)
+    cache = EstimateCache(maxsize=8)
+    engine = EstimationEngine(cache=cache)
+
+    first = engine.estimate(make_subject(), DealConfig())
+    repeat = engine.estimate(make_subject(), DealConfig())
+    other = engine.estimate(make_subject(address="9 Other St"), DealConfig())
+
+    assert (cache.info().hits, len(cache)) == (1, 2)
+    assert repeat.pdf_path == first.pdf_path
+    assert other.pdf_path != first.pdf_path
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        Path(path).name for path in (first.pdf_path, other.pdf_path)
+    )
@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from sintrix_wholesale_estimator.columnar import SubjectColumns
+from sintrix_wholesale_estimator.cache import EstimateCache
+from sintrix_wholesale_estimator.estimator import EstimationEngine, MarketNotFoundError
+from sintrix_wholesale_estimator.models import AssignmentStrategy, DealConfig, SubjectProperty
+
+LOCATIONS = [
+    ("Austin", "TX", "78704"),
+    ("Austin", "TX", "78701"),
+    ("Atlanta", "GA", "30312"),
+    ("Phoenix", "AZ", "85018"),
+    ("Tampa", "FL", "33605"),
+]
+CONDITIONS = ["turnkey", "rent_ready", "light_rehab", "heavy_rehab", "tear_down", "unknown"]
+
+
+def build_subjects(count: int):
+    rng = random.Random(7)
+    subjects = []
+    for index in range(count):
+        city, state, postal_code = rng.choice(LOCATIONS)
+        subjects.append(
+            SubjectProperty(
+                address=f"{index} Test Ave",
+                city=city,
+                state=state,
+                postal_code=postal_code,
+                square_feet=rng.randint(700, 3200),
+                beds=rng.choice([2, 3, 4, 5]),
+                baths=rng.choice([1, 1.5, 2, 2.5, 3]),
+                lot_square_feet=rng.choice([None, rng.randint(3000, 12000)]),
+                condition=rng.choice(CONDITIONS),
+            )
+        )
+    return subjects
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        DealConfig(include_pdf=False),
+        DealConfig(
+            strategy=AssignmentStrategy(factor=0.7, fee_ceiling=25000.0),
+            risk_profile="aggressive",
+            closing_cost_rate=0.04,
+            include_pdf=False,
+        ),
+        DealConfig(repair_override=42000.0, assignment_fee_override=12500.0, include_pdf=False),
+    ],
+)
+def test_columnar_insights_match_scalar_path(config):
+    engine = EstimationEngine()
+    subjects = build_subjects(200)
+
+    columns = engine.estimate_columns(SubjectColumns.from_subjects(subjects), config)
+
+    assert len(columns) == len(subjects)
+    for index, subject in enumerate(subjects):
+        assert columns.insight(index) == engine.estimate(subject, config).estimate.insight
+
+
+def test_large_groups_are_evaluated_in_bounded_chunks(monkeypatch):
+    from sintrix_wholesale_estimator import columnar
+
+    engine = EstimationEngine()
+    config = DealConfig(include_pdf=False)
+    subjects = build_subjects(120)
+    whole = engine.estimate_columns(SubjectColumns.from_subjects(subjects), config)
+
+    shapes = []
+    adjusted_prices = columnar._adjusted_prices
+
+    def recording(*args):
+        block = adjusted_prices(*args)
+        shapes.append(block.shape)
+        return block
+
+    monkeypatch.setattr(columnar, "MAX_BLOCK_CELLS", 40)
+    monkeypatch.setattr(columnar, "_adjusted_prices", recording)
+    chunked = engine.estimate_columns(SubjectColumns.from_subjects(subjects), config)
+
+    assert max(rows * comps for rows, comps in shapes) <= 40
+    assert len(shapes) > len({(subject.market_key, subject.postal_code) for subject in subjects})
+    for index, subject in enumerate(subjects):
+        assert chunked.insight(index) == whole.insight(index) == engine.estimate(subject, config).estimate.insight
+
+
+def test_unknown_markets_and_zips_leave_invalid_rows(make_subject):
+    np = pytest.importorskip("numpy")
+    engine = EstimationEngine()
+    config = DealConfig(include_pdf=False)
+    subjects = build_subjects(6)
+    subjects.insert(3, make_subject(address="1 Lost Rd", city="Nowhere", state="ZZ", postal_code="00000"))
+
+    columns = engine.estimate_columns(SubjectColumns.from_subjects(subjects), config)
+
+    assert columns.valid.tolist() == [True, True, True, False, True, True, True]
+    assert np.isnan(columns.arv[3]) and np.isnan(columns.mao[3])
+    for index, subject in enumerate(subjects):
+        if index != 3:
+            assert columns.insight(index) == engine.estimate(subject, config).estimate.insight
+
+
+@pytest.mark.parametrize(
+    "config, cached",
+    [
+        (DealConfig(include_pdf=False), False),
+        (DealConfig(include_pdf=False, insight_only=True), False),
+        (DealConfig(risk_profile="conservative", include_pdf=False, insight_only=True), True),
+    ],
+)
+def test_estimate_many_runs_groups_through_columnar_core(monkeypatch, config, cached, make_subject):
+    from sintrix_wholesale_estimator import columnar
+
+    engine = EstimationEngine(cache=EstimateCache() if cached else None)
+    subjects = build_subjects(150)
+    subjects.insert(40, make_subject(address="1 Lost Rd", city="Nowhere", state="ZZ", postal_code="00000"))
+    if cached:
+        engine.estimate(subjects[0], config)
+    blocks = []
+    insight_block = columnar.insight_block
+
+    def recording(columns, rows, *args):
+        blocks.append(len(rows))
+        return insight_block(columns, rows, *args)
+
+    monkeypatch.setattr(columnar, "insight_block", recording)
+    batch = list(engine.estimate_many(subjects, config))
+    monkeypatch.setattr(columnar, "insight_block", insight_block)
+
+    assert blocks and max(blocks) > 1
+    assert isinstance(batch.pop(40), MarketNotFoundError)
+    subjects.pop(40)
+    for subject, artifacts in zip(subjects, batch, strict=True):
+        assert artifacts.estimate.property is subject
+        assert artifacts.estimate.to_dict() == EstimationEngine().estimate(subject, config).estimate.to_dict()
+    if cached:
+        assert engine.cache.info().hits == 1
@@ -0,0 +1,79 @@
+import random
+from datetime import date
+
+from sintrix_wholesale_estimator.comps import CompIndex, CompPool, build_comps
+from sintrix_wholesale_estimator.data import CompRecordSeed
+from sintrix_wholesale_estimator.estimator import EstimationEngine
+from sintrix_wholesale_estimator.models import DealConfig
+
+
+def build_pool(count: int):
+    rng = random.Random(11)
+    return [
+        CompRecordSeed(
+            address=f"{index} Pool Rd",
+            postal_code="78704",
+            sold_price=rng.randint(250_000, 900_000),
+            sold_date=date.fromordinal(date(2023, 1, 1).toordinal() + rng.randint(0, 540)).isoformat(),
+            square_feet=rng.randint(800, 3500),
+            beds=rng.choice([2, 3, 4, 5]),
+            baths=rng.choice([1, 1.5, 2, 2.5, 3]),
+            distance_miles=round(rng.uniform(0.1, 5.0), 2),
+            dom=rng.randint(3, 120),
+        )
+        for index in range(count)
+    ]
+
+
+def test_top_k_matches_brute_force_ranking(make_subject):
+    pool = build_pool(2000)
+    index = CompIndex(pool)
+    subject = make_subject(square_feet=1730, beds=4, baths=2.5)
+
+    selected = index.select(subject, k=10, radius_miles=3.0)
+
+    eligible = [i for i in range(len(index)) if index.seeds[i].distance_miles <= 3.0]
+    expected = sorted(eligible, key=lambda i: (index._score(subject, i), i))[:10]
+    assert selected == [index.seeds[i] for i in expected]
+
+
+def test_recency_filter_uses_as_of_date(make_subject):
+    pool = build_pool(300)
+    as_of = date(2024, 6, 30)
+
+    records = build_comps(make_subject(), pool, recency_days=90, as_of=as_of)
+
+    assert records
+    assert all((as_of - record.sold_date).days <= 90 for record in records)
+
+
+def test_build_comps_without_criteria_keeps_full_pool(make_subject):
+    pool = build_pool(25)
+
+    assert [record.address for record in build_comps(make_subject(), pool)] == [seed.address for seed in pool]
+
+
+def test_engine_honours_comp_limit(make_subject):
+    engine = EstimationEngine()
+
+    artifacts = engine.estimate(make_subject(), DealConfig(include_pdf=False, comp_limit=2))
+
+    assert len(artifacts.estimate.comps) == 2
+
+
+def test_comp_pool_adjusted_prices_match_records(make_subject):
+    pool = build_pool(500)
+    for condition in ("turnkey", "light_rehab", "tear_down"):
+        subject = make_subject(square_feet=1610, beds=2, baths=1.5, condition=condition)
+
+        prices = CompPool(pool).adjusted_prices(subject)
+
+        assert prices == [record.adjusted_price for record in build_comps(subject, pool)]
+
+
+def test_seeds_carry_parsed_sale_fields():
+    seed = build_pool(1)[0]
+
+    assert seed.sold_on == date.fromisoformat(seed.sold_date)
+    assert seed.sold_ordinal == seed.sold_on.toordinal()
+    assert seed.price_per_sqft == seed.sold_price / seed.square_feet
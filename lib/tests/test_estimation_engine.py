@@ -1,57 +1,209 @@
-diff --git a/tests/test_estimation_engine.py b/tests/test_estimation_engine.py
-new file mode 100644
-index 0000000000000000000000000000000000000000..7311ceb6af37219f84c67cca870fc103d3a76a28
---- /dev/null
-+++ b/tests/test_estimation_engine.py
-@@ -0,0 +1,51 @@
-+from sintrix_wholesale_estimator.estimator import EstimationEngine, MarketNotFoundError
-+from sintrix_wholesale_estimator.models import DealConfig, SubjectProperty
-+
-+
-+def build_subject() -> SubjectProperty:
-+    return SubjectProperty(
-+        address="123 Demo St",
-+        city="Austin",
-+        state="TX",
-+        postal_code="78704",
-+        square_feet=1850,
-+        beds=3,
-+        baths=2,
-+        condition="light_rehab",
-+        property_type="single_family",
-+    )
-+
-+
-+def test_estimation_returns_complete_payload(tmp_path):
-+    engine = EstimationEngine()
-+    config = DealConfig(include_pdf=False)
-+    subject = build_subject()
-+
-+    artifacts = engine.estimate(subject, config)
-+
-+    assert artifacts.estimate.insight.arv > artifacts.estimate.insight.as_is
-+    assert len(artifacts.estimate.offers) == 3
-+    assert artifacts.estimate.repairs
-+    assert artifacts.estimate.market_trends
-+    assert artifacts.pdf_path is None
-+    assert "SOURCER OFFER SUMMARY" in artifacts.text_summary
-+
-+
-+def test_unknown_market_raises():
-+    engine = EstimationEngine()
-+    subject = SubjectProperty(
-+        address="1 Unknown",
-+        city="Nowhere",
-+        state="ZZ",
-+        postal_code="99999",
-+        square_feet=1500,
-+        beds=3,
-+        baths=2,
-+    )
-+
-+    try:
-+        engine.estimate(subject, DealConfig(include_pdf=False))
-+    except MarketNotFoundError as exc:
-+        assert "Known markets" in str(exc)
-+    else:
-+        raise AssertionError("Expected MarketNotFoundError")
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from sintrix_wholesale_estimator import data, repairs
+from sintrix_wholesale_estimator.estimator import EstimationEngine, MarketNotFoundError
+from sintrix_wholesale_estimator.models import DealConfig, SubjectProperty
+
+
+def test_estimation_returns_complete_payload(tmp_path, make_subject):
+    engine = EstimationEngine()
+    config = DealConfig(include_pdf=False)
+    subject = make_subject()
+
+    artifacts = engine.estimate(subject, config)
+
+    assert artifacts.estimate.insight.arv > artifacts.estimate.insight.as_is
+    assert len(artifacts.estimate.offers) == 3
+    assert artifacts.estimate.repairs
+    assert artifacts.estimate.market_trends
+    assert artifacts.pdf_path is None
+    assert "SOURCER OFFER SUMMARY" in artifacts.text_summary
+
+
+def test_unknown_market_raises():
+    engine = EstimationEngine()
+    subject = SubjectProperty(
+        address="1 Unknown",
+        city="Nowhere",
+        state="ZZ",
+        postal_code="99999",
+        square_feet=1500,
+        beds=3,
+        baths=2,
+    )
+
+    try:
+        engine.estimate(subject, DealConfig(include_pdf=False))
+    except MarketNotFoundError as exc:
+        assert "Known markets" in str(exc)
+    else:
+        raise AssertionError("Expected MarketNotFoundError")
+
+
+def test_estimate_many_matches_single_estimates(make_subject):
+    engine = EstimationEngine()
+    config = DealConfig(include_pdf=False)
+    subjects = [
+        make_subject(),
+        SubjectProperty(
+            address="9 Oak Ln",
+            city="Austin",
+            state="TX",
+            postal_code="78701",
+            square_feet=1420,
+            beds=3,
+            baths=1.5,
+            condition="heavy_rehab",
+        ),
+        make_subject(),
+    ]
+    unknown = make_subject(address="1 Lost Rd", city="Nowhere", state="ZZ", postal_code="00000")
+
+    batch = list(engine.estimate_many([*subjects[:2], unknown, subjects[2]], config))
+
+    assert len(batch) == len(subjects) + 1
+    assert isinstance(batch.pop(2), MarketNotFoundError)
+    for subject, artifacts in zip(subjects, batch):
+        single = engine.estimate(subject, config)
+        assert artifacts.estimate.property is subject
+        assert artifacts.estimate.insight == single.estimate.insight
+        assert artifacts.estimate.offers == single.estimate.offers
+
+
+def test_insight_only_defers_collateral(make_subject):
+    engine = EstimationEngine()
+    subject = make_subject()
+    full = engine.estimate(subject, DealConfig(include_pdf=False))
+
+    artifacts = engine.estimate(subject, DealConfig(include_pdf=False, insight_only=True))
+
+    assert artifacts.estimate.insight == full.estimate.insight
+    assert artifacts.estimate.offers == full.estimate.offers
+    assert artifacts.estimate.negotiation_scripts == []
+    assert artifacts.estimate.citations == {}
+    assert artifacts.estimate.comps == []
+    assert artifacts.estimate.repairs == []
+
+    assert artifacts.repairs == full.estimate.repairs
+    assert artifacts.text_summary == full.text_summary
+    assert artifacts.estimate.negotiation_scripts == full.estimate.negotiation_scripts
+    assert artifacts.estimate.disclaimer == full.estimate.disclaimer
+    assert artifacts.estimate.comps == full.estimate.comps
+    assert artifacts.estimate.repairs == full.estimate.repairs
+
+
+def test_insight_only_writes_pdf_on_first_access(tmp_path, monkeypatch, make_subject):
+    monkeypatch.chdir(tmp_path)
+    engine = EstimationEngine()
+
+    artifacts = engine.estimate(make_subject(), DealConfig(insight_only=True))
+
+    assert not list(tmp_path.glob("*.pdf"))
+    pdf_path = Path(artifacts.pdf_path)
+    assert pdf_path.parent == tmp_path
+    assert pdf_path.name.startswith("sourcer_offer_")
+    assert pdf_path.read_bytes().startswith(b"%PDF-1.4")
+    assert artifacts.negotiation_scripts
+
+
+def test_reference_data_is_shared_and_reloaded_on_mtime_change(tmp_path):
+    package = tmp_path / "refpkg"
+    shutil.copytree(Path(data.__file__).parent / "data", package / "data")
+    (package / "__init__.py").write_text("")
+    sys.path.insert(0, str(tmp_path))
+    try:
+        registry = data.ReferenceData("refpkg")
+        markets = registry.markets()
+        assert registry.markets() is markets
+
+        market_file = package / "data" / "market_data.json"
+        stat = market_file.stat()
+        os.utime(market_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        reloaded = registry.markets()
+        assert reloaded is not markets
+        assert reloaded == markets
+    finally:
+        sys.path.remove(str(tmp_path))
+
+
+def test_data_version_is_read_with_the_tables(tmp_path, monkeypatch):
+    from sintrix_wholesale_estimator import estimator
+
+    package = tmp_path / "versionpkg"
+    shutil.copytree(Path(data.__file__).parent / "data", package / "data")
+    (package / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(estimator, "REFERENCE_DATA", data.ReferenceData("versionpkg"))
+
+    loaded_before = EstimationEngine().warm()
+    market_file = package / "data" / "market_data.json"
+    stat = market_file.stat()
+    os.utime(market_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    loaded_after = EstimationEngine().warm()
+
+    assert loaded_before._markets is not loaded_after._markets
+    assert loaded_before.data_version[1] == stat.st_mtime_ns
+    assert loaded_before.data_version != loaded_after.data_version
+
+
+def test_engines_share_reference_tables(make_subject):
+    first = EstimationEngine()
+    second = EstimationEngine()
+    first.estimate(make_subject(), DealConfig(include_pdf=False))
+    second.estimate(make_subject(), DealConfig(include_pdf=False))
+
+    assert first._markets is second._markets
+    assert first._comp_pools is second._comp_pools
+
+
+def test_empty_mapping_is_not_replaced_by_bundled_data(make_subject):
+    engine = EstimationEngine(markets={})
+
+    try:
+        engine.estimate(make_subject(), DealConfig(include_pdf=False))
+    except MarketNotFoundError:
+        pass
+    else:
+        raise AssertionError("Expected MarketNotFoundError")
+
+
+def test_zip_fallback_index_prefers_market_zip3_then_market_default_then_any_market():
+    profiles = data.load_zip_cost_profiles()
+    markets = data.load_market_profiles()
+    index = data.ZipFallbackIndex(profiles)
+
+    assert index.resolve("78704", markets["Austin, TX"]) is profiles["78704"]
+    assert index.resolve("78745", markets["Austin, TX"]) is profiles["78704"]
+    assert index.resolve("78702", markets["Austin, TX"]) is profiles["78701"]
+    assert index.resolve("30305", markets["Atlanta, GA"]) is profiles["30312"]
+    assert index.resolve("73301", markets["Austin, TX"]) is profiles["78701"]
+    assert index.resolve("30399", markets["Austin, TX"]) is profiles["78701"]
+    assert index.resolve("78745", markets["Cleveland, OH"]) is profiles["78704"]
+    assert index.resolve("44101", markets["Cleveland, OH"]) is None
+
+
+def test_repair_rate_card_total_matches_line_items():
+    markets = data.load_market_profiles()
+    zip_costs = data.load_zip_cost_profiles()
+    for condition in ("turnkey", "light_rehab", "tear_down"):
+        subject = SubjectProperty(
+            address="1 Rate Card Way",
+            city="Austin",
+            state="TX",
+            postal_code="78701",
+            square_feet=1375,
+            beds=3,
+            baths=2,
+            lot_square_feet=6200,
+            condition=condition,
+        )
+        card = repairs.rate_card(markets["Austin, TX"], zip_costs["78701"])
+
+        items = repairs.build_repair_budget(subject, markets["Austin, TX"], zip_costs["78701"])
+
+        assert card.total(subject) == repairs.sum_repair_budget(items)
+        assert repairs.repair_total(subject, markets["Austin, TX"], zip_costs["78701"]) == card.total(subject)
+        assert repairs.rate_card(markets["Austin, TX"], zip_costs["78701"]) is card
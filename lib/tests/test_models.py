@@ -0,0 +1,39 @@
+import json
+from dataclasses import asdict
+from datetime import date
+
+from sintrix_wholesale_estimator.models import DealConfig, PipelineRecord
+
+
+def test_to_dict_matches_asdict_json(estimate):
+    record = PipelineRecord(
+        property=estimate.property, insight=estimate.insight, created_at=date(2024, 5, 1), tags=("hot",)
+    )
+    config = DealConfig(comp_limit=5)
+
+    for model in (estimate, record, config):
+        assert model.to_json(indent=2) == json.dumps(asdict(model), indent=2, default=str)
+    assert estimate.to_dict()["comps"][0]["sold_date"] == estimate.comps[0].sold_date.isoformat()
+
+
+def test_to_dict_does_not_share_mutable_state(estimate):
+    payload = estimate.to_dict()
+    index = next(index for index, comp in enumerate(estimate.comps) if comp.adjustments)
+
+    payload["citations"]["extra"] = "x"
+    payload["comps"][index]["adjustments"].clear()
+
+    assert "extra" not in estimate.citations
+    assert estimate.comps[index].adjustments
+
+
+def test_every_serializable_model_defines_to_dict():
+    from sintrix_wholesale_estimator import models
+
+    serializable = [cls for cls in vars(models).values() if isinstance(cls, type) and issubclass(cls, models._Serializable)]
+
+    assert len(serializable) > 1
+    for cls in serializable:
+        if cls is not models._Serializable:
+            assert "to_dict" in vars(cls), cls.__name__
+    assert not hasattr(models._Serializable, "to_dict")
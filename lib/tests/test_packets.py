@@ -0,0 +1,49 @@
+import zipfile
+
+import pytest
+
+from sintrix_wholesale_estimator.packets import generate_packet_archive, generate_packets, write_packet
+
+
+@pytest.fixture
+def build_estimates(make_estimate):
+    def build(count: int):
+        return (
+            make_estimate(address=f"{100 + index} Demo St", square_feet=1500 + 50 * index).estimate
+            for index in range(count)
+        )
+
+    return build
+
+
+def test_distinct_estimates_get_distinct_content_addressed_paths(tmp_path, build_estimates):
+    estimates = list(build_estimates(3))
+
+    paths = list(generate_packets(estimates, tmp_path, workers=1))
+
+    assert len(set(paths)) == 3
+    assert all(path.parent == tmp_path and path.read_bytes().startswith(b"%PDF") for path in paths)
+    assert write_packet(estimates[0], tmp_path) == paths[0]
+
+
+def test_process_pool_matches_in_process_rendering(tmp_path, build_estimates):
+    serial = list(generate_packets(build_estimates(4), tmp_path / "serial", workers=1))
+    pooled = list(generate_packets(build_estimates(4), tmp_path / "pooled", workers=2, window=2))
+
+    assert [path.name for path in pooled] == [path.name for path in serial]
+    assert [path.read_bytes() for path in pooled] == [path.read_bytes() for path in serial]
+
+
+def test_template_names_and_archive(tmp_path, build_estimates):
+    archive = generate_packet_archive(
+        build_estimates(2), tmp_path / "out" / "packets.zip", template="{index:03d}_{slug}.pdf", workers=1
+    )
+
+    with zipfile.ZipFile(archive) as bundle:
+        assert bundle.namelist() == ["000_100-demo-st.pdf", "001_101-demo-st.pdf"]
+        assert bundle.read("000_100-demo-st.pdf").startswith(b"%PDF")
+
+
+def test_template_must_name_a_file(tmp_path, build_estimates):
+    with pytest.raises(ValueError):
+        list(generate_packets(build_estimates(1), tmp_path, template="../{digest}.pdf", workers=1))
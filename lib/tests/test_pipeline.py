@@ -1,70 +1,170 @@
-diff --git a/tests/test_pipeline.py b/tests/test_pipeline.py
-new file mode 100644
-index 0000000000000000000000000000000000000000..26be2512c9b7710c70be5ecf023f10ba2fda2bde
---- /dev/null
-+++ b/tests/test_pipeline.py
-@@ -0,0 +1,64 @@
-+from pathlib import Path
-+
-+from sintrix_wholesale_estimator.estimator import EstimationEngine
-+from sintrix_wholesale_estimator.models import DealConfig, SubjectProperty
-+from sintrix_wholesale_estimator.pipeline import PipelineStore
-+
-+
-+def build_estimate(include_pdf: bool = False):
-+    engine = EstimationEngine()
-+    subject = SubjectProperty(
-+        address="123 Demo St",
-+        city="Austin",
-+        state="TX",
-+        postal_code="78704",
-+        square_feet=1850,
-+        beds=3,
-+        baths=2,
-+    )
-+    config = DealConfig(include_pdf=include_pdf)
-+    return engine.estimate(subject, config)
-+
-+
-+def test_pipeline_save_and_export(tmp_path):
-+    artifacts = build_estimate()
-+    path = tmp_path / "pipeline.json"
-+    store = PipelineStore(path)
-+
-+    record = store.save(artifacts.estimate, tags=["test", "austin"])
-+    assert path.exists()
-+
-+    export_path = tmp_path / "export.csv"
-+    result = store.export_csv(export_path)
-+    assert result.exists()
-+    content = result.read_text()
-+    assert "property_address" in content
-+
-+
-+def test_webhook_payload_serialization(tmp_path, monkeypatch):
-+    artifacts = build_estimate()
-+    path = tmp_path / "pipeline.json"
-+    store = PipelineStore(path)
-+
-+    class DummyResponse:
-+        def __init__(self):
-+            self.code = 202
-+
-+        def getcode(self):
-+            return self.code
-+
-+        def __enter__(self):
-+            return self
-+
-+        def __exit__(self, *args):
-+            return False
-+
-+    def fake_urlopen(req, timeout=5.0):
-+        headers = dict(req.header_items())
-+        assert headers.get("Content-type") == "application/json"
-+        assert req.data
-+        return DummyResponse()
-+
-+    monkeypatch.setattr("sintrix_wholesale_estimator.pipeline.request.urlopen", fake_urlopen)
-+    status = store.send_webhook(artifacts.estimate, "https://example.com/webhook")
-+    assert status == 202
+import csv
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from sintrix_wholesale_estimator.pipeline import BasePipelineStore, PipelineStore, SqlitePipelineStore, open_pipeline
+
+
+def test_pipeline_save_and_export(tmp_path, make_estimate):
+    artifacts = make_estimate()
+    path = tmp_path / "pipeline.json"
+    store = PipelineStore(path)
+
+    record = store.save(artifacts.estimate, tags=["test", "austin"])
+    assert path.exists()
+
+    export_path = tmp_path / "export.csv"
+    result = store.export_csv(export_path)
+    assert result.exists()
+    content = result.read_text()
+    assert "property_address" in content
+
+
+def test_webhook_payload_serialization(tmp_path, monkeypatch, make_estimate):
+    artifacts = make_estimate()
+    path = tmp_path / "pipeline.json"
+    store = PipelineStore(path)
+
+    class DummyResponse:
+        def __init__(self):
+            self.code = 202
+
+        def getcode(self):
+            return self.code
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    def fake_urlopen(req, timeout=5.0):
+        headers = dict(req.header_items())
+        assert headers.get("Content-type") == "application/json"
+        assert req.data
+        return DummyResponse()
+
+    monkeypatch.setattr("sintrix_wholesale_estimator.pipeline.request.urlopen", fake_urlopen)
+    status = store.send_webhook(artifacts.estimate, "https://example.com/webhook")
+    assert status == 202
+
+
+def test_save_appends_to_journal_and_compacts(tmp_path, estimate):
+    path = tmp_path / "pipeline.json"
+    store = PipelineStore(path, compact_every=3)
+
+    store.save(estimate, tags=["a"])
+    store.save(estimate, tags=["b"])
+    assert json.loads(path.read_text()) == {"seq": 0, "records": []}
+    assert len(store.journal_path.read_text().splitlines()) == 2
+
+    store.save(estimate, tags=["c"])
+    assert not store.journal_path.exists()
+    store.save(estimate, tags=["d"])
+
+    reopened = PipelineStore(path, compact_every=3)
+    assert [row["tags"] for row in reopened._load()] == [["a"], ["b"], ["c"], ["d"]]
+
+
+def test_journal_survives_torn_write_and_interrupted_compaction(tmp_path, estimate):
+    path = tmp_path / "pipeline.json"
+    path.write_text(json.dumps([{"legacy": True}]))
+    store = PipelineStore(path)
+    store.save(estimate, tags=["first"])
+
+    journal = store.journal_path.read_bytes()
+    with store.journal_path.open("ab") as handle:
+        handle.write(b'{"seq": 2, "record": {"tru')
+    PipelineStore(path).save(estimate, tags=["second"])
+
+    # crash after the compacted file replaced the old one but before the journal was removed
+    store = PipelineStore(path)
+    store.compact()
+    store.journal_path.write_bytes(journal)
+
+    rows = PipelineStore(path)._load()
+    assert rows[0] == {"legacy": True}
+    assert [row["tags"] for row in rows[1:]] == [["first"], ["second"]]
+
+
+def test_sqlite_store_finds_by_indexed_columns(tmp_path, estimate):
+    spread = estimate.insight.assignment_fee
+    mao, arv = estimate.insight.mao, estimate.insight.arv
+
+    with SqlitePipelineStore(tmp_path / "pipeline.sqlite3") as store:
+        store.save(estimate, tags=["austin", "hot"])
+        store.save(estimate, tags=["austin"])
+
+        assert len(store.find(postal_code="78704")) == 2
+        assert store.find(postal_code="10001") == []
+        assert [row["tags"] for row in store.find(tag="hot")] == [["austin", "hot"]]
+        assert len(store.find(city="Austin", state="TX", min_spread=spread)) == 2
+        assert store.find(min_spread=spread + 1) == []
+        assert len(store.find(limit=1)) == 1
+        assert len(store.find(min_mao=mao, max_mao=mao, min_arv=arv, max_arv=arv)) == 2
+        assert store.find(min_mao=mao + 1) == store.find(max_arv=arv - 1) == []
+
+        export = store.export_csv(tmp_path / "export.csv")
+        assert len(export.read_text().splitlines()) == 3
+        plan = store._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT payload FROM deals WHERE postal_code = ?", ("78704",)
+        ).fetchall()
+        assert "deals_postal_code" in str(plan)
+        for column in ("mao", "arv"):
+            plan = store._connection.execute(
+                f"EXPLAIN QUERY PLAN SELECT payload FROM deals WHERE {column} >= ? AND {column} <= ?", (0, 1)
+            ).fetchall()
+            assert f"deals_{column}" in str(plan)
+
+    with open_pipeline(tmp_path / "deals.db") as sqlite_store, open_pipeline(tmp_path / "deals.json") as json_store:
+        assert isinstance(sqlite_store, SqlitePipelineStore) and not isinstance(sqlite_store, PipelineStore)
+        assert not hasattr(sqlite_store, "journal_path")
+        assert type(json_store) is PipelineStore
+        assert isinstance(sqlite_store, BasePipelineStore) and isinstance(json_store, BasePipelineStore)
+
+
+def test_sqlite_store_migrates_spread_to_the_assignment_fee(tmp_path, estimate):
+    path = tmp_path / "pipeline.sqlite3"
+    with SqlitePipelineStore(path) as store:
+        store.save(estimate)
+        with store._connection:
+            store._connection.execute("UPDATE deals SET spread = arv - mao")
+            store._connection.execute("PRAGMA user_version = 0")
+
+    with SqlitePipelineStore(path) as store:
+        assert len(store.find(min_spread=estimate.insight.assignment_fee)) == 1
+        assert store.find(min_spread=estimate.insight.assignment_fee + 1) == []
+
+
+def test_cli_closes_the_sqlite_pipeline(tmp_path, monkeypatch):
+    from sintrix_wholesale_estimator.cli import run
+
+    closed = []
+    close = SqlitePipelineStore.close
+    monkeypatch.setattr(SqlitePipelineStore, "close", lambda store: closed.append(close(store)))
+    path = tmp_path / "deals.db"
+
+    run(["1 Demo St", "Austin", "TX", "78704", "1850", "3", "2", "--no-pdf", "--save", "--pipeline-path", str(path)])
+
+    assert len(closed) == 1
+    with SqlitePipelineStore(path) as store:
+        assert len(store.find(postal_code="78704")) == 1
+
+
+def test_export_streams_selected_columns_with_filter_and_gzip(tmp_path, estimate):
+    store = PipelineStore(tmp_path / "pipeline.json", compact_every=2)
+    for tags in (["hot"], ["cold"], ["hot", "austin"]):
+        store.save(estimate, tags=tags)
+    assert store.path.read_text().count("\n") == 4  # header, two records, footer
+
+    export = store.export_csv(
+        tmp_path / "hot.csv.gz", columns=["postal_code", "tags"], where=lambda row: "hot" in row["tags"]
+    )
+    with gzip.open(export, "rt", newline="") as handle:
+        assert list(csv.reader(handle)) == [["postal_code", "tags"], ["78704", "hot"], ["78704", "hot;austin"]]
+
+    with pytest.raises(ValueError):
+        store.export_csv(tmp_path / "bad.csv", columns=["nope"])
@@ -0,0 +1,91 @@
+import io
+import re
+import time
+import zlib
+from dataclasses import replace
+
+from sintrix_wholesale_estimator.models import DealConfig
+from sintrix_wholesale_estimator.reporting import SummaryValues, generate_pdf, money, render_text
+
+
+def xref_offsets(pdf: bytes) -> list[int]:
+    start = int(re.search(rb"startxref\n(\d+)", pdf).group(1))
+    assert pdf[start:].startswith(b"xref")
+    return [int(offset) for offset in re.findall(rb"(\d{10}) 00000 n ", pdf[start:])]
+
+
+def test_xref_offsets_point_at_objects(estimate):
+    buffer = io.BytesIO()
+    generate_pdf(estimate, buffer)
+    pdf = buffer.getvalue()
+
+    offsets = xref_offsets(pdf)
+    assert offsets
+    for number, offset in enumerate(offsets, start=1):
+        assert pdf[offset:].startswith(b"%d 0 obj" % number)
+
+
+def test_stream_length_counts_bytes_for_non_ascii_text(tmp_path, make_estimate):
+    path = generate_pdf(make_estimate(address="12 Café (Rear) Ln").estimate, tmp_path / "packet.pdf")
+    pdf = path.read_bytes()
+
+    assert b"Caf\xe9 \\(Rear\\) Ln" in pdf
+    for match in re.finditer(rb"<< /Length (\d+) >> stream\n", pdf):
+        length = int(match.group(1))
+        assert pdf[match.end() + length :].startswith(b"\nendstream")
+    for number, offset in enumerate(xref_offsets(pdf), start=1):
+        assert pdf[offset:].startswith(b"%d 0 obj" % number)
+
+
+def test_long_comp_appendix_is_paginated_not_truncated(estimate):
+    appendix = replace(estimate, comps=[comp for comp in estimate.comps for _ in range(500 // len(estimate.comps) + 1)])
+    buffer = io.BytesIO()
+
+    started = time.perf_counter()
+    generate_pdf(appendix, buffer)
+    elapsed = time.perf_counter() - started
+    pdf = buffer.getvalue()
+
+    page_count = int(re.search(rb"/Count (\d+)", pdf).group(1))
+    assert page_count > 1
+    assert pdf.count(b"/Type /Page ") == page_count
+    assert pdf.count(b"/BaseFont /Helvetica") == 1
+    assert pdf.count(b"sold ") == len(appendix.comps)
+    assert b"Citations" in pdf
+    assert elapsed < 0.5
+
+
+def test_compressed_streams_inflate_to_the_plain_content(estimate):
+    plain, packed = io.BytesIO(), io.BytesIO()
+    generate_pdf(estimate, plain)
+    generate_pdf(estimate, packed, compress=True)
+
+    def streams(pdf: bytes, compressed: bool) -> list[bytes]:
+        marker = rb"<< /Length (\d+) /Filter /FlateDecode >> stream\n" if compressed else rb"<< /Length (\d+) >> stream\n"
+        found = []
+        for match in re.finditer(marker, pdf):
+            body = pdf[match.end() : match.end() + int(match.group(1))]
+            found.append(zlib.decompress(body) if compressed else body)
+        return found
+
+    assert len(packed.getvalue()) < len(plain.getvalue())
+    assert streams(packed.getvalue(), True) == streams(plain.getvalue(), False)
+    for number, offset in enumerate(xref_offsets(packed.getvalue()), start=1):
+        assert packed.getvalue()[offset:].startswith(b"%d 0 obj" % number)
+
+
+def test_summary_values_follow_estimate_edits_and_are_shared_by_artifacts(tmp_path, monkeypatch, estimate, make_estimate):
+    values = SummaryValues(estimate)
+
+    assert values.arv == money(estimate.insight.arv)
+    assert render_text(estimate, values) == render_text(estimate)
+    estimate.insight = replace(estimate.insight, arv=123456.0, mao=65432.0)
+    assert "ARV $123,456 |" in render_text(estimate)
+    assert "MAO $65,432" in render_text(estimate)
+
+    monkeypatch.chdir(tmp_path)
+    artifacts = make_estimate(DealConfig(insight_only=True))
+    artifacts.text_summary
+    shared = artifacts._summary_values
+    assert artifacts.pdf_path and artifacts._summary_values is shared
+    assert len(shared.comps) == len(artifacts.estimate.comps) > 0
@@ -0,0 +1,112 @@
+import json
+import threading
+from http.client import HTTPConnection
+
+import pytest
+
+from sintrix_wholesale_estimator.estimator import EstimationEngine
+from sintrix_wholesale_estimator.models import DealConfig, SubjectProperty
+from sintrix_wholesale_estimator.server import make_server
+
+SUBJECT = {
+    "address": "123 Demo St",
+    "city": "Austin",
+    "state": "TX",
+    "postal_code": "78704",
+    "square_feet": 1850,
+    "beds": 3,
+    "baths": 2,
+}
+
+
+@pytest.fixture
+def server():
+    server = make_server(EstimationEngine(), port=0)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post(connection, payload):
+    connection.request("POST", "/estimate", body=json.dumps(payload), headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_estimate_matches_engine_over_keep_alive(server):
+    connection = HTTPConnection(*server.server_address)
+    expected = EstimationEngine().estimate(SubjectProperty(**SUBJECT), DealConfig(include_pdf=False)).estimate
+
+    for _ in range(3):
+        status, body = post(connection, {"subject": SUBJECT, "config": {"strategy": {"factor": 0.65}}})
+        assert status == 200
+        assert body["estimate"] == json.loads(expected.to_json())
+        assert body["pdf_path"] is None
+    connection.close()
+
+
+def test_concurrent_requests(server):
+    statuses = []
+
+    def worker():
+        connection = HTTPConnection(*server.server_address)
+        for _ in range(5):
+            statuses.append(post(connection, {"subject": SUBJECT})[0])
+        connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert statuses == [200] * 20
+
+
+def test_errors_are_json(server):
+    connection = HTTPConnection(*server.server_address)
+
+    assert post(connection, {"subject": {**SUBJECT, "city": "Nowhere"}})[0] == 422
+    status, body = post(connection, {"subject": {"address": "1 Main"}})
+    assert status == 400 and "Invalid estimate request" in body["error"]
+    connection.request("POST", "/estimate", body=b"not json")
+    response = connection.getresponse()
+    assert response.status == 400 and json.loads(response.read())["error"].startswith("Invalid JSON")
+    connection.request("GET", "/health")
+    assert json.loads(connection.getresponse().read()) == {"status": "ok"}
+    connection.close()
+
+
+def test_bad_field_types_and_internal_errors_still_reply(server, monkeypatch):
+    connection = HTTPConnection(*server.server_address)
+
+    for field, value in (("square_feet", "1500"), ("postal_code", 78704), ("condition", 3)):
+        status, body = post(connection, {"subject": {**SUBJECT, field: value}})
+        assert status == 400 and f"subject.{field}" in body["error"]
+    for field, value in (
+        ("risk_profile", 5),
+        ("repair_override", "x"),
+        ("holding_months", "3"),
+        ("comp_limit", "2"),
+        ("include_pdf", 1),
+        ("strategy", {"factor": True}),
+    ):
+        status, body = post(connection, {"subject": SUBJECT, "config": {field: value}})
+        assert status == 400 and f"config.{field}" in body["error"]
+
+    def explode(subject, config):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server.engine, "estimate", explode)
+    status, body = post(connection, {"subject": SUBJECT})
+    assert status == 500 and body == {"error": "Internal error: RuntimeError"}
+    connection.close()
+
+    connection = HTTPConnection(*server.server_address)
+    connection.putrequest("POST", "/estimate")
+    connection.putheader("Content-Length", "lots")
+    connection.endheaders()
+    response = connection.getresponse()
+    assert response.status == 400 and json.loads(response.read()) == {"error": "Invalid Content-Length"}
+    connection.close()
@@ -0,0 +1,65 @@
+import pytest
+
+from sintrix_wholesale_estimator.cli import main
+from sintrix_wholesale_estimator.data import load_comp_seeds, load_market_profiles, load_zip_cost_profiles
+from sintrix_wholesale_estimator.estimator import EstimationEngine
+from sintrix_wholesale_estimator.models import DealConfig
+from sintrix_wholesale_estimator.snapshot import SnapshotError, compile_snapshot, load_snapshot
+
+
+def test_snapshot_round_trips_reference_tables(tmp_path):
+    path = compile_snapshot(tmp_path / "reference.snap")
+
+    with load_snapshot(path) as snapshot:
+        assert list(snapshot.markets.items()) == list(load_market_profiles().items())
+        assert list(snapshot.zip_costs.items()) == list(load_zip_cost_profiles().items())
+        assert [(market, list(seeds)) for market, seeds in load_comp_seeds().items()] == list(snapshot.comp_pools.items())
+        zip_profile = snapshot.zip_costs["78704"]
+        seed = snapshot.comp_pools["Austin, TX"][0]
+        assert type(zip_profile.dom_days) is int and type(zip_profile.discount_rate) is float
+        assert (type(seed.square_feet), type(seed.beds), type(seed.dom), type(seed.distance_miles)) == (int, int, int, float)
+        assert "Nowhere, ZZ" not in snapshot.markets
+
+
+def test_snapshot_engine_matches_json_engine(tmp_path, subject):
+    path = compile_snapshot(tmp_path / "reference.snap")
+    config = DealConfig(include_pdf=False)
+
+    from_snapshot = EstimationEngine.from_snapshot(path).estimate(subject, config)
+    from_json = EstimationEngine().estimate(subject, config)
+
+    assert from_snapshot.estimate.insight == from_json.estimate.insight
+    assert from_snapshot.estimate.offers == from_json.estimate.offers
+    assert from_snapshot.text_summary == from_json.text_summary
+    assert from_snapshot.estimate.to_json() == from_json.estimate.to_json()
+
+
+def test_load_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / "market_data.json"
+    path.write_text('{"Austin, TX": {}}' * 10)
+
+    with pytest.raises(SnapshotError):
+        load_snapshot(path)
+
+
+def test_cli_compile_data(tmp_path, capsys):
+    destination = main(["compile-data", str(tmp_path / "reference.snap")])
+
+    assert destination.exists()
+    assert "Snapshot written" in capsys.readouterr().out
+
+
+def test_snapshot_zip_fallbacks_read_only_codes_and_sources(tmp_path):
+    path = compile_snapshot(tmp_path / "reference.snap")
+    markets = load_market_profiles()
+
+    with load_snapshot(path) as snapshot:
+        assert list(snapshot.zip_sources()) == [(code, profile.source) for code, profile in load_zip_cost_profiles().items()]
+        engine = EstimationEngine.from_snapshot(path)
+        index = engine._zip_index
+
+        assert index.resolve("78704", markets["Austin, TX"]).postal_code == "78704"
+        assert index._zip3 is None and engine._zip_costs._decoded.keys() == {"78704"}
+        assert index.resolve("78702", markets["Austin, TX"]).postal_code == "78701"
+        assert index.resolve("73301", markets["Austin, TX"]).postal_code == "78701"
+        assert engine._zip_costs._decoded.keys() == {"78701", "78704"}
@@ -0,0 +1,130 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sintrix_wholesale_estimator.webhooks import WebhookSender
+
+
+class StandIn:
+    """Local webhook endpoint that records bodies and can fail the first N requests."""
+
+    def __init__(self, failures: int = 0, status: int = 503):
+        self.bodies = []
+        self.clients = set()
+        self.failures = failures
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                stand_in.clients.add(self.client_address)
+                if stand_in.failures:
+                    stand_in.failures -= 1
+                    code = status
+                else:
+                    stand_in.bodies.append(json.loads(body))
+                    code = 202
+                self.send_response(code)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/hook"
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    servers = []
+
+    def start(**options):
+        server = StandIn(**options)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+def test_batches_reuse_keep_alive_connections(stand_in):
+    server = stand_in()
+    with WebhookSender(server.url, workers=1, batch_size=2) as sender:
+        result = sender.send({"deal": index} for index in range(5))
+
+    assert (result.delivered, result.failed) == (5, 0)
+    assert result.statuses == (202, 202, 202)
+    assert server.bodies == [[{"deal": 0}, {"deal": 1}], [{"deal": 2}, {"deal": 3}], [{"deal": 4}]]
+    assert len(server.clients) == 1
+
+
+def test_retries_with_exponential_backoff(stand_in):
+    server = stand_in(failures=2)
+    delays = []
+    with WebhookSender(server.url, retries=3, backoff=0.1, sleep=delays.append) as sender:
+        result = sender.send([{"deal": 1}])
+
+    assert result.delivered == 1
+    assert delays == [0.1, 0.2]
+    assert server.bodies == [{"deal": 1}]
+
+
+def test_undelivered_payloads_go_to_outbox_and_redeliver(stand_in, tmp_path):
+    outbox = tmp_path / "outbox.jsonl"
+    server = stand_in(failures=10, status=500)
+    with WebhookSender(server.url, outbox=outbox, retries=1, sleep=lambda _: None) as sender:
+        result = sender.send([{"deal": 1}, {"deal": 2}])
+    assert (result.delivered, result.failed) == (0, 2)
+    assert len(outbox.read_text().splitlines()) == 2
+
+    server.failures = 0
+    with WebhookSender(server.url, outbox=outbox) as sender:
+        assert sender.redeliver().delivered == 2
+    assert sorted(body["deal"] for body in server.bodies) == [1, 2]
+    assert not outbox.exists()
+
+
+def test_client_errors_are_not_retried_and_go_to_dead_letter(stand_in, tmp_path):
+    server = stand_in(failures=1, status=400)
+    outbox = tmp_path / "outbox.jsonl"
+    delays = []
+    with WebhookSender(server.url, outbox=outbox, sleep=delays.append) as sender:
+        result = sender.send([{"deal": 1}])
+
+    assert result.failed == result.dead_lettered == 1 and delays == []
+    assert "HTTP 400" in result.errors[0]
+    assert not outbox.exists()
+    assert json.loads((tmp_path / "outbox.dead.jsonl").read_text())["payload"] == {"deal": 1}
+
+
+def test_redeliver_recovers_claims_left_by_a_crashed_run(stand_in, tmp_path):
+    server = stand_in()
+    outbox = tmp_path / "outbox.jsonl"
+    finished = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    dead_pid = int(finished.stdout)
+    crashed = tmp_path / f".outbox.jsonl.{dead_pid}.1.sending"
+    crashed.write_text(json.dumps({"url": server.url, "payload": {"deal": 1}}) + "\n")
+    in_flight = tmp_path / f".outbox.jsonl.{os.getpid()}.2.sending"
+    in_flight.write_text(json.dumps({"url": server.url, "payload": {"deal": 3}}) + "\n")
+    outbox.write_text(json.dumps({"url": server.url, "payload": {"deal": 2}}) + "\n")
+
+    with WebhookSender(server.url, outbox=outbox) as sender:
+        assert sender.redeliver().delivered == 2
+
+    assert sorted(body["deal"] for body in server.bodies) == [1, 2]
+    assert not crashed.exists() and not outbox.exists()
+    assert in_flight.exists()